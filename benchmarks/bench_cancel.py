@@ -0,0 +1,150 @@
+"""Time from cancelling a read to its engine work being stopped, before and after cancellation tokens.
+
+Usage: python benchmarks/bench_cancel.py [--chunk-seconds 3] [--cancel-after 0.3] [--max-seconds 0.5]
+
+Each engine is cancelled while its chunks are in flight:
+
+- subprocess: one child process per chunk, like espeak-ng -w or text2wave
+- in-process: the Fake engine, which sleeps in the calling thread
+- gTTS: the HTTP client against the local stub endpoint
+
+"flag only" is the old behaviour, where cancelling only stopped new chunks
+from being started: the work in flight ran to the end. "token" passes a
+CancelToken into the engines. Freed means the synthesis call has returned,
+no engine child process is left and, for gTTS, no connection is waiting
+on a request.
+The run exits 1 if any engine takes longer than --max-seconds with a token.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import threading
+import time
+from typing import Callable, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fake_engine  # noqa: E402
+from gtts_stub import StubServer  # noqa: E402
+from tts_engines.base import TTSEngine  # noqa: E402
+from tts_engines.cancel import CancelToken, SynthesisCancelled, run_process  # noqa: E402
+from tts_engines.engine_gtts import GTTSEngine  # noqa: E402
+from tts_engines.gtts_client import GTTSClient  # noqa: E402
+from tts_engines.pipeline import synthesize_parallel  # noqa: E402
+
+TEXT = " ".join(f"Sentence {i} of the text that is being cancelled, long enough to be a chunk of its own." for i in range(12))
+CHILD = (
+    "import sys, time, wave\n"
+    "time.sleep(float(sys.argv[1]))\n"
+    "with wave.open(sys.argv[2], 'wb') as wf:\n"
+    "    wf.setnchannels(1); wf.setsampwidth(2); wf.setframerate(16000); wf.writeframes(bytes(3200))\n"
+)
+
+
+class SubprocessEngine(TTSEngine):
+    """One child process per chunk, standing in for espeak-ng / text2wave."""
+
+    def __init__(self, seconds: float) -> None:
+        super().__init__(name="Subprocess", output_ext="wav", parallel_safe=True, max_parallel=4)
+        self.seconds = seconds
+
+    def synthesize(self, text: str, output_path: str, cancel: Optional[CancelToken] = None) -> None:
+        run_process([sys.executable, "-c", CHILD, str(self.seconds), output_path], cancel)
+
+
+class FlagOnly(TTSEngine):
+    """The old behaviour: the pipeline stops starting chunks, but the engine never sees the token."""
+
+    def __init__(self, engine: TTSEngine) -> None:
+        super().__init__(
+            name=engine.name, output_ext=engine.output_ext, parallel_safe=engine.parallel_safe, max_parallel=engine.max_parallel
+        )
+        self.engine = engine
+
+    def synthesize(self, text: str, output_path: str, cancel: Optional[CancelToken] = None) -> None:
+        self.engine.synthesize(text, output_path)
+
+    def synthesize_to_buffer(self, text: str, cancel: Optional[CancelToken] = None) -> Optional[bytes]:
+        return self.engine.synthesize_to_buffer(text)
+
+
+def child_processes() -> int:
+    """Processes whose parent is this one (Linux /proc; 0 elsewhere)."""
+    count = 0
+    me = str(os.getpid())
+    try:
+        pids = [p for p in os.listdir("/proc") if p.isdigit()]
+    except OSError:
+        return 0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                # The command name is in parentheses and may contain spaces
+                fields = f.read().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        if fields[1] == me and fields[0] != "Z":
+            count += 1
+    return count
+
+
+def measure(engine: TTSEngine, out_path: str, cancel_after: float, idle: Callable[[], bool]) -> float:
+    """Seconds from cancel until the synthesis call returned and idle() holds."""
+    cancel = CancelToken()
+    done = threading.Event()
+
+    def run() -> None:
+        try:
+            synthesize_parallel(engine, TEXT, out_path, cancel=cancel)
+        except (SynthesisCancelled, RuntimeError):
+            pass
+        finally:
+            done.set()
+
+    threading.Thread(target=run, daemon=True).start()
+    time.sleep(cancel_after)
+    start = time.monotonic()
+    cancel.cancel()
+    done.wait()
+    while not idle():
+        time.sleep(0.005)
+    return time.monotonic() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunk-seconds", type=float, default=3.0, help="Synthesis time of one chunk")
+    parser.add_argument("--cancel-after", type=float, default=0.3, help="Cancel this long after the read starts")
+    parser.add_argument("--max-seconds", type=float, default=0.5)
+    args = parser.parse_args()
+
+    fake_engine.STARTUP_SECONDS = args.chunk_seconds
+    stub = StubServer(latency=args.chunk_seconds).start()
+    gtts = GTTSEngine()
+    gtts.client = GTTSClient(stub.url, connections=4)
+    engines = [
+        ("subprocess", SubprocessEngine(args.chunk_seconds), lambda: child_processes() == 0),
+        ("in-process", fake_engine.FakeEngine(), lambda: True),
+        ("gTTS", gtts, lambda: gtts.client.busy() == 0),
+    ]
+    out_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".bench_cancel.out")
+    failed = False
+    print(f"{'engine':>12} {'flag only':>10} {'token':>8}")
+    for name, engine, idle in engines:
+        before = measure(FlagOnly(engine), out_path, args.cancel_after, idle)
+        after = measure(engine, out_path, args.cancel_after, idle)
+        failed |= after > args.max_seconds
+        print(f"{name:>12} {before:>9.3f}s {after:>7.3f}s")
+    gtts.client.close()
+    stub.stop()
+    if os.path.exists(out_path):
+        os.remove(out_path)
+    if failed:
+        print(f"Cancellation took longer than {args.max_seconds}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""Coqui TTS throughput with 1..N model workers on a multi-sentence text.
+
+Usage: python benchmarks/bench_coqui_pool.py [--max-workers 4] [--sentences 24]
+
+Each worker is a separate process with its own model and a fixed torch
+thread count; chunks of the text are dispatched to idle workers by the
+synthesis pipeline. Load time (including the warm-up inference) is
+reported separately from synthesis time.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tts_engines.coqui_model import CoquiModel  # noqa: E402
+from tts_engines.coqui_pool import TORCH_THREADS  # noqa: E402
+from tts_engines.engine_coqui import _MODEL_NAME, CoquiEngine  # noqa: E402
+from tts_engines.pipeline import synthesize_parallel  # noqa: E402
+
+SENTENCES = [
+    "The quick brown fox jumps over the lazy dog.",
+    "Every worker process keeps its own copy of the model in memory.",
+    "Requests are handed to whichever worker is idle.",
+    "Long documents are split into sentences before synthesis.",
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-workers", type=int, default=max(1, (os.cpu_count() or 1) // TORCH_THREADS))
+    parser.add_argument("--sentences", type=int, default=24)
+    args = parser.parse_args()
+
+    engine = CoquiEngine()
+    if engine.check_dependencies():
+        print("Coqui TTS not installed, skipped")
+        return
+    text = " ".join(SENTENCES[i % len(SENTENCES)] for i in range(args.sentences))
+    print(f"{'workers':>7} {'load':>8} {'synth':>8} {'sent/s':>7} {'speedup':>7} {'RSS':>8}")
+    base = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in range(1, args.max_workers + 1):
+            engine.model = CoquiModel(_MODEL_NAME, idle_timeout=0, workers=workers)
+            start = time.perf_counter()
+            engine.model.warm_up()
+            engine.model.synthesize(SENTENCES[0], os.path.join(tmp, "warm.wav"))
+            # Let the rest of the pool finish loading so only synthesis is timed
+            while engine.model.stats()["workers_ready"] < engine.model.stats()["workers"]:
+                time.sleep(0.1)
+            load = time.perf_counter() - start
+            start = time.perf_counter()
+            synthesize_parallel(engine, text, os.path.join(tmp, "out.wav"), workers=workers)
+            synth = time.perf_counter() - start
+            base = base or synth
+            rss = engine.model.stats()["resident_mb"]
+            print(
+                f"{workers:>7} {load:>7.1f}s {synth:>7.1f}s {args.sentences / synth:>7.2f} "
+                f"{base / synth:>6.2f}x {rss:>6.0f}MB"
+            )
+            engine.model.unload()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""Compare TTS engines on latency, real-time factor, memory and output size.
+
+Usage:
+    python benchmarks/bench_engines.py [--engines Fake eSpeak-NG] [--repeat 3]
+                                       [--output results.json] [--baseline baseline.json]
+
+Each engine runs in its own process over a fixed corpus (short phrase,
+paragraph, long article) through the same chunked pipeline the reader uses.
+Per sample it records time to first chunk (ttfb), total synthesis time,
+real-time factor (synthesis time / audio length) and output size; peak RSS
+is per engine process, plus the peak of any engine subprocesses. Timings
+are medians over --repeat runs; the first run is reported separately since
+it includes model loading.
+
+With --baseline, metrics that got worse by more than --threshold are flagged
+and the exit status is 1. The "Fake" engine is deterministic and always
+available, so the harness itself can be checked on machines with no TTS
+backends installed.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_engine import FakeEngine  # noqa: E402
+from textreader.core import audio_duration  # noqa: E402
+from tts_engines import get_engine, list_engines  # noqa: E402
+from tts_engines.pipeline import synthesize_parallel  # noqa: E402
+
+SHORT = "The quick brown fox jumps over the lazy dog."
+
+PARAGRAPH = (
+    "Text to speech is most useful when it starts quickly. A reader that waits "
+    "several seconds before saying anything feels broken, even if the audio it "
+    "eventually produces is excellent. That is why the pipeline splits text into "
+    "sentences and starts playback as soon as the first one is ready, while the "
+    "rest are still being synthesized in the background."
+)
+
+ARTICLE = "\n\n".join(
+    [
+        "The history of speech synthesis goes back much further than most people "
+        "expect. Mechanical talking machines were built in the eighteenth century, "
+        "using bellows, reeds and leather tubes to imitate the human vocal tract. "
+        "They could produce a handful of vowels and a few words, and audiences "
+        "treated them as curiosities rather than tools.",
+        "Electronic synthesis arrived in the twentieth century. Early systems "
+        "modelled the resonances of the vocal tract with filters, and an operator "
+        "played them like an instrument, pressing keys and pedals to shape each "
+        "sound. Later, rule-based synthesizers turned written text into phonemes "
+        "and phonemes into filter settings, with no operator at all. Their voices "
+        "were intelligible but unmistakably robotic.",
+        "Concatenative synthesis took a different approach. Instead of modelling "
+        "speech, it recorded a real speaker reading many hours of text, cut the "
+        "recordings into small units, and stitched those units back together to "
+        "form new sentences. The result sounded far more natural, at the cost of "
+        "large voice databases and occasional audible joins.",
+        "Neural synthesis is the current state of the art. A model trained on "
+        "recorded speech predicts the acoustic features of a sentence, and a second "
+        "model turns those features into a waveform. The voices are often hard to "
+        "tell apart from a human reader, but the models are large, slow to load, "
+        "and much more demanding of the processor than the older techniques.",
+        "Choosing an engine is therefore a trade-off. Rule-based engines start "
+        "instantly and run anywhere. Cloud services sound good but depend on the "
+        "network. Neural models sound best but need memory and time. Measuring "
+        "each of them on the same text is the only reliable way to decide.",
+    ]
+)
+
+CORPUS = {"short": SHORT, "paragraph": PARAGRAPH, "article": ARTICLE}
+
+# Lower is better for all of these; output size changes are reported but not flagged
+COMPARED_METRICS = ["ttfb", "total", "rtf", "peak_rss_mb"]
+# Ignore regressions smaller than this, so timer noise on tiny samples isn't flagged
+MIN_ABS_CHANGE = {"ttfb": 0.005, "total": 0.005, "rtf": 0.005, "peak_rss_mb": 2.0}
+
+
+def load_engine(name: str):
+    if name == "Fake":
+        return FakeEngine()
+    return get_engine(name)
+
+
+def peak_rss_mb(who: int) -> float:
+    peak = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_sample(engine, text: str, repeat: int, out_path: str) -> Dict[str, float]:
+    ttfb: List[float] = []
+    total: List[float] = []
+    for _ in range(repeat):
+        stats = synthesize_parallel(engine, text, out_path)
+        ttfb.append(stats.time_to_first_chunk or 0.0)
+        total.append(stats.total_synthesis_time or 0.0)
+    seconds = audio_duration(out_path)
+    median_total = statistics.median(total)
+    return {
+        "ttfb": statistics.median(ttfb),
+        "total": median_total,
+        "first_run_total": total[0],
+        "audio_seconds": seconds,
+        "rtf": median_total / seconds if seconds else 0.0,
+        "output_bytes": os.path.getsize(out_path),
+    }
+
+
+def run_worker(name: str, repeat: int) -> Dict[str, object]:
+    """Benchmark one engine in this process and return its results."""
+    start = time.perf_counter()
+    engine = load_engine(name)
+    if engine is None:
+        return {"skipped": "unknown engine"}
+    missing = engine.check_dependencies()
+    if missing:
+        return {"skipped": f"missing {', '.join(missing)}"}
+    result: Dict[str, object] = {"load_seconds": time.perf_counter() - start, "samples": {}}
+    with tempfile.TemporaryDirectory(prefix="textreader-bench-") as tmp:
+        out_path = os.path.join(tmp, f"out.{engine.output_ext}")
+        for sample, text in CORPUS.items():
+            try:
+                result["samples"][sample] = run_sample(engine, text, repeat, out_path)
+            except Exception as e:
+                result["samples"][sample] = {"error": str(e)}
+    result["peak_rss_mb"] = peak_rss_mb(resource.RUSAGE_SELF)
+    result["child_peak_rss_mb"] = peak_rss_mb(resource.RUSAGE_CHILDREN)
+    return result
+
+
+def run_engine(name: str, repeat: int) -> Dict[str, object]:
+    """Benchmark one engine in a fresh process so peak RSS is its own."""
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker", name, "--repeat", str(repeat)],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        return {"skipped": f"worker failed: {proc.stderr.strip().splitlines()[-1:] or proc.returncode}"}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def flatten(results: Dict[str, object]) -> Dict[tuple, float]:
+    """Map (engine, sample, metric) to values; peak RSS is per engine."""
+    flat: Dict[tuple, float] = {}
+    for engine, result in results.get("engines", {}).items():
+        if "skipped" in result:
+            continue
+        flat[(engine, "*", "peak_rss_mb")] = result["peak_rss_mb"]
+        for sample, metrics in result["samples"].items():
+            for metric, value in metrics.items():
+                if metric != "error":
+                    flat[(engine, sample, metric)] = value
+    return flat
+
+
+def diff(baseline: Dict[str, object], current: Dict[str, object], threshold: float) -> int:
+    """Print metric changes against a baseline; return the number of regressions."""
+    old, new = flatten(baseline), flatten(current)
+    regressions = 0
+    print(f"\nCompared with baseline from {baseline.get('meta', {}).get('timestamp', 'unknown')}:")
+    for key in sorted(new):
+        engine, sample, metric = key
+        if metric not in COMPARED_METRICS and metric != "output_bytes":
+            continue
+        if key not in old:
+            continue
+        before, after = old[key], new[key]
+        change = (after - before) / before if before else 0.0
+        if metric == "output_bytes":
+            if before != after:
+                print(f"  {engine:>10} {sample:>9} {metric:>12}: {before:.0f} -> {after:.0f} (changed)")
+            continue
+        if abs(after - before) < MIN_ABS_CHANGE[metric] or abs(change) <= threshold:
+            continue
+        flag = "REGRESSION" if change > 0 else "improved"
+        regressions += change > 0
+        print(f"  {engine:>10} {sample:>9} {metric:>12}: {before:.3f} -> {after:.3f} ({change:+.0%}) {flag}")
+    missing = sorted({k[0] for k in old} - {k[0] for k in new})
+    for engine in missing:
+        print(f"  {engine:>10}  in baseline but not benchmarked this run")
+    if not regressions:
+        print("  no regressions")
+    return regressions
+
+
+def print_table(results: Dict[str, object]) -> None:
+    print(f"{'engine':>10} {'sample':>9} {'ttfb':>8} {'total':>8} {'rtf':>6} {'audio':>7} {'size':>9} {'rss':>8}")
+    for engine, result in results["engines"].items():
+        if "skipped" in result:
+            print(f"{engine:>10}  skipped: {result['skipped']}")
+            continue
+        rss = f"{result['peak_rss_mb']:.0f}MB"
+        for sample, m in result["samples"].items():
+            if "error" in m:
+                print(f"{engine:>10} {sample:>9}  error: {m['error']}")
+                continue
+            print(
+                f"{engine:>10} {sample:>9} {m['ttfb'] * 1000:>6.0f}ms {m['total']:>7.2f}s {m['rtf']:>6.3f} "
+                f"{m['audio_seconds']:>6.1f}s {m['output_bytes'] / 1024:>7.0f}KB {rss:>8}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--engines", nargs="+", help="engines to run (default: all installed, plus Fake)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per sample; timings are medians")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative change flagged as a regression")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.repeat)))
+        return
+
+    names = args.engines or ["Fake"] + list_engines()
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "repeat": args.repeat,
+        },
+        "engines": {},
+    }
+    for name in names:
+        print(f"Benchmarking {name}...", file=sys.stderr)
+        results["engines"][name] = run_engine(name, args.repeat)
+    print_table(results)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    regressions: Optional[int] = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = diff(json.load(f), results, args.threshold)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""gTTS fetch time against the local stub endpoint, old style vs pooled and concurrent.
+
+Usage: python benchmarks/bench_gtts_fetch.py [--sentences 12] [--latency 0.15] [--connect-latency 0.1]
+
+"one by one" sends each of the requests gTTS prepares over a fresh
+session, as gTTS's save() does. The pooled rows reuse keep-alive connections and fetch up to that
+many pieces at once; the last row adds 10% 503s and 2% dropped connections,
+which are retried. Every row must produce the same MP3.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gtts_stub import StubServer  # noqa: E402
+from tts_engines.gtts_client import GTTSClient, read_audio  # noqa: E402
+
+SENTENCE = "Each sentence of this text is sent to the speech endpoint as a piece of its own, {}."
+
+
+def run(stub: StubServer, text: str, connections: int, one_by_one: bool = False):
+    stub.connections = stub.requests = 0
+    start = time.perf_counter()
+    if one_by_one:
+        client = GTTSClient(stub.url, connections=1)
+        tts, prepared = client.prepare(text)
+        data = b""
+        for request in prepared:
+            with requests.Session() as session:
+                data += read_audio(tts, session.send(request))
+        client.close()
+        retried = 0
+    else:
+        client = GTTSClient(stub.url, connections=connections, backoff=0.05)
+        data = client.fetch(text)
+        retried = client.retried
+        client.close()
+    return time.perf_counter() - start, data, retried
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sentences", type=int, default=12)
+    parser.add_argument("--latency", type=float, default=0.15)
+    parser.add_argument("--connect-latency", type=float, default=0.1)
+    args = parser.parse_args()
+
+    text = " ".join(SENTENCE.format(i) for i in range(args.sentences))
+    stub = StubServer(latency=args.latency, connect_latency=args.connect_latency).start()
+    client = GTTSClient(stub.url)
+    pieces = len(client.prepare(text)[1])
+    client.close()
+    print(f"{pieces} pieces, {args.latency * 1000:.0f} ms per request, "
+          f"{args.connect_latency * 1000:.0f} ms per new connection")
+    print(f"{'mode':>24} {'time':>7} {'speedup':>8} {'conns':>6} {'retries':>8}")
+    rows = [("one by one", 1), ("pooled, 1 connection", 1)]
+    rows += [(f"pooled, {n} connections", n) for n in (2, 4, 8)]
+    base = reference = None
+    failed = False
+    for name, connections in rows:
+        seconds, data, retried = run(stub, text, connections, one_by_one=name == "one by one")
+        base = base or seconds
+        reference = reference or data
+        failed |= data != reference
+        print(f"{name:>24} {seconds:>6.2f}s {base / seconds:>7.1f}x {stub.connections:>6} {retried:>8}")
+    stub.error_rate, stub.drop_rate = 0.1, 0.02
+    seconds, data, retried = run(stub, text, 4)
+    failed |= data != reference
+    print(f"{'4 connections, errors':>24} {seconds:>6.2f}s {base / seconds:>7.1f}x {stub.connections:>6} {retried:>8}")
+    stub.stop()
+    if failed:
+        print("Audio differs between modes")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
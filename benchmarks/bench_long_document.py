@@ -0,0 +1,139 @@
+"""Peak memory of synthesizing multi-megabyte texts with the Fake engine.
+
+Usage: python benchmarks/bench_long_document.py [--sizes-mb 1 4 8] [--max-growth-mb 8]
+
+Each size runs in a fresh process. "read" runs the reader's own read path,
+reader.stream_synthesis in long-document mode, with its chunk window and
+seek index; reader.py is loaded without its window, hotkeys or tray, with
+settings in a temporary HOME. The mixer plays in real time, so a stand-in
+player takes each chunk from the window and deletes it, as play_stream
+does once a chunk has been played. "convert" writes the whole text to one
+file, as `python -m textreader convert` does. Peak RSS is reported on top
+of the memory taken by the text itself; the run exits 1 if it grows by
+more than --max-growth-mb between the smallest and the largest text.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib.machinery
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import fake_engine  # noqa: E402
+from tts_engines.cancel import CancelToken  # noqa: E402
+from tts_engines.pipeline import synthesize_parallel  # noqa: E402
+
+# Desktop integrations the read path doesn't use
+GUI_MODULES = ("pynput", "pynput.keyboard", "pystray", "pyperclip", "PIL", "PIL.Image", "PIL.ImageDraw", "PIL.ImageTk")
+PARAGRAPH = (
+    "Long documents are read a few sentences at a time. Only a small window of "
+    "synthesized audio is kept ahead of playback, on disk rather than in memory, "
+    "and every chunk is deleted once it has been played.\n\n"
+)
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def load_reader(home: str) -> types.ModuleType:
+    """Run reader.py up to its window's main loop, with the desktop integrations stubbed out."""
+    os.environ["HOME"] = os.environ["USERPROFILE"] = home
+    sys.argv = ["reader.py"]
+    for name in GUI_MODULES:
+        module = types.ModuleType(name)
+        module.__spec__ = importlib.machinery.ModuleSpec(name, None)
+        sys.modules[name] = module
+    sys.modules["pynput"].keyboard = sys.modules["pynput.keyboard"]
+    path = os.path.join(ROOT, "reader.py")
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    source = source[:source.index("# Run control window on main thread")]
+    reader = types.ModuleType("reader")
+    reader.__file__ = path
+    sys.modules["reader"] = reader
+    with contextlib.redirect_stdout(io.StringIO()):
+        exec(compile(source, path, "exec"), reader.__dict__)
+    return reader
+
+
+def drain(chunk_queue, stats, generation, engine, discard_played=False) -> None:
+    """Stand-in for reader.play_stream: take each chunk as the mixer would, and delete it."""
+    while True:
+        chunk = chunk_queue.get()
+        if chunk is None:
+            return
+        chunk.discard()
+
+
+def worker(size_mb: float, mode: str) -> dict:
+    # No synthesis delay and little audio per chunk, so only the pipeline's own memory shows
+    fake_engine.STARTUP_SECONDS = 0.0
+    fake_engine.SECONDS_PER_CHAR = 0.0
+    fake_engine.CHARS_PER_SECOND = 3000.0
+    engine = fake_engine.FakeEngine()
+    text = PARAGRAPH * int(size_mb * 1024 * 1024 / len(PARAGRAPH))
+    with tempfile.TemporaryDirectory() as tmp:
+        if mode == "read":
+            reader = load_reader(tmp)
+            reader.play_stream = drain
+            reader.long_document_chars = 0
+            # The timings printed per read aren't what is measured here
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                baseline = peak_rss_mb()
+                reader.stream_synthesis(engine, text, reader.get_output_path(engine.name), CancelToken())
+            index = reader.seek_index
+            return {
+                "chars": len(text),
+                "chunks": index.chunks,
+                "indexed": len(index.segments),
+                "growth_mb": peak_rss_mb() - baseline,
+            }
+        baseline = peak_rss_mb()
+        stats = synthesize_parallel(engine, text, os.path.join(tmp, "out.wav"))
+    return {"chars": len(text), "chunks": stats.chunks, "growth_mb": peak_rss_mb() - baseline}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--max-growth-mb", type=float, default=8.0)
+    parser.add_argument("--worker", nargs=2, metavar=("SIZE_MB", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        print(json.dumps(worker(float(args.worker[0]), args.worker[1])))
+        return 0
+
+    failed = False
+    print(f"{'mode':>8} {'text':>8} {'chunks':>8} {'indexed':>8} {'peak RSS growth':>16}")
+    for mode in ("read", "convert"):
+        growths = []
+        for size in args.sizes_mb:
+            result = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--worker", str(size), mode],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            row = json.loads(result.stdout.strip().splitlines()[-1])
+            growths.append(row["growth_mb"])
+            print(f"{mode:>8} {size:>6.1f}MB {row['chunks']:>8} {row.get('indexed', '-'):>8} {row['growth_mb']:>14.1f}MB")
+        if max(growths) - growths[0] > args.max_growth_mb:
+            print(f"{mode}: memory grows with input size ({growths[0]:.1f} -> {max(growths):.1f} MB)")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""Time of the text rules on multi-megabyte inputs.
+
+Usage: python benchmarks/bench_normalize.py [--sizes-mb 1 4 8] [--max-ratio 1.5]
+
+The input mixes prose with the things the rules remove: Markdown, HTML,
+URLs, fenced code, box drawing, rulers, and page headers and footers
+repeated across form feeds. Seconds
+per MB should stay flat as the input grows; the run exits 1 if the largest
+input is more than --max-ratio times slower per MB than the smallest.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from textreader.normalize import TextNormalizer  # noqa: E402
+
+PAGE = """Quarterly Report
+## Results
+
+The **new pipeline** cut synthesis time by a third; see https://example.com/reports/2024/q3?ref=mail for details.
+<p>Numbers are <em>preliminary</em> &amp; subject to change.</p>
+
+```python
+for row in rows:
+    print(row)
+```
+
+┌──────────┬────────┐
+│ Region   │ Growth │
+└──────────┴────────┘
+| Region | Growth |
+| ------ | ------ |
+| North  | 4%     |
+- First point, with [a link](https://example.com/a).
+- Second   point,\twith   odd   spacing.
+===========================================
+Page 1 of 40
+\f"""
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--max-ratio", type=float, default=1.5)
+    args = parser.parse_args()
+
+    normalizer = TextNormalizer()
+    rates = []
+    print(f"{'text':>8} {'time':>8} {'s/MB':>8} {'removed':>8}")
+    for size in args.sizes_mb:
+        text = PAGE * int(size * 1024 * 1024 / len(PAGE))
+        start = time.perf_counter()
+        result = normalizer.normalize(text)
+        seconds = time.perf_counter() - start
+        mb = len(text) / (1024 * 1024)
+        rates.append(seconds / mb)
+        print(f"{mb:>6.1f}MB {seconds:>7.2f}s {seconds / mb:>8.3f} {result.removed_chars / len(text):>7.0%}")
+    if rates[-1] > rates[0] * args.max_ratio:
+        print(f"Time per MB grows with input size ({rates[0]:.3f} -> {rates[-1]:.3f} s/MB)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""Compare playback-speed latency: per-play ffmpeg atempo re-encode vs in-process WSOLA.
+
+Usage: python benchmarks/bench_timestretch.py [--speed 1.5]
+
+The ffmpeg column reproduces the old play_audio path (re-encode the whole MP3
+before playback can start). The WSOLA columns time the NumPy stretch on the
+whole clip and on the first 5 s chunk, which is what delays playback when
+stretching chunk-wise.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tts_engines.timestretch import time_stretch, wav_from_pcm  # noqa: E402
+
+RATE = 24000
+DURATIONS = [("10 s", 10), ("60 s", 60), ("10 min", 600)]
+FIRST_CHUNK_SECONDS = 5
+
+
+def speech_like(seconds: float) -> np.ndarray:
+    """Harmonic signal with a syllable-rate envelope, roughly shaped like speech."""
+    t = np.arange(int(seconds * RATE)) / RATE
+    pitch = 140 + 30 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / RATE
+    voice = sum(np.sin(k * phase) / k for k in range(1, 6))
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)
+    return (0.2 * voice * envelope).astype(np.float32)
+
+
+def time_ffmpeg(mp3_path: str, out_path: str, speed: float) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        ["ffmpeg", "-y", "-i", mp3_path, "-filter:a", f"atempo={speed}", out_path],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--speed", type=float, default=1.5)
+    args = parser.parse_args()
+    have_ffmpeg = shutil.which("ffmpeg") is not None
+    if not have_ffmpeg:
+        print("ffmpeg not found: skipping the ffmpeg column")
+
+    print(f"speed {args.speed}x")
+    print(f"{'clip':>8} {'ffmpeg':>10} {'wsola full':>12} {'wsola 1st chunk':>16}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, seconds in DURATIONS:
+            samples = speech_like(seconds)
+            ffmpeg_col = "n/a"
+            if have_ffmpeg:
+                wav_path = os.path.join(tmp, "clip.wav")
+                mp3_path = os.path.join(tmp, "clip.mp3")
+                with open(wav_path, "wb") as f:
+                    f.write(wav_from_pcm(samples, RATE))
+                subprocess.run(
+                    ["ffmpeg", "-y", "-i", wav_path, mp3_path],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=True,
+                )
+                ffmpeg_col = f"{time_ffmpeg(mp3_path, os.path.join(tmp, 'speed.mp3'), args.speed):.3f}s"
+
+            start = time.perf_counter()
+            time_stretch(samples, RATE, args.speed)
+            full_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            time_stretch(samples[: FIRST_CHUNK_SECONDS * RATE], RATE, args.speed)
+            chunk_time = time.perf_counter() - start
+
+            print(f"{label:>8} {ffmpeg_col:>10} {full_time:>11.3f}s {chunk_time:>15.3f}s")
+
+
+if __name__ == "__main__":
+    main()
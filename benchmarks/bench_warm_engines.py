@@ -0,0 +1,66 @@
+"""Per-request latency of eSpeak-NG and Festival with and without the warm worker.
+
+Usage: python benchmarks/bench_warm_engines.py [--requests 10]
+
+"cold" forks espeak-ng / text2wave for every request; "warm" reuses the
+in-process libespeak-ng or the festival --server worker. The first warm
+request includes starting the worker and is reported separately.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tts_engines import get_engine  # noqa: E402
+
+PHRASES = [
+    "The quick brown fox jumps over the lazy dog.",
+    "Reading the clipboard aloud should start almost instantly.",
+    "Warm workers avoid paying process startup on every request.",
+]
+
+
+def run(engine, requests: int, warm: bool, out_path: str):
+    engine.use_warm_server = warm
+    times = []
+    for i in range(requests):
+        start = time.perf_counter()
+        engine.synthesize(PHRASES[i % len(PHRASES)], out_path)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'engine':>10} {'mode':>5} {'first':>9} {'median':>9} {'p95':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        out_path = os.path.join(tmp, "out.wav")
+        for name in ("eSpeak-NG", "Festival"):
+            engine = get_engine(name)
+            if engine is None or engine.check_dependencies():
+                print(f"{name:>10}  not installed, skipped")
+                continue
+            for mode, warm in (("cold", False), ("warm", True)):
+                times = run(engine, args.requests, warm, out_path)
+                if warm and not engine.use_warm_server:
+                    print(f"{name:>10} {mode:>5}  worker unavailable, fell back to cold")
+                    continue
+                rest = sorted(times[1:]) or times
+                p95 = rest[min(len(rest) - 1, int(len(rest) * 0.95))]
+                print(
+                    f"{name:>10} {mode:>5} {times[0] * 1000:>7.1f}ms "
+                    f"{statistics.median(rest) * 1000:>7.1f}ms {p95 * 1000:>7.1f}ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Check the in-process MP3 parser's durations against a decoder, on CBR and VBR MP3s.
+
+Usage: python benchmarks/check_mp3_parser.py [FILE.mp3 ...] [--tolerance 0.03]
+
+Built-in samples are made of silent Layer III frames:
+
+- cbr: one bitrate throughout
+- vbr-xing: mixed bitrates behind a Xing header (what LAME writes for VBR)
+- vbr-vbri: mixed bitrates behind a VBRI header (Fraunhofer encoders)
+- vbr-plain: mixed bitrates with no header, so every frame is walked
+- joined: CBR chunks with ID3 tags between them, as gTTS pieces are joined
+
+The real encoder output in tests/data is always checked too
+(house_lo.mp3: MPEG-2.5 written by LAME 3.97, from pygame's examples), and
+so are MP3 files given on the command line. The
+reference duration comes from ffprobe when it is installed, else from
+decoding the whole file with pygame. The run exits 1 if any duration is
+off by more than --tolerance seconds.
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import io
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+from typing import Callable, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from tts_engines.mp3util import parse_mp3  # noqa: E402
+
+SAMPLE_RATE = 44100
+# MPEG-1 Layer III bitrate indexes (kbit/s) used for the VBR samples
+BITRATES = {5: 64, 9: 128, 11: 192, 14: 320}
+# Side info of an MPEG-1 joint stereo frame; the Xing/VBRI tag follows it
+SIDE_INFO = 32
+FIXTURES = os.path.join(ROOT, "tests", "data")
+
+
+def frame(bitrate_index: int, payload: bytes = b"") -> bytes:
+    """One MPEG-1 Layer III, 44.1 kHz joint stereo frame; all-zero side info decodes as silence."""
+    length = 144 * BITRATES[bitrate_index] * 1000 // SAMPLE_RATE
+    body = payload.ljust(length - 4, b"\0")
+    return bytes([0xFF, 0xFB, bitrate_index << 4, 0x64]) + body
+
+
+def id3_tag() -> bytes:
+    """An ID3v2.3 tag holding just a title frame."""
+    title = b"\0chunk"
+    body = b"TIT2" + struct.pack(">I", len(title)) + b"\0\0" + title
+    return b"ID3\x03\0\0" + bytes([0, 0, 0, len(body)]) + body
+
+
+def audio_frames(count: int, vbr: bool) -> bytes:
+    indexes = list(BITRATES) if vbr else [9]
+    return b"".join(frame(indexes[i % len(indexes)]) for i in range(count))
+
+
+def with_xing(count: int) -> bytes:
+    audio = audio_frames(count, vbr=True)
+    header_length = len(frame(9))
+    tag = b"Xing" + struct.pack(">III", 3, count, header_length + len(audio))
+    return frame(9, bytes(SIDE_INFO) + tag) + audio
+
+
+def with_vbri(count: int) -> bytes:
+    audio = audio_frames(count, vbr=True)
+    header_length = len(frame(9))
+    # version, delay, quality, bytes, frames, TOC entries, TOC scale, entry size, frames per entry
+    tag = b"VBRI" + struct.pack(">HHHIIHHHH", 1, 0, 75, header_length + len(audio), count, 0, 1, 2, 1)
+    return frame(9, bytes(SIDE_INFO) + tag) + audio
+
+
+def joined(count: int, pieces: int) -> bytes:
+    return b"".join(id3_tag() + audio_frames(count, vbr=False) for _ in range(pieces))
+
+
+def samples(frames: int) -> List[Tuple[str, bytes]]:
+    return [
+        ("cbr", audio_frames(frames, vbr=False)),
+        ("vbr-xing", with_xing(frames)),
+        ("vbr-vbri", with_vbri(frames)),
+        ("vbr-plain", audio_frames(frames, vbr=True)),
+        ("joined", joined(frames // 4, 4)),
+    ]
+
+
+def ffprobe_duration(data: bytes) -> Optional[float]:
+    with tempfile.NamedTemporaryFile(suffix=".mp3") as f:
+        f.write(data)
+        f.flush()
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", f.name],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    try:
+        return float(result.stdout.strip())
+    except ValueError:
+        return None
+
+
+def pygame_duration(data: bytes) -> Optional[float]:
+    import pygame
+
+    if not pygame.mixer.get_init():
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        pygame.mixer.init()
+    try:
+        return pygame.mixer.Sound(io.BytesIO(data)).get_length()
+    except pygame.error:
+        return None
+
+
+def reference() -> Tuple[str, Callable[[bytes], Optional[float]]]:
+    if shutil.which("ffprobe") is not None and ffprobe_duration(audio_frames(4, vbr=False)) is not None:
+        return "ffprobe", ffprobe_duration
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    try:
+        import pygame  # noqa: F401
+    except ImportError:
+        raise SystemExit("Neither ffprobe nor pygame is available to check against")
+    return "pygame", pygame_duration
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", help="Real MP3 files to check as well")
+    parser.add_argument("--frames", type=int, default=400, help="Audio frames in each built-in sample")
+    parser.add_argument("--tolerance", type=float, default=0.03, help="Allowed difference in seconds (about one frame)")
+    args = parser.parse_args()
+
+    cases = samples(args.frames)
+    for path in sorted(glob.glob(os.path.join(FIXTURES, "*.mp3"))) + args.files:
+        with open(path, "rb") as f:
+            cases.append((os.path.basename(path), f.read()))
+    name, measure = reference()
+    failed = False
+    print(f"{'sample':>16} {'parser':>10} {name:>10} {'diff':>8} {'vbr':>5}")
+    for label, data in cases:
+        info = parse_mp3(data)
+        expected = measure(data)
+        if info is None or expected is None:
+            failed = True
+            print(f"{label:>16} {'-' if info is None else f'{info.duration:.3f}s':>10} "
+                  f"{'-' if expected is None else f'{expected:.3f}s':>10}   unreadable")
+            continue
+        diff = info.duration - expected
+        failed |= abs(diff) > args.tolerance
+        print(f"{label:>16} {info.duration:>9.3f}s {expected:>9.3f}s {diff:>+7.3f}s {str(info.vbr):>5}")
+    if failed:
+        print(f"Parser durations differ from {name} by more than {args.tolerance}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""Deterministic stand-in engine for running benchmarks without any TTS backend.
+
+Synthesis cost and audio length are fixed functions of the text length, so
+results only move when the harness or the pipeline around the engine changes.
+"""
+from __future__ import annotations
+
+import io
+import os
+import sys
+import time
+import wave
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tts_engines.base import TTSEngine  # noqa: E402
+from tts_engines.cancel import CancelToken, SynthesisCancelled  # noqa: E402
+
+SAMPLE_RATE = 16000
+CHARS_PER_SECOND = 14.0  # roughly conversational speech
+STARTUP_SECONDS = 0.02
+SECONDS_PER_CHAR = 0.0002
+
+
+class FakeEngine(TTSEngine):
+    def __init__(self) -> None:
+        super().__init__(name="Fake", output_ext="wav", parallel_safe=True)
+
+    def _render(self, text: str, cancel: Optional[CancelToken] = None) -> bytes:
+        seconds = STARTUP_SECONDS + SECONDS_PER_CHAR * len(text)
+        if cancel is None:
+            time.sleep(seconds)
+        elif cancel.wait(seconds):
+            raise SynthesisCancelled("Synthesis cancelled")
+        frames = int(SAMPLE_RATE * len(text) / CHARS_PER_SECOND)
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(SAMPLE_RATE)
+            wf.writeframes(b"\0\0" * frames)
+        return buffer.getvalue()
+
+    def synthesize(self, text: str, output_path: str, cancel: Optional[CancelToken] = None) -> None:
+        with open(output_path, "wb") as f:
+            f.write(self._render(text, cancel))
+
+    def synthesize_to_buffer(self, text: str, cancel: Optional[CancelToken] = None) -> Optional[bytes]:
+        return self._render(text, cancel)
@@ -0,0 +1,151 @@
+"""Local stand-in for the gTTS speech endpoint, with simulated latency and errors.
+
+Usage: python benchmarks/gtts_stub.py [--port 8765] [--latency 0.15] [--error-rate 0.1]
+
+then run the reader or the converter against it:
+
+    TEXTREADER_GTTS_ENDPOINT=http://127.0.0.1:8765/ python -m textreader convert notes.txt -e gTTS
+
+Responses carry silent MP3 frames, about as long as the text would take to
+speak. ``StubServer`` can also be started in-process; it counts requests,
+TCP connections and the peak number of requests in flight.
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import random
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from gtts.tts import gTTS
+
+RPC_ID = gTTS.GOOGLE_TTS_RPC
+# MPEG-1 Layer III, 128 kbit/s, 44.1 kHz, joint stereo; all-zero side info decodes as silence
+SILENT_FRAME = bytes([0xFF, 0xFB, 0x90, 0x64]) + bytes(413)
+FRAME_SECONDS = 1152 / 44100
+CHARS_PER_SECOND = 14.0
+
+
+def silent_mp3(text: str) -> bytes:
+    return SILENT_FRAME * max(1, round(len(text) / CHARS_PER_SECOND / FRAME_SECONDS))
+
+
+class StubServer:
+    def __init__(
+        self,
+        port: int = 0,
+        latency: float = 0.0,
+        connect_latency: float = 0.0,
+        error_rate: float = 0.0,
+        drop_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.requests = 0
+        self.connections = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.texts = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/_/TranslateWebserverUi/data/batchexecute"
+
+    def start(self) -> "StubServer":
+        threading.Thread(target=self._server.serve_forever, name="gtts stub", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _roll(self, rate: float) -> bool:
+        with self._lock:
+            return self._random.random() < rate
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+                # Stands in for the TCP and TLS handshakes of a new connection
+                time.sleep(stub.connect_latency)
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                with stub._lock:
+                    stub.requests += 1
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                try:
+                    time.sleep(stub.latency)
+                    if stub._roll(stub.drop_rate):
+                        self.close_connection = True
+                        self.connection.close()
+                        return
+                    if stub._roll(stub.error_rate):
+                        with stub._lock:
+                            stub.errors += 1
+                        self._reply(503, b"")
+                        return
+                    form = urllib.parse.parse_qs(body.decode("ascii"))
+                    text = json.loads(json.loads(form["f.req"][0])[0][0][1])[0]
+                    with stub._lock:
+                        stub.texts.append(text)
+                    audio = base64.b64encode(silent_mp3(text)).decode("ascii")
+                    rpc = json.dumps([["wrb.fr", RPC_ID, json.dumps([audio]), None, None, None, "generic"]], separators=(",", ":"))
+                    self._reply(200, f")]}}'\n\n{len(rpc)}\n{rpc}\n".encode("utf-8"))
+                finally:
+                    with stub._lock:
+                        stub.in_flight -= 1
+
+            def _reply(self, status: int, payload: bytes) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.15, help="Seconds per request")
+    parser.add_argument("--connect-latency", type=float, default=0.1, help="Extra seconds per new connection")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Fraction of connections dropped mid-request")
+    args = parser.parse_args()
+    stub = StubServer(args.port, args.latency, args.connect_latency, args.error_rate, args.drop_rate).start()
+    print(f"gTTS stub listening on {stub.url}")
+    try:
+        while True:
+            time.sleep(5)
+            print(f"requests {stub.requests}, connections {stub.connections}, errors {stub.errors}")
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
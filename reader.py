@@ -1,14 +1,16 @@
+import time
+_startup_t0 = time.perf_counter()
 
 # Dependency check
 import sys
+import argparse
 import shutil
 import json
-from pathlib import Path
+import importlib.util
 missing = []
 def check_dep(mod, pip_name=None):
-    try:
-        __import__(mod)
-    except ImportError:
+    # find_spec locates the package without importing it, keeping startup fast
+    if importlib.util.find_spec(mod) is None:
         missing.append(pip_name or mod)
 
 # Check Python packages
@@ -20,10 +22,6 @@ check_dep('pynput')
 check_dep('tkinter')
 check_dep('numpy')
 
-# Check ffmpeg
-if shutil.which('ffmpeg') is None:
-    missing.append('ffmpeg (system package)')
-
 if missing:
     print("Missing dependencies:")
     for dep in missing:
@@ -31,40 +29,104 @@ if missing:
     print("\nPlease install the missing dependencies and try again.")
     sys.exit(1)
 
-import pyperclip
-import time
-import pygame
 import os
 import threading
-import wave
-from pystray import Icon
-from PIL import Image, ImageDraw
-from pynput import keyboard
+import queue
+import io
+import tempfile
+import hashlib
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
-from tts_engines import get_engine, list_engines
+from tts_engines import engine_info, get_engine, list_engines
+from tts_engines.cancel import CancelToken
+from tts_engines.pipeline import PipelineStats, join_audio, synthesize_chunks
+from tts_engines.mp3util import mp3_duration
+from tts_engines.wavutil import wav_duration
+from textreader import core, tracing
+from textreader.core import LATENCY_FILE, SETTINGS_DIR, SETTINGS_FILE
+from textreader.playback import PAUSED, PLAYING, STOPPED, PlaybackState
+from textreader.prefetch import Prefetcher
+from textreader.seekindex import SeekIndex
+
+# pygame and pynput are imported in the background after the window is shown
+pygame = None
+keyboard = None
+audio_ready = threading.Event()
+
+# Command line options
+arg_parser = argparse.ArgumentParser(description="Clipboard text reader")
+arg_parser.add_argument("--profile-startup", action="store_true", help="print per-phase startup times")
+arg_parser.add_argument("--daemon", action="store_true", help="serve the local speech API on 127.0.0.1")
+arg_parser.add_argument("--daemon-port", type=int, default=5577, help="port for --daemon (default 5577)")
+arg_parser.add_argument("--daemon-socket", help="serve the local speech API on this Unix socket")
+arg_parser.add_argument("--daemon-queue", type=int, default=8, help="pending speech requests before rejecting with 429")
+cli_args, _ = arg_parser.parse_known_args()
+
+# Startup profiling (--profile-startup)
+profile_startup = cli_args.profile_startup
+startup_phases = []
+startup_pending = 0
+startup_painted = False
+startup_lock = threading.Lock()
+
+def mark_phase(name, start):
+    """Record a startup phase that began at start (a perf_counter value)."""
+    startup_phases.append((name, start - _startup_t0, time.perf_counter() - start, threading.current_thread().name))
 
-# Initialize pygame mixer for audio playback
-pygame.mixer.init()
+def print_startup_report():
+    """Print per-phase startup times when --profile-startup is given."""
+    if not profile_startup:
+        return
+    print("=" * 50)
+    print("⏱ Startup profile (offset from launch / duration):")
+    for name, offset, duration, thread in sorted(startup_phases, key=lambda phase: phase[1]):
+        print(f"  {offset * 1000:8.1f} ms  {duration * 1000:8.1f} ms  {name} [{thread}]")
+    print("=" * 50)
 
+def finish_startup_task(name, start):
+    """Mark a background startup task done and report once everything has finished."""
+    global startup_pending
+    mark_phase(name, start)
+    with startup_lock:
+        startup_pending -= 1
+        done = startup_pending == 0 and startup_painted
+    if done:
+        print_startup_report()
+
+def start_background(name, target):
+    """Run a startup task off the UI thread, timing it for --profile-startup."""
+    global startup_pending
+    with startup_lock:
+        startup_pending += 1
+    def run():
+        start = time.perf_counter()
+        try:
+            target()
+        except Exception as e:
+            print(f"Error during startup ({name}): {e}")
+        finally:
+            finish_startup_task(name, start)
+    thread = threading.Thread(target=run, name=name, daemon=True)
+    thread.start()
+    return thread
+
+mark_phase("dependency check and imports", _startup_t0)
+_phase_start = time.perf_counter()
 
 # Settings persistence
-SETTINGS_DIR = Path.home() / ".textReader"
-SETTINGS_FILE = SETTINGS_DIR / "settings.json"
 SETTINGS_DIR.mkdir(exist_ok=True)
 def load_settings():
-    if SETTINGS_FILE.exists():
-        try:
-            with open(SETTINGS_FILE, "r") as f:
-                return json.load(f)
-        except Exception:
-            pass
-    return {"debug_mode": False, "playback_speed": 1.0, "tts_engine": "gTTS"}
+    return core.load_settings()
 def save_settings():
     try:
         with open(SETTINGS_FILE, "w") as f:
-            json.dump({"debug_mode": debug_mode, "playback_speed": playback_speed, "tts_engine": tts_engine}, f)
+            json.dump({"debug_mode": debug_mode, "playback_speed": playback_speed, "tts_engine": tts_engine, "cache_max_mb": cache_max_mb, "ui_cues": ui_cues,
+                       "model_warmup": model_warmup, "model_idle_minutes": model_idle_minutes, "model_memory_mb": model_memory_mb,
+                       "model_workers": model_workers,
+                       "long_document_chars": long_document_chars, "text_rules": text_rules, "url_style": url_style,
+                       "prefetch_clipboard": prefetch_clipboard, "prefetch_max_chars": prefetch_max_chars,
+                       "prefetch_debounce_ms": prefetch_debounce_ms}, f)
     except Exception:
         pass
 
@@ -75,45 +137,248 @@ settings = load_settings()
 debug_mode = settings.get("debug_mode", False)
 audio_file_mp3 = str(SETTINGS_DIR / "clipboard_speech.mp3")
 audio_file_wav = str(SETTINGS_DIR / "clipboard_speech.wav")
+stream_dir = SETTINGS_DIR / "stream"
+stream_generation = 0
 cmd_pressed = False
 shift_pressed = False
 control_window = None
 playback_speed = settings.get("playback_speed", 1.0)
 tts_engine = settings.get("tts_engine", "gTTS")
+cache_max_mb = settings.get("cache_max_mb", 200)
+synthesis_cache = core.open_cache(cache_max_mb)
+last_read_text = None
 playback_start_time = None
 playback_pause_start = None
 playback_pause_accum = 0.0
 current_audio_duration = 0.0
+current_audio = None  # (engine name, output ext, encoded bytes) of the last synthesized clip
+current_audio_index = None  # SeekIndex of current_audio
+seek_index = None  # SeekIndex of what the mixer is playing, in seconds at speed 1.0
+playing_full_clip = False  # the mixer holds the whole read rather than streamed chunks
+speed_clip = None  # (clip bytes, speed, stretched bytes, ext, duration) of the last time-stretched full clip
 current_progress = 0.0
 taskbar_icon_photo = None
 engine_missing_deps = False
 tray_icon = None
+listener = None
+speech_daemon = None
+latency_stats = tracing.LatencyStats(LATENCY_FILE)
+read_started = None  # monotonic time of the current read request, until its first audio
+active_engine = None  # engine whose read is in progress, for attributing spans
+playback = PlaybackState()
+cue_bank = None
+ui_cues = settings.get("ui_cues", False)
+model_warmup = settings.get("model_warmup", True)  # load model-based engines in the background when selected
+model_idle_minutes = settings.get("model_idle_minutes", 10)  # unload an unused model after this long (0 = never)
+model_memory_mb = settings.get("model_memory_mb", 0)  # unload a model after a read once RSS exceeds this (0 = no limit)
+model_workers = settings.get("model_workers", 0)  # model instances run in parallel (0 = fit to cores and memory)
+prepared_engines = set()
+long_document_chars = settings.get("long_document_chars", 20000)  # longer reads stream with bounded memory
+LONG_DOCUMENT_WINDOW = 3  # synthesized chunks kept ahead of playback in long-document mode
+LONG_DOCUMENT_INDEX_CHUNKS = 4 * LONG_DOCUMENT_WINDOW  # chunks around the playhead kept in a long document's seek index
+WINDOW_WAIT_INTERVAL = 0.25  # re-check for cancellation this often while the window is full
+DEBUG_PREVIEW_CHARS = 500
+text_rules = settings.get("text_rules", list(core.RULES))  # clean-up applied to text before it is spoken
+url_style = settings.get("url_style", "domain")  # "domain" reads URLs as their host, "drop" skips them
+text_normalizer = core.text_normalizer(settings)
+prefetch_clipboard = settings.get("prefetch_clipboard", False)  # synthesize new selections before the hotkey is pressed
+prefetch_max_chars = settings.get("prefetch_max_chars", 5000)  # longer selections aren't speculated
+prefetch_debounce_ms = settings.get("prefetch_debounce_ms", 1000)  # the selection must stay unchanged this long
+prefetcher = None
+stream_pending = False  # a streamed read still has chunks to hand to the mixer
+player_thread = None  # thread starting (or streaming) the latest playback; cleared when it is done
+queued_track = None  # (stream generation, end of the playing chunk in stream seconds) while the next one is queued
+synthesizing = None  # (CancelToken, engine name) of the read whose synthesis is running
+synthesizing_lock = threading.Lock()  # guards swapping and clearing synthesizing
+synthesis_lock = threading.Lock()  # held by a read from its cache lookup until its synthesis is done
+audio_files = set()  # output paths written this session
+audio_files_cond = threading.Condition()
+END_CHECK_INTERVAL = 0.05  # re-check this often once a clip has run past its expected end
+UNKNOWN_END_INTERVAL = 0.5  # ...or while playing a clip of unknown length
+TRACK_CHANGE_MARGIN = 0.15  # how far get_pos() may lag the clock before a chunk change is assumed
+PROGRESS_INTERVAL_MS = 250
+clip_durations = {}  # blake2b digest of an encoded clip -> duration in seconds
+CLIP_DURATION_MEMO_SIZE = 256
+clip_durations_lock = threading.Lock()
+ffprobe_warned = False  # the missing-ffprobe warning is printed once
+mark_phase("settings and cache index", _phase_start)
+
+def init_audio():
+    """Import pygame and open the mixer; runs in the background at startup."""
+    global pygame
+    try:
+        import pygame as pygame_module
+        pygame_module.mixer.init()
+        pygame = pygame_module
+        threading.Thread(target=playback_monitor, name="playback monitor", daemon=True).start()
+        load_cues()
+    finally:
+        audio_ready.set()
+
+def wait_for_audio(timeout=10.0):
+    """Block until the mixer is ready; return False if it could not be opened."""
+    audio_ready.wait(timeout)
+    return pygame is not None
+
+def music_busy():
+    """Return True if the music stream is playing (False before the mixer is up)."""
+    return pygame is not None and pygame.mixer.music.get_busy()
+
+def load_cues():
+    """Render the UI sounds once; called when the mixer comes up."""
+    global cue_bank
+    try:
+        from textreader.cues import CueBank
+        cue_bank = CueBank(pygame.mixer)
+    except Exception as e:
+        print(f"⚠️ UI sounds unavailable: {e}")
+
+def play_cue(name):
+    """Play a UI sound over any speech. Errors always sound; the others only with ui_cues on."""
+    if name != "error" and not ui_cues:
+        return
+    if name == "error":
+        wait_for_audio()
+    if cue_bank is not None:
+        try:
+            cue_bank.play(name)
+        except Exception as e:
+            print(f"Error playing {name} cue: {e}")
+
+def refresh_ui():
+    """Ask the control window to redraw its status; safe to call from any thread."""
+    if control_window is not None:
+        try:
+            control_window.after_idle(control_window.update_status)
+        except Exception:
+            pass
+
+def on_playback_change(state):
+    global is_paused
+    is_paused = state == PAUSED
+    refresh_ui()
+
+playback.add_listener(on_playback_change)
+
+def on_model_state(engine, state):
+    if debug_mode:
+        stats = engine.load_stats()
+        if state == "ready":
+            print(f"🐛 [DEBUG] {engine.name} model loaded in {stats.get('load_seconds', 0.0):.2f}s "
+                  f"(+{stats.get('model_mb', 0.0):.0f} MB, process RSS {stats.get('resident_mb', 0.0):.0f} MB)")
+        elif state == "failed":
+            print(f"🐛 [DEBUG] {engine.name} model failed to load: {stats.get('error')}")
+        else:
+            print(f"🐛 [DEBUG] {engine.name} model {state} (process RSS {stats.get('resident_mb', 0.0):.0f} MB)")
+    refresh_ui()
+
+def prepare_engine(engine_name):
+    """Apply model limits to the engine and start warming it up if enabled."""
+    engine = get_engine(engine_name)
+    if engine is None or engine.load_state() is None:
+        return
+    if engine.name not in prepared_engines:
+        prepared_engines.add(engine.name)
+        engine.add_load_listener(lambda state: on_model_state(engine, state))
+    engine.set_model_limits(model_idle_minutes * 60, model_memory_mb, model_workers)
+    if model_warmup:
+        engine.warm_up()
+
+def track_deadline():
+    """Monotonic time at which the loaded audio should finish, or None if unknown."""
+    if playback_start_time is None or current_audio_duration <= 0:
+        return None
+    return playback_start_time + playback_pause_accum + current_audio_duration
+
+def queued_track_deadline():
+    """Monotonic time at which the mixer should move on to the queued stream chunk, or None if none is queued."""
+    queued = queued_track
+    if queued is None or queued[0] != stream_generation or playback_start_time is None:
+        return None
+    return playback_start_time + playback_pause_accum + queued[1]
+
+def playback_monitor():
+    """Notice the end of a clip, and the mixer moving on to a queued stream chunk, by sleeping until they are due.
+
+    Transitions (play, pause, stop) and newly queued chunks wake the monitor
+    immediately; while nothing is playing it does not wake at all. get_pos()
+    restarts from zero when the queued track takes over, so at the chunk
+    boundary it reads less than a sample taken before it plus the time
+    since; the change is then announced with playback.advance(), which the
+    stream player waits on.
+    """
+    global queued_track
+    sample = None  # (queued_track, get_pos(), monotonic time) taken while the playing chunk was still on
+    while is_running:
+        state, version = playback.snapshot()
+        queued = queued_track
+        if state != PLAYING:
+            # get_pos() stands still while paused, so the sample is retaken on resume
+            sample = None
+            playback.wait_change(version)
+            continue
+        boundary = queued_track_deadline()
+        if boundary is None:
+            deadline = track_deadline()
+            if deadline is None:
+                timeout = UNKNOWN_END_INTERVAL
+            else:
+                timeout = max(deadline - time.monotonic(), END_CHECK_INTERVAL)
+        else:
+            now = time.monotonic()
+            pos = pygame.mixer.music.get_pos()
+            if sample is None or sample[0] is not queued:
+                sample = (queued, pos, now)
+            elif pos < sample[1] + (now - sample[2] - TRACK_CHANGE_MARGIN) * 1000:
+                with playback.cond:
+                    if queued_track is queued:
+                        queued_track = None
+                sample = None
+                playback.advance()
+                continue
+            timeout = max(boundary - now, END_CHECK_INTERVAL)
+        if playback.wait_for(lambda: playback.version != version or queued_track is not queued, timeout):
+            continue
+        if boundary is None and not music_busy():
+            if playback.set(STOPPED, if_version=version) and not stream_pending:
+                play_cue("done")
+
+def trace_span(stage, engine_name=None):
+    """Time a stage of a read into the per-engine latency histograms."""
+    return latency_stats.span(engine_name or active_engine or tts_engine, stage, debug=debug_mode)
+
+def mark_first_audio(engine_name):
+    """Record how long the current read took to become audible."""
+    global read_started
+    if read_started is None:
+        return
+    elapsed = time.monotonic() - read_started
+    read_started = None
+    latency_stats.record(engine_name, "first audio", elapsed)
+    latency_stats.save(force=False)
+    if debug_mode:
+        print(f"🐛 [DEBUG] ⏱ first audio: {elapsed * 1000:.1f} ms")
 
 def get_output_path(engine_name):
     """Return output path based on engine output format."""
-    engine = get_engine(engine_name)
-    if engine and engine.output_ext == "mp3":
+    info = engine_info(engine_name)
+    if info and info.output_ext == "mp3":
         return audio_file_mp3
     return audio_file_wav
 
 def check_engine_dependencies(engine_name):
-    """Check dependencies for the selected engine and return missing list."""
-    if debug_mode:
-        print(f"🐛 [DEBUG] Checking dependencies for engine: {engine_name}")
-    engine = get_engine(engine_name)
-    if engine is None:
+    """Check dependencies for the selected engine and return missing list (cached per PATH/venv)."""
+    return core.check_engine_dependencies(engine_name, debug=debug_mode)
+
+def cache_store(engine, text, file_path):
+    """Save a finished synthesis to the cache, ignoring cache errors."""
+    try:
+        synthesis_cache.put(engine, text, file_path)
+    except Exception as e:
         if debug_mode:
-            print(f"🐛 [DEBUG] Engine not found: {engine_name}")
-        return [f"Unknown TTS engine: {engine_name}"]
-    missing_deps = engine.check_dependencies()
+            print(f"🐛 [DEBUG] Could not cache audio: {e}")
     if debug_mode:
-        if missing_deps:
-            print(f"🐛 [DEBUG] Missing deps for {engine_name}: {missing_deps}")
-        else:
-            print(f"🐛 [DEBUG] All deps satisfied for {engine_name}")
-    return missing_deps
-
-check_engine_dependencies(tts_engine)
+        print(f"🐛 [DEBUG] Cache stats: {synthesis_cache.stats()}")
 
 def cleanup_audio_files():
     """Remove any existing audio files from previous runs."""
@@ -122,23 +387,19 @@ def cleanup_audio_files():
             os.remove(audio_file_mp3)
         if os.path.exists(audio_file_wav):
             os.remove(audio_file_wav)
-        temp_speed_file = str(SETTINGS_DIR / "clipboard_speech_speed.mp3")
-        if os.path.exists(temp_speed_file):
-            os.remove(temp_speed_file)
+        shutil.rmtree(stream_dir, ignore_errors=True)
     except Exception:
         pass
+    with audio_files_cond:
+        audio_files.clear()
 
 def has_audio_file():
     """Return True if there is an audio file available for playback."""
-    try:
-        file_path = get_output_path(tts_engine)
-        return os.path.exists(file_path)
-    except Exception:
-        pass
-    return False
+    return get_output_path(tts_engine) in audio_files
 
 def create_lips_icon():
     """Create a lips icon for the system tray"""
+    from PIL import Image, ImageDraw
     image = Image.new('RGB', (64, 64), color='white')
     draw = ImageDraw.Draw(image)
     
@@ -153,143 +414,572 @@ def create_lips_icon():
     return image
 
 def ensure_lips_icon_file():
-    """Create lips icon file and return its path."""
+    """Create lips icon file if it is missing and return its path."""
     icon_path = SETTINGS_DIR / "lips_icon.png"
+    if icon_path.exists():
+        return icon_path
     try:
         img = create_lips_icon()
-        img.save(icon_path)
+        tmp_path = icon_path.with_suffix(".part")
+        img.save(tmp_path, format="PNG")
+        os.replace(tmp_path, icon_path)
     except Exception:
         pass
     return icon_path
 
 def wait_for_audio_file(file_path, timeout=2.0):
-    """Wait for audio file to exist and be non-empty."""
-    start = time.monotonic()
-    while time.monotonic() - start < timeout:
-        try:
-            if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
-                return True
-        except Exception:
-            pass
-        time.sleep(0.05)
-    return False
+    """Wait until set_current_audio has written file_path."""
+    with audio_files_cond:
+        return audio_files_cond.wait_for(lambda: file_path in audio_files, timeout)
 
 def get_audio_duration(file_path):
     """Return audio duration in seconds, or 0 on failure."""
+    with trace_span("duration probe"):
+        return core.audio_duration(file_path)
+
+def get_buffer_duration(data, ext):
+    """Return the duration of an in-memory clip in seconds, or 0 on failure.
+
+    MP3 durations are parsed in-process and memoized per clip, so replays and
+    the progress bar never wait on ffprobe.
+    """
+    if ext == "wav":
+        return wav_duration(data)
+    key = hashlib.blake2b(data, digest_size=16).digest()
+    with clip_durations_lock:
+        duration = clip_durations.get(key)
+    if duration is not None:
+        return duration
+    with trace_span("duration probe"):
+        duration = mp3_duration(data) if ext == "mp3" else 0.0
+    if not duration:
+        duration = probe_buffer_duration(data)
+    if duration:
+        with clip_durations_lock:
+            if len(clip_durations) >= CLIP_DURATION_MEMO_SIZE:
+                clip_durations.pop(next(iter(clip_durations)))
+            clip_durations[key] = duration
+    return duration
+
+def probe_buffer_duration(data):
+    """Fallback for clips the MP3 parser can't read: ask ffprobe."""
+    global ffprobe_warned
+    if shutil.which("ffprobe") is None:
+        if not ffprobe_warned:
+            ffprobe_warned = True
+            print("⚠️ Couldn't read the length of an audio clip; install ffmpeg (ffprobe) to read it")
+        return 0.0
     try:
-        if file_path.endswith(".wav"):
-            with wave.open(file_path, 'rb') as wf:
-                frames = wf.getnframes()
-                rate = wf.getframerate()
-                if rate:
-                    return frames / float(rate)
-                return 0.0
         import subprocess
-        result = subprocess.run(
-            [
-                "ffprobe",
-                "-v",
-                "error",
-                "-show_entries",
-                "format=duration",
-                "-of",
-                "default=noprint_wrappers=1:nokey=1",
-                file_path,
-            ],
-            capture_output=True,
-            text=True,
-            timeout=1.0,
-            check=False,
-        )
-        return float(result.stdout.strip()) if result.stdout.strip() else 0.0
+        with trace_span("ffprobe"):
+            result = subprocess.run(
+                [
+                    "ffprobe",
+                    "-v",
+                    "error",
+                    "-show_entries",
+                    "format=duration",
+                    "-of",
+                    "default=noprint_wrappers=1:nokey=1",
+                    "pipe:0",
+                ],
+                input=data,
+                capture_output=True,
+                timeout=1.0,
+                check=False,
+            )
+        out = result.stdout.decode().strip()
+        return float(out) if out else 0.0
     except Exception:
         return 0.0
 
-def play_audio():
+def set_current_audio(engine, data, output_path, index=None, text=None):
+    """Keep a finished clip in memory for playback and persist it for Play/cache.
+
+    index is the clip's SeekIndex; without one it is estimated from text.
+    """
+    global current_audio, current_audio_index
+    current_audio = (engine.name, engine.output_ext, data)
+    if index is None and text:
+        index = SeekIndex.estimate(text, get_buffer_duration(data, engine.output_ext))
+    current_audio_index = index
+    tmp_path = f"{output_path}.part"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, output_path)
+    with audio_files_cond:
+        audio_files.add(output_path)
+        audio_files_cond.notify_all()
+    refresh_ui()
+
+def clear_current_audio(output_path):
+    """Forget the last clip, so Play can't replay audio of a previous text."""
+    global current_audio, current_audio_index
+    current_audio = None
+    current_audio_index = None
+    with audio_files_cond:
+        audio_files.discard(output_path)
+    try:
+        os.remove(output_path)
+    except OSError:
+        pass
+    refresh_ui()
+
+def preview(text):
+    """Text for debug output, cut short so a pasted document doesn't flood the console."""
+    if len(text) <= DEBUG_PREVIEW_CHARS:
+        return repr(text)
+    return f"{text[:DEBUG_PREVIEW_CHARS]!r}... ({len(text):,} chars)"
+
+def load_audio_source(source, ext, queue_only=False):
+    """Load or queue a chunk path or in-memory buffer on the music stream."""
+    with trace_span("mixer load"):
+        if queue_only:
+            if isinstance(source, str):
+                pygame.mixer.music.queue(source)
+            else:
+                pygame.mixer.music.queue(source, ext)
+        elif isinstance(source, str):
+            pygame.mixer.music.load(source)
+        else:
+            pygame.mixer.music.load(source, ext)
+
+def decode_to_wav(data, ext):
+    """Return 16-bit PCM WAV bytes for an encoded clip (MP3 is decoded in-process)."""
+    if ext == "wav":
+        return data
+    import numpy as np
+    from tts_engines.timestretch import wav_from_pcm
+    sound = pygame.mixer.Sound(file=io.BytesIO(data))
+    rate = pygame.mixer.get_init()[0]
+    samples = pygame.sndarray.array(sound).astype(np.float32) / 32768.0
+    return wav_from_pcm(samples.reshape(len(samples), -1), rate)
+
+def apply_playback_speed(data, ext):
+    """Time-stretch a clip to the selected speed, keeping pitch; returns (data, ext)."""
+    if abs(playback_speed - 1.0) < 1e-3:
+        return data, ext
+    from tts_engines.timestretch import stretch_wav
+    with trace_span("time-stretch"):
+        stretched = stretch_wav(decode_to_wav(data, ext), playback_speed)
+    return stretched, "wav"
+
+def full_clip_at_speed():
+    """Return (data, ext, duration) of current_audio at the selected speed, stretching it at most once."""
+    global speed_clip
+    _, ext, data = current_audio
+    if speed_clip is None or speed_clip[0] is not data or speed_clip[1] != playback_speed:
+        stretched, stretched_ext = apply_playback_speed(data, ext)
+        speed_clip = (data, playback_speed, stretched, stretched_ext, get_buffer_duration(stretched, stretched_ext))
+    return speed_clip[2:]
+
+def player_done():
+    """Called by a player thread as it finishes, so wait_for_read_end notices without polling the thread."""
+    global player_thread
+    with playback.cond:
+        if player_thread is threading.current_thread():
+            player_thread = None
+    playback.notify()
+
+def play_audio(engine_name=None):
     """Play the generated audio file at the selected speed"""
-    global playback_start_time, playback_pause_start, playback_pause_accum, current_audio_duration
     try:
-        # Choose file based on engine
-        file_to_play = get_output_path(tts_engine)
-        if not wait_for_audio_file(file_to_play, 20):
-            print("⚠️ Audio file not ready for playback")
+        start_clip(engine_name or tts_engine)
+    finally:
+        player_done()
+
+def start_clip(engine_name):
+    """Load the latest clip of engine_name and start the mixer on it."""
+    global playback_start_time, playback_pause_start, playback_pause_accum, current_audio_duration, seek_index, playing_full_clip
+    if not wait_for_audio():
+        print("⚠️ Audio output is not available")
+        return
+    try:
+        index = None
+        if current_audio is not None and current_audio[0] == engine_name:
+            # Synthesized clip is already in memory: no file polling or disk round-trip
+            data, ext, duration = full_clip_at_speed()
+            index = current_audio_index
+        else:
+            # Choose file based on engine
+            file_to_play = get_output_path(engine_name)
+            if not wait_for_audio_file(file_to_play, 20):
+                print("⚠️ Audio file not ready for playback")
+                return
+            ext = file_to_play.rsplit(".", 1)[-1]
+            with open(file_to_play, "rb") as f:
+                data = f.read()
+            data, ext = apply_playback_speed(data, ext)
+            duration = get_buffer_duration(data, ext)
+        load_audio_source(io.BytesIO(data), ext)
+        seek_index = index
+        playing_full_clip = True
+        playback_start_time = time.monotonic()
+        playback_pause_start = None
+        playback_pause_accum = 0.0
+        current_audio_duration = duration
+        pygame.mixer.music.play()
+        playback.set(PLAYING)
+        mark_first_audio(engine_name)
+    except Exception as e:
+        print(f"Error playing audio: {e}")
+
+def wait_for_track_change(generation, track_end):
+    """Block until the mixer moves on to the queued track or playback stops.
+
+    track_end is where the playing track ends, in seconds of stream audio.
+    The playback monitor watches for the change around then and announces
+    it with playback.advance(); this thread only waits for that.
+    """
+    global queued_track
+    with playback.cond:
+        track = playback.track
+        queued_track = (generation, track_end)
+    playback.notify()
+    playback.wait_for(
+        lambda: playback.track != track
+        or playback.state == STOPPED
+        or generation != stream_generation
+        or not is_running
+    )
+
+def chunk_duration(chunk, ext):
+    """Length of a synthesized chunk at speed 1.0."""
+    if chunk.data is not None:
+        return get_buffer_duration(chunk.data, ext)
+    return get_audio_duration(chunk.path)
+
+def prepare_chunk(chunk, ext):
+    """Return (source, ext, duration) for a chunk at the current playback speed.
+
+    Speed is applied per chunk, so changing it mid-read affects the next chunk
+    without re-processing what was already queued.
+    """
+    if abs(playback_speed - 1.0) < 1e-3:
+        return chunk.source(), ext, chunk_duration(chunk, ext)
+    data = chunk.data
+    if data is None:
+        with open(chunk.path, "rb") as f:
+            data = f.read()
+    data, ext = apply_playback_speed(data, ext)
+    return io.BytesIO(data), ext, wav_duration(data)
+
+def play_stream(chunk_queue, stats, generation, engine, discard_played=False):
+    """Play synthesized chunks back-to-back as they arrive, using the mixer's queue.
+
+    With discard_played, each chunk file is deleted once the mixer has moved past it.
+    """
+    global playback_start_time, playback_pause_start, playback_pause_accum, current_audio_duration, stream_pending, playing_full_clip
+    ext = engine.output_ext
+    if not wait_for_audio():
+        print("⚠️ Audio output is not available")
+        player_done()
+        return
+    stream_pending = True
+    try:
+        first = chunk_queue.get()
+        if first is None or generation != stream_generation:
             return
-        pygame.mixer.music.load(file_to_play)
-        # Adjust speed for MP3 only
-        if playback_speed != 1.0 and tts_engine == "gTTS":
-            import subprocess
-            temp_speed_file = str(SETTINGS_DIR / "clipboard_speech_speed.mp3")
-            subprocess.run([
-                "ffmpeg", "-y", "-i", audio_file_mp3,
-                "-filter:a", f"atempo={playback_speed}", temp_speed_file
-            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            pygame.mixer.music.load(temp_speed_file)
-            file_to_play = temp_speed_file
+        source, source_ext, duration = prepare_chunk(first, ext)
+        load_audio_source(source, source_ext)
+        playing_full_clip = False
         playback_start_time = time.monotonic()
         playback_pause_start = None
         playback_pause_accum = 0.0
-        current_audio_duration = get_audio_duration(file_to_play)
+        current_audio_duration = duration
         pygame.mixer.music.play()
-        while pygame.mixer.music.get_busy() and is_running and not is_paused:
-            time.sleep(0.1)
+        playback.set(PLAYING)
+        stats.first_audio = time.monotonic()
+        mark_first_audio(engine.name)
+        print(f"⏱ Time to first audio: {stats.time_to_first_audio:.2f}s")
+        track_end = duration
+        playing = first
+        while is_running and generation == stream_generation:
+            chunk = chunk_queue.get()
+            if chunk is None or generation != stream_generation:
+                return
+            source, source_ext, duration = prepare_chunk(chunk, ext)
+            if pygame.mixer.music.get_busy() or playback.state == PAUSED:
+                current_audio_duration += duration
+                load_audio_source(source, source_ext, queue_only=True)
+                wait_for_track_change(generation, track_end)
+            else:
+                # Synthesis fell behind playback; restart with the next chunk,
+                # shifting the start so progress continues from where it stopped
+                load_audio_source(source, source_ext)
+                playback_start_time = time.monotonic() - playback_pause_accum - current_audio_duration
+                current_audio_duration += duration
+                pygame.mixer.music.play()
+                playback.set(PLAYING)
+            track_end += duration
+            if discard_played:
+                playing.discard()
+            playing = chunk
     except Exception as e:
         print(f"Error playing audio: {e}")
+    finally:
+        if generation == stream_generation:
+            stream_pending = False
+        player_done()
+
+def offer_chunk(chunk_queue, chunk, player, cancelled):
+    """Hand a chunk to the player, waiting while its window is full; False if nobody will take it."""
+    while not cancelled():
+        try:
+            chunk_queue.put(chunk, timeout=WINDOW_WAIT_INTERVAL)
+            return True
+        except queue.Full:
+            if player is not None and not player.is_alive():
+                return False
+    return False
+
+def stream_synthesis(engine, text, output_path, cancel, on_first_chunk=None):
+    """Synthesize text in chunks, playing chunk N while chunk N+1 is synthesized.
+
+    Texts over long_document_chars are read in long-document mode: only
+    LONG_DOCUMENT_WINDOW chunks are synthesized ahead of playback, they wait
+    on disk rather than in memory, and each is deleted once played. No
+    full-length clip is kept, so such reads aren't cached or replayable.
+    """
+    global stream_generation, seek_index, player_thread
+    stream_generation += 1
+    generation = stream_generation
+    work_dir = stream_dir / str(generation)
+    for old in stream_dir.glob("*") if stream_dir.exists() else []:
+        shutil.rmtree(old, ignore_errors=True)
+    long_document = len(text) > long_document_chars
+    if long_document:
+        clear_current_audio(output_path)
+        if debug_mode:
+            print(f"🐛 [DEBUG] Long-document mode for {len(text):,} chars")
+    stats = PipelineStats()
+    chunk_queue = queue.Queue(maxsize=LONG_DOCUMENT_WINDOW if long_document else 0)
+    chunks = []
+    player = None
+    # Seeks stay within the playing chunk while streaming, so a long document only indexes the chunks near it
+    index = SeekIndex(LONG_DOCUMENT_INDEX_CHUNKS if long_document else 0)
+    seek_index = index
+    def cancelled():
+        return cancel.cancelled or generation != stream_generation or not is_running
+    try:
+        for chunk in synthesize_chunks(engine, text, str(work_dir), stats=stats, cancel=cancel, spill=long_document):
+            latency_stats.record(engine.name, "synthesize chunk", chunk.synth_seconds)
+            if debug_mode:
+                print(f"🐛 [DEBUG] Chunk {chunk.index} synthesized in {chunk.synth_seconds:.2f}s: {chunk.text[:40]!r}")
+            if not long_document:
+                chunks.append(chunk)
+            index.add_chunk(chunk.text, chunk_duration(chunk, engine.output_ext))
+            if player is None:
+                player = player_thread = threading.Thread(
+                    target=play_stream, args=(chunk_queue, stats, generation, engine, long_document), daemon=True
+                )
+                player.start()
+                if on_first_chunk:
+                    on_first_chunk()
+            if not offer_chunk(chunk_queue, chunk, player, cancelled):
+                break
+    finally:
+        if not offer_chunk(chunk_queue, None, player, cancelled):
+            # Nothing left will be played: drop it so the end marker fits
+            while True:
+                try:
+                    chunk_queue.put_nowait(None)
+                    break
+                except queue.Full:
+                    try:
+                        chunk_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+    if stats.finished is not None and stats.chunks and generation == stream_generation and not cancel.cancelled:
+        latency_stats.record(engine.name, "synthesize", stats.total_synthesis_time)
+        latency_stats.save(force=False)
+        print(
+            f"⏱ Synthesis of {stats.chunks} chunks finished in {stats.total_synthesis_time:.2f}s "
+            f"(first chunk ready after {stats.time_to_first_chunk:.2f}s)"
+        )
+        if long_document:
+            return None
+        # Keep the full-length clip around so Play can replay the whole text
+        set_current_audio(engine, join_audio([chunk.source() for chunk in chunks], engine.output_ext), output_path, index=index)
+        return stats
+    return None
+
+def speak_text(engine, text, cancel, on_first_chunk=None):
+    """Play text with engine, from the cache if possible, else streamed as it is synthesized.
+
+    A read still being synthesized is cancelled first, and this waits until
+    its engine work has stopped, so the two never run side by side or write
+    the same output file.
+    """
+    global stream_generation, active_engine, synthesizing, player_thread
+    active_engine = engine.name
+    # Reads start from the hotkey and the daemon's threads at once
+    with synthesizing_lock:
+        previous, synthesizing = synthesizing, (cancel, engine.name)
+    if previous is None:
+        synthesis_lock.acquire()
+    else:
+        previous[0].cancel()
+        # Time from cancel until the old read's engine work has stopped
+        with trace_span("cancel previous read", previous[1]):
+            synthesis_lock.acquire()
+    try:
+        if cancel.cancelled:
+            return
+        output_path = get_output_path(engine.name)
+        with trace_span("cache lookup"):
+            cached_path = synthesis_cache.get(engine, text)
+        if cached_path:
+            if debug_mode:
+                print(f"🐛 [DEBUG] Cache hit, stats: {synthesis_cache.stats()}")
+            # Supersede any read that is still streaming
+            stream_generation += 1
+            with open(cached_path, "rb") as f:
+                set_current_audio(engine, f.read(), output_path, text=text)
+            if not cancel.cancelled:
+                player_thread = threading.Thread(target=play_audio, args=(engine.name,), daemon=True)
+                player_thread.start()
+        elif stream_synthesis(engine, text, output_path, cancel, on_first_chunk=on_first_chunk):
+            cache_store(engine, text, output_path)
+    finally:
+        with synthesizing_lock:
+            # A newer read may have taken the slot already; its token must stay cancellable
+            if synthesizing is not None and synthesizing[0] is cancel:
+                synthesizing = None
+        synthesis_lock.release()
+        playback.notify()
+
+def cancel_synthesis():
+    """Stop the read being synthesized: engine processes are killed, downloads and queued chunks dropped."""
+    with synthesizing_lock:
+        current = synthesizing
+    if current is not None:
+        current[0].cancel()
+
+def resume_playback():
+    """Unpause, excluding the paused time from progress."""
+    global playback_pause_start, playback_pause_accum
+    pygame.mixer.music.unpause()
+    if playback_pause_start is not None:
+        playback_pause_accum += time.monotonic() - playback_pause_start
+        playback_pause_start = None
+    playback.set(PLAYING)
 
 def on_play():
     """Resume/play reading"""
-    global is_paused
-    
-    if is_paused and pygame.mixer.music.get_busy():
+    global player_thread
+    if playback.state == PAUSED:
         # Resume paused playback from where it left off
-        pygame.mixer.music.unpause()
-        is_paused = False
+        resume_playback()
         print("▶ Resumed from pause")
     else:
         # Start fresh playback from beginning, honoring speed
-        def threaded_play():
-            play_audio()
-        threading.Thread(target=threaded_play, daemon=True).start()
-        is_paused = False
+        player_thread = threading.Thread(target=play_audio, daemon=True)
+        player_thread.start()
         print("▶ Playing")
 
 def on_pause():
     """Pause/resume current playback"""
-    global is_paused, playback_pause_start, playback_pause_accum
-    if pygame.mixer.music.get_busy():
-        if is_paused:
-            pygame.mixer.music.unpause()
-            is_paused = False
-            if playback_pause_start is not None:
-                playback_pause_accum += time.monotonic() - playback_pause_start
-                playback_pause_start = None
-            print("▶ Resumed")
-        else:
-            is_paused = True
-            playback_pause_start = time.monotonic()
-            pygame.mixer.music.pause()
-            print("⏸ Paused")
-    elif is_paused:
-        pygame.mixer.music.unpause()
-        is_paused = False
-        if playback_pause_start is not None:
-            playback_pause_accum += time.monotonic() - playback_pause_start
-            playback_pause_start = None
+    global playback_pause_start
+    if playback.state == PAUSED:
+        resume_playback()
         print("▶ Resumed")
+    elif playback.state == PLAYING:
+        playback_pause_start = time.monotonic()
+        pygame.mixer.music.pause()
+        playback.set(PAUSED)
+        print("⏸ Paused")
     else:
         print("⚠️ Nothing playing to pause")
 
 def on_stop():
     """Stop and reset playback"""
-    global is_paused, playback_start_time, playback_pause_start, playback_pause_accum, current_audio_duration, current_progress
-    is_paused = False
+    global playback_start_time, playback_pause_start, playback_pause_accum, current_audio_duration, current_progress, stream_generation, stream_pending
+    stream_generation += 1
+    # The superseded player won't clear it
+    stream_pending = False
+    cancel_synthesis()
     playback_start_time = None
     playback_pause_start = None
     playback_pause_accum = 0.0
     current_audio_duration = 0.0
     current_progress = 0.0
-    pygame.mixer.music.stop()
+    if pygame is not None:
+        pygame.mixer.music.stop()
+    playback.set(STOPPED)
     print("⏹ Stopped")
 
+def playback_position():
+    """Seconds of the loaded audio played so far, at the current speed."""
+    if playback_start_time is None:
+        return 0.0
+    now = playback_pause_start if playback_pause_start is not None else time.monotonic()
+    return max(0.0, now - playback_start_time - playback_pause_accum)
+
+def seek_to(position):
+    """Jump to position (seconds at the current speed) by moving the mixer; nothing is re-synthesized.
+
+    Once the read is fully synthesized the mixer switches to the full clip,
+    so any position can be reached. While it is still streaming, the mixer
+    only holds the playing chunk, so a seek stops at that chunk's bounds.
+    """
+    global playback_start_time, playback_pause_start, playback_pause_accum, current_audio_duration
+    global stream_generation, stream_pending, playing_full_clip
+    state = playback.state
+    index = seek_index
+    if state == STOPPED or playback_start_time is None or index is None or pygame is None:
+        return False
+    speed = playback_speed
+    with trace_span("seek"):
+        if not playing_full_clip and current_audio is not None and current_audio_index is index:
+            # Supersede the chunk queue with the finished clip
+            stream_generation += 1
+            stream_pending = False
+            data, ext, duration = full_clip_at_speed()
+            position = max(0.0, min(position, duration))
+            load_audio_source(io.BytesIO(data), ext)
+            current_audio_duration = duration
+            pygame.mixer.music.play(start=position)
+            if state == PAUSED:
+                pygame.mixer.music.pause()
+            playing_full_clip = True
+        elif playing_full_clip:
+            position = max(0.0, min(position, current_audio_duration))
+            pygame.mixer.music.set_pos(position)
+        else:
+            start, end = (t / speed for t in index.chunk_bounds(index.chunk_at(playback_position() * speed)))
+            # Past the end: finish this chunk so the queued one starts
+            position = max(start, min(position, end))
+            pygame.mixer.music.set_pos(position - start)
+    now = time.monotonic()
+    playback_start_time = now - position
+    playback_pause_accum = 0.0
+    if state == PAUSED:
+        playback_pause_start = now
+    # Wake the monitor and stream threads so they recompute their deadlines
+    playback.set(state)
+    if debug_mode:
+        print(f"🐛 [DEBUG] Seeked to {position:.2f}s")
+    return True
+
+def seek_fraction(fraction):
+    """Seek to a fraction of the audio synthesized so far."""
+    if seek_index is not None:
+        return seek_to(max(0.0, min(1.0, fraction)) * seek_index.duration / playback_speed)
+    return False
+
+def skip_sentence(step):
+    """Jump to the next (step > 0) or previous sentence."""
+    index = seek_index
+    if index is None or playback.state == STOPPED:
+        return False
+    position = playback_position() * playback_speed
+    target = index.next_start(position) if step > 0 else index.previous_start(position)
+    if target is None:
+        print("⚠️ Already at the last sentence")
+        return False
+    return seek_to(target / playback_speed)
+
 def toggle_debug():
     """Toggle debug mode"""
     global debug_mode
@@ -300,58 +990,69 @@ def toggle_debug():
 
 def read_selected_text():
     """Read the currently selected text from clipboard"""
+    global last_read_text, read_started
     try:
-        # Copy selected text to clipboard first (requires xclip on Linux or xsel)
-        try:
-            import subprocess
-            result = subprocess.run(
-                ["xclip", "-selection", "primary", "-o"],
-                capture_output=True,
-                text=True,
-                timeout=0.5,
-                check=False,
-            )
-            if result.stdout:
-                subprocess.run(
-                    ["xclip", "-selection", "clipboard"],
-                    input=result.stdout,
-                    text=True,
-                    timeout=0.5,
-                    check=False,
-                )
-        except Exception:
-            pass
-        time.sleep(0.1)  # Give clipboard time to update
-        current_text = pyperclip.paste()
+        read_started = time.monotonic()
+        with trace_span("clipboard", tts_engine):
+            # Copy selected text to clipboard first (requires xclip on Linux or xsel)
+            try:
+                import subprocess
+                selected = primary_selection()
+                if selected:
+                    subprocess.run(
+                        ["xclip", "-selection", "clipboard"],
+                        input=selected,
+                        text=True,
+                        timeout=0.5,
+                        check=False,
+                    )
+            except Exception:
+                pass
+            time.sleep(0.1)  # Give clipboard time to update
+            import pyperclip
+            current_text = pyperclip.paste()
         if debug_mode:
             print(f"🐛 [DEBUG] Raw clipboard content:")
-            print(f"🐛 [DEBUG] {repr(current_text)}\n")
+            print(f"🐛 [DEBUG] {preview(current_text)}\n")
+        current_text = normalize_text(current_text)
         if current_text.strip():
             if debug_mode:
                 print(f"\n🐛 [DEBUG] Reading selected text:")
-                print(f"🐛 [DEBUG] {repr(current_text)}\n")
+                print(f"🐛 [DEBUG] {preview(current_text)}\n")
             print(f"Speaking: {current_text[:50]}...")
+            play_cue("start")
+            last_read_text = current_text
 
             # Show modal dialog with cancel button
-            cancel_flag = {'cancel': False}
+            cancel = CancelToken()
             def build_audio():
                 try:
                     engine = get_engine(tts_engine)
                     if engine is None:
                         label.config(text="Error: Unknown TTS engine", foreground="red")
+                        play_cue("error")
                         time.sleep(2)
                         return
-                    missing_deps = engine.check_dependencies()
+                    with trace_span("dependency check", engine.name):
+                        missing_deps = check_engine_dependencies(engine.name)
                     if missing_deps:
                         label.config(text=f"Missing: {', '.join(missing_deps)}", foreground="red")
+                        play_cue("error")
                         time.sleep(2)
                         return
-                    output_path = get_output_path(tts_engine)
-                    engine.synthesize(current_text, output_path)
-                    if not cancel_flag['cancel']:
-                        threading.Thread(target=play_audio, daemon=True).start()
+                    if prefetcher is not None:
+                        hit = prefetcher.record_read(engine, current_text)
+                        if debug_mode:
+                            print(f"🐛 [DEBUG] Prefetch {'hit' if hit else 'miss'}, stats: {prefetcher.stats()}")
+                    def close_dialog():
+                        try:
+                            dialog.destroy()
+                        except Exception:
+                            pass
+                    speak_text(engine, current_text, cancel, on_first_chunk=close_dialog)
                 except Exception as e:
                     label.config(text=f"Error: {e}", foreground="red")
+                    play_cue("error")
                     time.sleep(2)
                 finally:
                     dialog.destroy()
@@ -367,7 +1068,8 @@ def read_selected_text():
             progress.pack(pady=(0, 5))
             progress.start(10)
             def on_cancel():
-                cancel_flag['cancel'] = True
+                # Stops the engine work itself, not just the playback that would follow it
+                cancel.cancel()
                 dialog.destroy()
             cancel_btn = ttk.Button(dialog, text="Cancel", command=on_cancel)
             cancel_btn.pack(pady=5)
@@ -375,40 +1077,212 @@ def read_selected_text():
             dialog.wait_window()
         else:
             print("⚠️ No text to read")
-            # Play a short negative beep
-            try:
-                import numpy as np
-                import wave
-                import struct
-                beep_path = SETTINGS_DIR / "negative_beep.wav"
-                duration = 0.2  # seconds
-                freq = 400      # Hz
-                sample_rate = 44100
-                n_samples = int(sample_rate * duration)
-                t = np.linspace(0, duration, n_samples, False)
-                tone = 0.5 * np.sin(2 * np.pi * freq * t)
-                # Save as WAV
-                with wave.open(str(beep_path), 'w') as wf:
-                    wf.setnchannels(1)
-                    wf.setsampwidth(2)
-                    wf.setframerate(sample_rate)
-                    for s in tone:
-                        wf.writeframes(struct.pack('<h', int(s * 32767)))
-                pygame.mixer.music.load(str(beep_path))
-                pygame.mixer.music.play()
-                time.sleep(duration)
-                if beep_path.exists():
-                    beep_path.unlink()
-            except Exception as e:
-                print(f"Error playing beep: {e}")
+            play_cue("error")
     except Exception as e:
         print(f"Error: {e}")
 
+def primary_selection():
+    """The X primary selection (the highlighted text), or "" without xclip."""
+    try:
+        import subprocess
+        result = subprocess.run(
+            ["xclip", "-selection", "primary", "-o"],
+            capture_output=True,
+            text=True,
+            timeout=0.5,
+            check=False,
+        )
+        return result.stdout
+    except Exception:
+        return ""
+
+def current_selection():
+    """What a read would speak now: the primary selection, else the clipboard. Changes neither."""
+    selected = primary_selection()
+    if selected:
+        return selected
+    import pyperclip
+    return pyperclip.paste()
+
+def prefetch_engine():
+    """The selected engine, if it can synthesize; speculation never reports missing dependencies."""
+    if engine_missing_deps or check_engine_dependencies(tts_engine):
+        return None
+    return get_engine(tts_engine)
+
+def on_prefetch_error(error):
+    if debug_mode:
+        print(f"🐛 [DEBUG] Prefetch failed: {error}")
+
+def start_prefetch():
+    """Watch the selection and synthesize new text ahead of the hotkey (opt-in: prefetch_clipboard).
+
+    On X the selection is read when XFixes reports a change; elsewhere it has
+    no change notification, so it is read on a timer.
+    """
+    global prefetcher
+    from textreader.selection import SelectionEvents
+    prefetcher = Prefetcher(
+        synthesis_cache,
+        current_selection,
+        prefetch_engine,
+        normalize=lambda text: text_normalizer.normalize(text).text,
+        busy=lambda: stream_pending,
+        busy_changed=playback.cond,
+        changes=SelectionEvents,
+        debounce=prefetch_debounce_ms / 1000,
+        max_chars=prefetch_max_chars,
+    )
+    prefetcher.on_error = on_prefetch_error
+    prefetcher.start()
+    print(f"🔮 Prefetching new selections up to {prefetch_max_chars:,} chars")
+
+def normalize_text(text):
+    """Apply the text rules, so neither synthesis nor the cache sees markup, URLs or layout."""
+    with trace_span("normalize"):
+        normalized = text_normalizer.normalize(text)
+    if debug_mode and normalized.removed_chars:
+        print(f"🐛 [DEBUG] Text rules removed {normalized.removed_chars:,} of {normalized.original_chars:,} chars "
+              f"({normalized.summary()})")
+    return normalized.text
+
+def daemon_engine(engine_name):
+    """Resolve the engine for a daemon request, raising if it can't be used."""
+    engine_name = engine_name or tts_engine
+    engine = get_engine(engine_name)
+    if engine is None:
+        raise ValueError(f"Unknown TTS engine: {engine_name}")
+    with trace_span("dependency check", engine.name):
+        missing_deps = check_engine_dependencies(engine.name)
+    if missing_deps:
+        raise RuntimeError(f"Missing: {', '.join(missing_deps)}")
+    return engine
+
+def read_idle():
+    """True once nothing is being read: no player starting, no synthesis running and playback stopped."""
+    return player_thread is None and playback.state == STOPPED and synthesizing is None and not stream_pending
+
+def wait_for_read_end():
+    """Block until nothing is being read (a pause keeps waiting); woken by the transitions, not a timer."""
+    playback.wait_for(lambda: read_idle() or not is_running)
+
+def daemon_speak(text, engine_name=None):
+    """Speak text for a daemon client once the read in progress is over, returning when it has been heard.
+
+    Speak requests run one at a time, so queued requests are read in order.
+    """
+    global last_read_text, read_started
+    wait_for_read_end()
+    read_started = time.monotonic()
+    try:
+        engine = daemon_engine(engine_name)
+        text = normalize_text(text)
+        if not text:
+            raise ValueError("No text left to speak after the text rules")
+        print(f"Speaking (daemon): {text[:50]}...")
+        play_cue("start")
+        if engine.name == tts_engine:
+            last_read_text = text
+        if prefetcher is not None:
+            # Not a selection read, so it isn't counted; it only needs the CPU back
+            prefetcher.cancel()
+        speak_text(engine, text, CancelToken())
+    except Exception as e:
+        print(f"Error speaking daemon request: {e}")
+        play_cue("error")
+        raise
+    wait_for_read_end()
+
+def daemon_synthesize(text, engine_name=None):
+    """Return (audio bytes, ext) for text without playing it."""
+    engine = daemon_engine(engine_name)
+    text = normalize_text(text)
+    if not text:
+        raise ValueError("No text left to speak after the text rules")
+    fd, path = tempfile.mkstemp(suffix=f".{engine.output_ext}", dir=str(SETTINGS_DIR))
+    os.close(fd)
+    try:
+        result = core.synthesize_text(engine, text, path, cache=synthesis_cache)
+        if not result.cached:
+            latency_stats.record(engine.name, "synthesize", result.stats.total_synthesis_time)
+        with open(path, "rb") as f:
+            return f.read(), engine.output_ext
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+def daemon_pause():
+    if playback.state == PLAYING:
+        on_pause()
+
+def daemon_play():
+    if playback.state != PLAYING:
+        on_play()
+
+def daemon_status():
+    return {
+        "state": playback.state,
+        "engine": tts_engine,
+        "playback_speed": playback_speed,
+        "duration": current_audio_duration,
+        "position": playback_position() if playback.state != STOPPED else 0.0,
+        "progress": current_progress,
+        "cache": synthesis_cache.stats(),
+        "prefetch": prefetcher.stats() if prefetcher is not None else None,
+    }
+
+def daemon_seek(request):
+    """Seek for a daemon client: {"position": s}, {"fraction": f}, {"char": n} or {"sentence": "next"/"previous"}."""
+    if "position" in request:
+        seek_to(float(request["position"]))
+    elif "fraction" in request:
+        seek_fraction(float(request["fraction"]))
+    elif "char" in request:
+        if seek_index is not None:
+            seek_to(seek_index.time_at_char(int(request["char"])) / playback_speed)
+    elif request.get("sentence") in ("next", "previous"):
+        skip_sentence(1 if request["sentence"] == "next" else -1)
+    else:
+        raise ValueError('expected "position", "fraction", "char" or "sentence"')
+
+def daemon_index():
+    """Sentence timings of the playing read, at the current speed."""
+    index = seek_index.to_dict(playback_speed) if seek_index is not None else {"duration": 0.0, "chars": 0, "segments": []}
+    index["position"] = playback_position() if playback.state != STOPPED else 0.0
+    index["complete"] = playing_full_clip or (current_audio_index is not None and current_audio_index is seek_index)
+    return index
+
+def start_daemon():
+    """Serve the local speech API (--daemon / --daemon-socket)."""
+    global speech_daemon
+    from textreader.daemon import SpeechDaemon
+    speech_daemon = SpeechDaemon(
+        speak=daemon_speak,
+        synthesize=daemon_synthesize,
+        play=daemon_play,
+        pause=daemon_pause,
+        stop=on_stop,
+        status=daemon_status,
+        seek=daemon_seek,
+        index=daemon_index,
+        max_queue=cli_args.daemon_queue,
+        on_queued=lambda job: play_cue("queued"),
+        token_file=str(SETTINGS_DIR / "api_token"),
+    )
+    print(f"🔑 Speech API token in {SETTINGS_DIR / 'api_token'}")
+    if cli_args.daemon:
+        speech_daemon.serve_http(cli_args.daemon_port)
+        print(f"🔌 Speech API listening on http://127.0.0.1:{cli_args.daemon_port}")
+    if cli_args.daemon_socket:
+        speech_daemon.serve_unix(cli_args.daemon_socket)
+        print(f"🔌 Speech API listening on {cli_args.daemon_socket}")
+
 def create_control_window():
     global control_window, playback_speed
+    window_start = time.perf_counter()
     window = tk.Tk()
     window.title("Clipboard Reader Control")
-    window.geometry("250x400")
+    window.geometry("250x480")
     window.resizable(False, False)
 
     # TTS engine dropdown
@@ -419,8 +1293,14 @@ def create_control_window():
     engine_var = tk.StringVar(value=tts_engine)
     engine_dropdown = ttk.Combobox(engine_frame, textvariable=engine_var, values=list_engines(), state="readonly", width=12)
     engine_dropdown.pack(side=tk.LEFT, padx=2)
+    def on_refresh_engines():
+        # Re-probe every engine, e.g. after installing a missing package mid-session
+        core.capability_cache().refresh()
+        threading.Thread(target=scan_engine_dependencies, daemon=True).start()
+    refresh_btn = ttk.Button(engine_frame, text="↻", width=2, command=on_refresh_engines)
+    refresh_btn.pack(side=tk.LEFT)
     def on_engine_select(event=None):
-        global tts_engine, engine_missing_deps
+        global tts_engine, engine_missing_deps, current_audio
         # Stop playback and clear audio files when switching engine
         on_stop()
         # Remove both audio files to avoid mismatches
@@ -431,8 +1311,22 @@ def create_control_window():
                 os.remove(audio_file_wav)
         except Exception:
             pass
+        with audio_files_cond:
+            audio_files.clear()
+        current_audio = None
         tts_engine = engine_var.get()
         save_settings()
+        # Restore the last read for this engine from the cache so Play works right away
+        engine = get_engine(tts_engine)
+        cached_path = synthesis_cache.get(engine, last_read_text) if engine and last_read_text else None
+        if cached_path:
+            try:
+                with open(cached_path, "rb") as f:
+                    set_current_audio(engine, f.read(), get_output_path(tts_engine), text=last_read_text)
+                if debug_mode:
+                    print(f"🐛 [DEBUG] Restored cached audio for {tts_engine}")
+            except Exception:
+                pass
         missing_deps = check_engine_dependencies(tts_engine)
         if missing_deps:
             safe_showwarning(
@@ -444,6 +1338,8 @@ def create_control_window():
         else:
             window.set_buttons_state(False)
             engine_missing_deps = False
+            prepare_engine(tts_engine)
+        update_status()
     engine_dropdown.bind("<<ComboboxSelected>>", on_engine_select)
 
     # Debug mode dropdown
@@ -458,16 +1354,18 @@ def create_control_window():
         global debug_mode
         debug_mode = (debug_var.get() == "ON")
         save_settings()
+        update_status()
     debug_dropdown.bind("<<ComboboxSelected>>", on_debug_select)
-    # Set window/taskbar icon
-    try:
-        icon_path = ensure_lips_icon_file()
-        photo = tk.PhotoImage(file=icon_path)
+    # Set window/taskbar icon (rendered by the tray thread if it doesn't exist yet)
+    def set_window_icon():
         global taskbar_icon_photo
-        taskbar_icon_photo = photo
-        window.iconphoto(False, taskbar_icon_photo)
-    except:
-        pass
+        try:
+            photo = tk.PhotoImage(file=SETTINGS_DIR / "lips_icon.png")
+            taskbar_icon_photo = photo
+            window.iconphoto(False, taskbar_icon_photo)
+        except Exception:
+            pass
+    window.set_window_icon = set_window_icon
     # Status label
     status_label = ttk.Label(window, text="Status: Running", font=("Arial", 10))
     status_label.pack(pady=5)
@@ -495,6 +1393,9 @@ def create_control_window():
     progress_var = tk.DoubleVar(value=0.0)
     progress_bar = ttk.Progressbar(window, orient=tk.HORIZONTAL, length=200, mode="determinate", maximum=100, variable=progress_var)
     progress_bar.pack(pady=(0, 5))
+    def on_progress_click(event):
+        seek_fraction(event.x / max(1, progress_bar.winfo_width()))
+    progress_bar.bind("<Button-1>", on_progress_click)
     # Button frame
     button_frame = ttk.Frame(window)
     button_frame.pack(pady=10)
@@ -504,8 +1405,51 @@ def create_control_window():
     pause_btn.grid(row=0, column=1, padx=5, pady=5)
     stop_btn = ttk.Button(button_frame, text="⏹ Stop", command=on_stop, width=12)
     stop_btn.grid(row=1, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+    prev_btn = ttk.Button(button_frame, text="⏮ Sentence", command=lambda: skip_sentence(-1), width=12)
+    prev_btn.grid(row=2, column=0, padx=5, pady=5)
+    next_btn = ttk.Button(button_frame, text="Sentence ⏭", command=lambda: skip_sentence(1), width=12)
+    next_btn.grid(row=2, column=1, padx=5, pady=5)
     read_btn = ttk.Button(button_frame, text="📄 Read Clipboard", command=read_selected_text, width=12)
     read_btn.grid(row=3, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+    def show_latency_stats():
+        stats_window = tk.Toplevel(window)
+        stats_window.title("Latency Stats")
+        stats_window.geometry("520x320")
+        columns = ("engine", "stage", "count", "p50", "p95", "p99")
+        tree = ttk.Treeview(stats_window, columns=columns, show="headings", height=10)
+        for col, width in zip(columns, (90, 120, 60, 70, 70, 70)):
+            tree.heading(col, text=col if col in ("engine", "stage", "count") else f"{col} (ms)")
+            tree.column(col, width=width, anchor=tk.W if col in ("engine", "stage") else tk.E)
+        tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        def refresh():
+            tree.delete(*tree.get_children())
+            for engine_name, stages in latency_stats.summary().items():
+                for stage, row in stages.items():
+                    tree.insert("", tk.END, values=(
+                        engine_name, stage, row["count"],
+                        f"{row['p50'] * 1000:.0f}", f"{row['p95'] * 1000:.0f}", f"{row['p99'] * 1000:.0f}",
+                    ))
+        def export_json():
+            from tkinter import filedialog
+            path = filedialog.asksaveasfilename(
+                parent=stats_window, defaultextension=".json", initialfile="latency_stats.json",
+                filetypes=[("JSON", "*.json")],
+            )
+            if path:
+                latency_stats.dump_json(path)
+                print(f"⏱ Latency stats written to {path}")
+        def reset_stats():
+            if messagebox.askyesno("Reset Latency Stats", "Clear all recorded latencies?", parent=stats_window):
+                latency_stats.reset()
+                refresh()
+        stats_buttons = ttk.Frame(stats_window)
+        stats_buttons.pack(pady=5)
+        ttk.Button(stats_buttons, text="Refresh", command=refresh).pack(side=tk.LEFT, padx=3)
+        ttk.Button(stats_buttons, text="Export JSON…", command=export_json).pack(side=tk.LEFT, padx=3)
+        ttk.Button(stats_buttons, text="Reset", command=reset_stats).pack(side=tk.LEFT, padx=3)
+        refresh()
+    stats_btn = ttk.Button(button_frame, text="⏱ Latency Stats", command=show_latency_stats, width=12)
+    stats_btn.grid(row=4, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
     def set_controls_state(disabled: bool):
         try:
             if not window.winfo_exists():
@@ -516,10 +1460,12 @@ def create_control_window():
         play_btn.state([ttk_state])
         pause_btn.state([ttk_state])
         stop_btn.state([ttk_state])
+        prev_btn.state([ttk_state])
+        next_btn.state([ttk_state])
         read_btn.state([ttk_state])
         speed_slider.state([ttk_state])
     window.set_buttons_state = set_controls_state
-    info = ttk.Label(window, text="Shortcuts:\nWin+Shift+T: Read Selected Text\nWin+Shift+R: Play\nWin+Shift+P: Pause\nWin+Shift+S: Stop", 
+    info = ttk.Label(window, text="Shortcuts:\nWin+Shift+T: Read Selected Text\nWin+Shift+R: Play\nWin+Shift+P: Pause\nWin+Shift+S: Stop\nWin+Shift+, / .: Previous / Next Sentence", 
                      font=("Arial", 8), justify=tk.LEFT)
     info.pack(pady=10)
     def safe_showwarning(title, message):
@@ -529,62 +1475,86 @@ def create_control_window():
         except Exception:
             pass
 
-    missing_map = []
-    for name in list_engines():
-        missing = check_engine_dependencies(name)
-        if missing:
-            missing_map.append(f"{name}: {', '.join(missing)}")
-    if debug_mode:
-        if missing_map:
-            print("🐛 [DEBUG] Missing engine dependencies found:")
-            for line in missing_map:
-                print(f"🐛 [DEBUG] {line}")
+    def apply_dependency_scan(missing_map, current_missing):
+        global engine_missing_deps
+        if debug_mode:
+            if missing_map:
+                print("🐛 [DEBUG] Missing engine dependencies found:")
+                for line in missing_map:
+                    print(f"🐛 [DEBUG] {line}")
+            else:
+                print("🐛 [DEBUG] All engine dependencies satisfied")
+        if current_missing:
+            engine_missing_deps = True
+            window.set_buttons_state(True)
         else:
-            print("🐛 [DEBUG] All engine dependencies satisfied")
-    if missing_map:
-        safe_showwarning(
-            "Missing TTS Dependencies",
-            "Some TTS engines are missing dependencies:\n\n" + "\n".join(missing_map),
-        )
-    current_missing = check_engine_dependencies(tts_engine)
-    if current_missing:
-        engine_missing_deps = True
-        window.set_buttons_state(True)
-    else:
-        engine_missing_deps = False
-        window.set_buttons_state(False)
+            engine_missing_deps = False
+            window.set_buttons_state(False)
+        update_status()
+        if missing_map:
+            safe_showwarning(
+                "Missing TTS Dependencies",
+                "Some TTS engines are missing dependencies:\n\n" + "\n".join(missing_map),
+            )
+    def scan_engine_dependencies():
+        # Probes not in the capability cache can be slow, so this runs off the UI thread
+        missing_map = []
+        current_missing = []
+        for name in list_engines():
+            missing = check_engine_dependencies(name)
+            if missing:
+                missing_map.append(f"{name}: {', '.join(missing)}")
+            if name == tts_engine:
+                current_missing = missing
+        if tts_engine not in list_engines():
+            current_missing = check_engine_dependencies(tts_engine)
+        window.after(0, lambda: apply_dependency_scan(missing_map, current_missing))
+        if not current_missing:
+            prepare_engine(tts_engine)
+    progress_job = None
     def update_status():
+        """Redraw status and buttons; driven by playback transitions, ticking only while playing."""
         global current_progress
+        nonlocal progress_job
         try:
             if not window.winfo_exists():
                 return
         except Exception:
             return
+        if progress_job is not None:
+            window.after_cancel(progress_job)
+            progress_job = None
         if engine_missing_deps:
             play_btn.state(["disabled"])
             pause_btn.state(["disabled"])
             stop_btn.state(["disabled"])
+            prev_btn.state(["disabled"])
+            next_btn.state(["disabled"])
             read_btn.state(["disabled"])
             speed_slider.state(["disabled"])
             status_label.config(text="Status: Missing Dependencies")
-            window.after(500, update_status)
             return
-        if pygame.mixer.music.get_busy() or is_paused:
-            if is_paused:
+        state = playback.state
+        if state != STOPPED:
+            if state == PAUSED:
                 status_label.config(text="Status: Paused")
             else:
                 status_label.config(text="Status: Playing")
-            speed_slider.state(["disabled"])
             if playback_start_time and current_audio_duration > 0:
-                if not is_paused:
-                    now = time.monotonic()
-                    elapsed = now - playback_start_time - playback_pause_accum
-                    current_progress = max(0.0, min(100.0, (elapsed / current_audio_duration) * 100.0))
+                # Tracks seeks too, since they move playback_start_time
+                current_progress = max(0.0, min(100.0, (playback_position() / current_audio_duration) * 100.0))
                 progress_var.set(current_progress)
             else:
                 progress_var.set(0.0)
         else:
-            status_label.config(text="Status: Stopped")
+            engine = get_engine(tts_engine)
+            load_state = engine.load_state() if engine else None
+            if load_state == "loading":
+                status_label.config(text="Status: Loading model...")
+            elif load_state == "failed":
+                status_label.config(text="Status: Model failed to load")
+            else:
+                status_label.config(text="Status: Stopped")
             speed_slider.state(["!disabled"])
             progress_var.set(0.0)
         debug_text = "Debug: ON" if debug_mode else "Debug: OFF"
@@ -594,20 +1564,25 @@ def create_control_window():
             play_btn.state(["!disabled"])
         else:
             play_btn.state(["disabled"])
-        if pygame.mixer.music.get_busy() or (is_paused and has_audio_file()):
+        if state != STOPPED:
             pause_btn.state(["!disabled"])
             stop_btn.state(["!disabled"])
+            prev_btn.state(["!disabled"])
+            next_btn.state(["!disabled"])
         else:
             pause_btn.state(["disabled"])
             stop_btn.state(["disabled"])
-        try:
-            window.after(500, update_status)
-        except Exception:
-            pass
+            prev_btn.state(["disabled"])
+            next_btn.state(["disabled"])
+        if state == PLAYING:
+            # Only the progress bar needs a clock, and only while audio is playing
+            progress_job = window.after(PROGRESS_INTERVAL_MS, update_status)
+    window.update_status = update_status
     update_status()
     def on_close():
         global is_running
         is_running = False
+        playback.notify()
         try:
             if tray_icon:
                 tray_icon.stop()
@@ -624,6 +1599,30 @@ def create_control_window():
     except Exception:
         pass
     control_window = window
+    def on_first_paint():
+        global startup_painted, startup_pending
+        mark_phase("control window first paint", window_start)
+        print(f"🚀 Control window visible after {(time.perf_counter() - _startup_t0) * 1000:.0f} ms")
+        if (SETTINGS_DIR / "lips_icon.png").exists():
+            set_window_icon()
+        # Everything not needed to show the window starts now, in the background
+        start_background("audio init", init_audio)
+        start_background("hotkeys", setup_hotkeys)
+        start_background("engine dependency scan", scan_engine_dependencies)
+        if cli_args.daemon or cli_args.daemon_socket:
+            start_background("speech daemon", start_daemon)
+        if prefetch_clipboard:
+            start_background("selection prefetch", start_prefetch)
+        with startup_lock:
+            # The tray thread never returns, so run_tray reports when the icon is up
+            startup_pending += 1
+        threading.Thread(target=run_tray, name="tray", daemon=True).start()
+        with startup_lock:
+            startup_painted = True
+            done = startup_pending == 0
+        if done:
+            print_startup_report()
+    window.after_idle(on_first_paint)
     window.mainloop()
 
 def on_press(key):
@@ -644,6 +1643,10 @@ def on_press(key):
                     on_stop()
                 elif key.char.lower() == 't':  # Win+Shift+T - Read selected Text
                     read_selected_text()
+                elif key.char in (',', '<'):  # Win+Shift+, - Previous sentence
+                    skip_sentence(-1)
+                elif key.char in ('.', '>'):  # Win+Shift+. - Next sentence
+                    skip_sentence(1)
     except AttributeError:
         pass
 
@@ -660,47 +1663,42 @@ def on_release(key):
 
 def setup_hotkeys():
     """Setup keyboard listener for control"""
+    global keyboard, listener
+    from pynput import keyboard as keyboard_module
+    keyboard = keyboard_module
     listener = keyboard.Listener(on_press=on_press, on_release=on_release)
     listener.start()
     return listener
 
-def clipboard_monitor():
-    """Monitor clipboard and speak new content"""
-    global is_running, is_paused
-    
-    while is_running:
-        try:
-            # Short pause to prevent high CPU usage
-            time.sleep(0.5)
-        except KeyboardInterrupt:
-            break
-
 def run_tray():
     """Run the system tray icon (display only, no menu)"""
     global tray_icon
+    start = time.perf_counter()
+    icon_existed = (SETTINGS_DIR / "lips_icon.png").exists()
     icon_path = ensure_lips_icon_file()
+    if not icon_existed and control_window is not None:
+        control_window.after(0, control_window.set_window_icon)
     try:
-        image = Image.open(icon_path).convert("RGBA")
-    except Exception:
-        image = create_lips_icon()
-    tray_icon = Icon("clipboard_reader_tray", image, title="Clipboard Reader")
-    print("System tray icon created.")
-    tray_icon.run(setup=lambda icon: None)
+        from pystray import Icon
+        from PIL import Image
+        try:
+            image = Image.open(icon_path).convert("RGBA")
+        except Exception:
+            image = create_lips_icon()
+        tray_icon = Icon("clipboard_reader_tray", image, title="Clipboard Reader")
+        print("System tray icon created.")
+    except Exception as e:
+        print(f"Error creating tray icon: {e}")
+        finish_startup_task("tray icon", start)
+        return
+    def on_tray_ready(icon):
+        icon.visible = True
+        finish_startup_task("tray icon", start)
+    tray_icon.run(setup=on_tray_ready)
 
 # Remove any leftover audio files from previous runs
 cleanup_audio_files()
 
-# Start clipboard monitoring in background thread
-monitor_thread = threading.Thread(target=clipboard_monitor, daemon=True)
-monitor_thread.start()
-
-# Setup keyboard listener
-listener = setup_hotkeys()
-
-# Run system tray icon in background thread
-tray_thread = threading.Thread(target=run_tray, daemon=True)
-tray_thread.start()
-
 print("=" * 50)
 print("Clipboard Reader started")
 print("=" * 50)
@@ -710,6 +1708,7 @@ print("  Win+Shift+T  - Read Selected Text")
 print("  Win+Shift+R  - Play/Resume")
 print("  Win+Shift+P  - Pause")
 print("  Win+Shift+S  - Stop")
+print("  Win+Shift+, / .  - Previous / Next Sentence")
 print("\nControl window opening...")
 print("Lips icon in system tray...")
 print("=" * 50)
@@ -723,14 +1722,17 @@ except KeyboardInterrupt:
 # Cleanup
 print("\nProgram stopped.")
 is_running = False
-listener.stop()
+playback.notify()
+cancel_synthesis()
+if prefetcher:
+    prefetcher.stop()
+if listener:
+    listener.stop()
+if speech_daemon:
+    speech_daemon.shutdown()
+latency_stats.save()
 if os.path.exists(audio_file_mp3):
     os.remove(audio_file_mp3)
 if os.path.exists(audio_file_wav):
     os.remove(audio_file_wav)
-temp_speed_file = str(SETTINGS_DIR / "clipboard_speech_speed.mp3")
-if os.path.exists(temp_speed_file):
-    os.remove(temp_speed_file)
-icon_path = SETTINGS_DIR / "lips_icon.png"
-if os.path.exists(icon_path):
-    os.remove(icon_path)
+shutil.rmtree(stream_dir, ignore_errors=True)
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The repository isn't installed; import textreader, tts_engines and benchmarks from the checkout
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
@@ -0,0 +1,58 @@
+import threading
+import time
+
+import pytest
+
+import fake_engine
+from tts_engines.cancel import CancelToken, SynthesisCancelled
+from tts_engines.pipeline import synthesize_parallel
+
+TEXT = " ".join(f"Sentence {i} of the text that is being cancelled, long enough to be a chunk of its own." for i in range(12))
+CHUNK_SECONDS = 3.0
+# bench_cancel's bound; without the token the chunks in flight run their full CHUNK_SECONDS
+MAX_SECONDS = 0.5
+
+
+@pytest.fixture
+def slow_engine(monkeypatch):
+    monkeypatch.setattr(fake_engine, "STARTUP_SECONDS", CHUNK_SECONDS)
+    return fake_engine.FakeEngine()
+
+
+def test_cancel_frees_the_slot_promptly(slow_engine, tmp_path):
+    out_path = tmp_path / "out.wav"
+    cancel = CancelToken()
+    returned = threading.Event()
+    outcome = []
+
+    def read() -> None:
+        try:
+            synthesize_parallel(slow_engine, TEXT, str(out_path), cancel=cancel)
+            outcome.append("finished")
+        except SynthesisCancelled:
+            outcome.append("cancelled")
+        finally:
+            returned.set()
+
+    threads = threading.active_count()
+    threading.Thread(target=read, daemon=True).start()
+    time.sleep(0.3)
+    start = time.monotonic()
+    cancel.cancel()
+    assert returned.wait(CHUNK_SECONDS)
+    # The engine's workers are gone too, not just the call returned
+    while threading.active_count() > threads and time.monotonic() - start < CHUNK_SECONDS:
+        time.sleep(0.005)
+    freed = time.monotonic() - start
+    assert outcome == ["cancelled"]
+    assert freed <= MAX_SECONDS
+    assert not out_path.exists()
+
+
+def test_cancelled_before_start_does_no_work(slow_engine, tmp_path):
+    cancel = CancelToken()
+    cancel.cancel()
+    start = time.monotonic()
+    with pytest.raises(SynthesisCancelled):
+        synthesize_parallel(slow_engine, TEXT, str(tmp_path / "out.wav"), cancel=cancel)
+    assert time.monotonic() - start <= MAX_SECONDS
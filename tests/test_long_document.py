@@ -0,0 +1,36 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import bench_long_document
+
+# The bench's default bound, between a 1 MB and a 4 MB text
+MAX_GROWTH_MB = 8.0
+
+
+def run_worker(size_mb: float, mode: str) -> dict:
+    # A fresh process each, so one size's peak RSS can't hide another's
+    result = subprocess.run(
+        [sys.executable, bench_long_document.__file__, "--worker", str(size_mb), mode],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=dict(os.environ, SDL_AUDIODRIVER="dummy"),
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("mode", ["read", "convert"])
+def test_peak_memory_does_not_grow_with_text_size(mode):
+    if mode == "read":
+        pytest.importorskip("pygame")
+    small, large = run_worker(1, mode), run_worker(4, mode)
+    assert large["chars"] > 3 * small["chars"]
+    assert large["chunks"] > 3 * small["chunks"]
+    assert large["growth_mb"] - small["growth_mb"] <= MAX_GROWTH_MB
+    if mode == "read":
+        # The seek index keeps a window of chunks, not one entry per chunk read
+        assert large["indexed"] == small["indexed"] < small["chunks"]
@@ -0,0 +1,46 @@
+import os
+
+import pytest
+
+import check_mp3_parser
+from tts_engines.mp3util import mp3_duration, parse_mp3
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "house_lo.mp3")
+# About one frame; VBR durations come from the header, which encoders round
+TOLERANCE = 0.03
+
+
+@pytest.fixture(scope="module")
+def encoded():
+    with open(FIXTURE, "rb") as f:
+        return f.read()
+
+
+def test_encoder_output_is_parsed_exactly(encoded):
+    # MPEG-2.5 Layer III from LAME 3.97: 139 frames of 576 samples at 11025 Hz
+    info = parse_mp3(encoded)
+    assert (info.frames, info.sample_rate, info.channels, info.vbr) == (139, 11025, 1, False)
+    assert info.duration_us == 139 * 576 * 1_000_000 // 11025
+    assert abs(info.bitrate - 128_000) < 100
+
+
+def test_truncated_file_counts_the_whole_frames_left(encoded):
+    assert parse_mp3(encoded[: len(encoded) // 2]).frames == 69
+
+
+def test_not_an_mp3():
+    assert parse_mp3(b"RIFF" + bytes(400)) is None
+    assert mp3_duration(b"") == 0.0
+
+
+@pytest.mark.parametrize("label, data", check_mp3_parser.samples(400))
+def test_synthetic_samples_match_decoder(label, data):
+    pytest.importorskip("pygame")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    assert abs(parse_mp3(data).duration - check_mp3_parser.pygame_duration(data)) <= TOLERANCE
+
+
+def test_fixture_matches_decoder(encoded):
+    pytest.importorskip("pygame")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    assert abs(parse_mp3(encoded).duration - check_mp3_parser.pygame_duration(encoded)) <= TOLERANCE
@@ -0,0 +1,34 @@
+import pytest
+
+from textreader.normalize import TextNormalizer, detect_format
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "if x<y and y>z then stop.",
+        "if x<b and b>z then stop.",
+        "while i<p and p>0: step",
+        "A vector<int> holds numbers.",
+        "1 < 2 > 0",
+    ],
+)
+def test_comparisons_in_plain_text_are_kept(text):
+    assert detect_format(text) == "plain"
+    assert TextNormalizer().normalize(text).text == text
+
+
+def test_html_elements_are_stripped_from_plain_text():
+    assert TextNormalizer().normalize('See <img src="a.png"> the <b>chart</b>.').text == "See the chart."
+
+
+def test_any_tag_is_stripped_from_html_and_markdown():
+    normalizer = TextNormalizer()
+    assert normalizer.normalize("<p>Press <kbd>Ctrl</kbd> <x-key>C</x-key>.</p>").text == "Press Ctrl C."
+    assert normalizer.normalize("# Keys\nPress <x-key data>C</x-key>.").text == "Keys\n\nPress C."
+
+
+def test_declared_format_overrides_detection():
+    assert TextNormalizer().normalize("if x<y and y>z then stop.", "html").text == "if xz then stop."
+    with pytest.raises(ValueError):
+        TextNormalizer().normalize("text", "rtf")
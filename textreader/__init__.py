@@ -0,0 +1,4 @@
+"""Headless synthesis core shared by reader.py and the batch CLI.
+
+Nothing in this package imports tkinter, pygame or pystray.
+"""
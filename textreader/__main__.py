@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import List, Optional
+
+from . import convert, engines, tracing
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m textreader", description="Headless text-to-speech tools.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    convert.add_parser(subparsers)
+    tracing.add_parser(subparsers)
+    engines.add_parser(subparsers)
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from tts_engines import get_engine, list_engines
+from tts_engines.base import TTSEngine
+from tts_engines.cache import SynthesisCache, normalize_text
+from tts_engines.cancel import CancelToken
+from tts_engines.pipeline import default_workers
+
+from .core import audio_duration, check_engine_dependencies, load_settings, open_cache, synthesize_text, text_normalizer
+
+TEXT_SUFFIXES = (".txt", ".md", ".rst")
+MANIFEST_NAME = ".textreader-manifest.json"
+# Inputs whose format is known from the name; the rest are detected from their text
+FORMATS_BY_SUFFIX = {".md": "markdown"}
+
+
+@dataclass
+class Job:
+    name: str  # output path relative to the output directory, without extension
+    source: str  # input path, or "-" for stdin
+    text: str
+
+
+@dataclass
+class JobResult:
+    job: Job
+    output_path: str
+    status: str  # "converted", "cached", "skipped" or "failed"
+    seconds: float = 0.0
+    audio_seconds: float = 0.0
+    error: str = ""
+
+
+def collect_jobs(inputs: List[str]) -> Tuple[List[Job], List[str]]:
+    """Expand files, directories, globs and "-" (stdin) into conversion jobs.
+
+    Returns the jobs and the inputs that matched nothing on disk.
+    """
+    jobs: List[Job] = []
+    missing: List[str] = []
+    seen = set()
+    for item in inputs:
+        if item == "-":
+            jobs.append(Job("stdin", "-", sys.stdin.read()))
+            continue
+        matches = sorted(glob.glob(item, recursive=True)) or [item]
+        for match in matches:
+            path = Path(match)
+            if not os.path.exists(path):
+                missing.append(match)
+                continue
+            if path.is_dir():
+                files = sorted(p for p in path.rglob("*") if p.is_file() and p.suffix.lower() in TEXT_SUFFIXES)
+                pairs = [(p, p.relative_to(path).with_suffix("")) for p in files]
+            else:
+                pairs = [(path, Path(path.stem))]
+            for file_path, rel in pairs:
+                key = str(file_path.resolve())
+                if key in seen:
+                    continue
+                seen.add(key)
+                name = str(rel)
+                while any(job.name == name for job in jobs):
+                    name += "_"
+                jobs.append(Job(name, str(file_path), file_path.read_text(encoding="utf-8", errors="replace")))
+    return jobs, missing
+
+
+def job_fingerprint(engine: TTSEngine, job: Job) -> str:
+    parts = (engine.name, engine.voice, engine.output_ext, normalize_text(job.text))
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def load_manifest(output_dir: Path) -> Dict[str, str]:
+    try:
+        with open(output_dir / MANIFEST_NAME, "r") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def save_manifest(output_dir: Path, manifest: Dict[str, str]) -> None:
+    tmp_path = output_dir / f"{MANIFEST_NAME}.part"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, output_dir / MANIFEST_NAME)
+
+
+def run_job(
+    engine: TTSEngine,
+    job: Job,
+    output_dir: Path,
+    manifest: Dict[str, str],
+    manifest_lock: threading.Lock,
+    force: bool,
+    cache: Optional[SynthesisCache],
+    workers: int,
+    cancel: Optional[CancelToken] = None,
+) -> JobResult:
+    output_path = output_dir / f"{job.name}.{engine.output_ext}"
+    fingerprint = job_fingerprint(engine, job)
+    with manifest_lock:
+        unchanged = manifest.get(job.name) == fingerprint
+    if not force and unchanged and output_path.exists():
+        return JobResult(job, str(output_path), "skipped")
+    if not job.text.strip():
+        return JobResult(job, str(output_path), "failed", error="empty input")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    try:
+        result = synthesize_text(engine, job.text, str(output_path), cache=cache, workers=workers, cancel=cancel)
+    except Exception as e:
+        return JobResult(job, str(output_path), "failed", time.perf_counter() - start, error=str(e))
+    seconds = time.perf_counter() - start
+    with manifest_lock:
+        manifest[job.name] = fingerprint
+    status = "cached" if result.cached else "converted"
+    return JobResult(job, str(output_path), status, seconds, audio_duration(str(output_path)))
+
+
+def run(args) -> int:
+    engine = get_engine(args.engine)
+    if engine is None:
+        print(f"Unknown TTS engine: {args.engine} (available: {', '.join(list_engines())})", file=sys.stderr)
+        return 2
+    missing = check_engine_dependencies(engine.name)
+    if missing:
+        print(f"{engine.name} is missing: {', '.join(missing)}", file=sys.stderr)
+        return 2
+    jobs, missing_inputs = collect_jobs(args.inputs)
+    for item in missing_inputs:
+        print(f"{item}: no such file", file=sys.stderr)
+    if not jobs:
+        print("No input files found", file=sys.stderr)
+        return 1
+    settings = load_settings()
+    removed = 0
+    if not args.raw:
+        # Skip-unchanged and the cache then key off the text that is actually spoken
+        normalizer = text_normalizer(settings)
+        for job in jobs:
+            normalized = normalizer.normalize(job.text, FORMATS_BY_SUFFIX.get(Path(job.source).suffix.lower()))
+            job.text = normalized.text
+            removed += normalized.removed_chars
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(output_dir)
+    manifest_lock = threading.Lock()
+    cache = None if args.no_cache else open_cache(settings.get("cache_max_mb", 200))
+    jobs_n = max(1, args.jobs)
+    # Split the cores between concurrent files and chunks within a file
+    workers = max(1, default_workers(engine) // jobs_n)
+
+    start = time.perf_counter()
+    results: List[JobResult] = []
+    cancel = CancelToken()
+    with ThreadPoolExecutor(max_workers=jobs_n) as pool:
+        futures = [
+            pool.submit(run_job, engine, job, output_dir, manifest, manifest_lock, args.force, cache, workers, cancel)
+            for job in jobs
+        ]
+        try:
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                detail = f" ({result.error})" if result.error else f" in {result.seconds:.2f}s"
+                if result.status == "skipped":
+                    detail = " (unchanged)"
+                print(f"{result.status:>9}  {result.job.source} -> {result.output_path}{detail}")
+        except KeyboardInterrupt:
+            # Stop the engine processes and downloads in flight rather than waiting for them
+            cancel.cancel()
+            for future in futures:
+                future.cancel()
+            raise
+    elapsed = time.perf_counter() - start
+    save_manifest(output_dir, manifest)
+
+    done = [r for r in results if r.status in ("converted", "cached")]
+    chars = sum(len(r.job.text) for r in done)
+    synth_seconds = sum(r.seconds for r in done)
+    audio_seconds = sum(r.audio_seconds for r in done)
+    failed = sum(1 for r in results if r.status == "failed")
+    skipped = sum(1 for r in results if r.status == "skipped")
+    print(f"Converted {len(done)} file(s), skipped {skipped}, failed {failed} in {elapsed:.2f}s with {jobs_n} job(s)")
+    if removed:
+        print(f"Text rules removed {removed:,} chars")
+    if done and elapsed > 0:
+        line = f"Throughput: {chars / elapsed:.0f} chars/s"
+        if audio_seconds > 0:
+            # Real-time factor: synthesis time per second of audio (lower is faster)
+            line += f", real-time factor {synth_seconds / audio_seconds:.3f}, {audio_seconds / elapsed:.1f}s of audio per second"
+        print(line)
+    return 1 if failed or missing_inputs else 0
+
+
+def add_parser(subparsers) -> None:
+    settings = load_settings()
+    parser = subparsers.add_parser("convert", help="Convert text files to audio files")
+    parser.add_argument("inputs", nargs="+", help="Text files, directories, glob patterns, or - for stdin")
+    parser.add_argument("-e", "--engine", default=settings.get("tts_engine", "gTTS"), help="TTS engine name")
+    parser.add_argument("-o", "--output-dir", default=".", help="Directory for the audio files")
+    parser.add_argument("-j", "--jobs", type=int, default=default_workers(), help="Files to convert in parallel")
+    parser.add_argument("-f", "--force", action="store_true", help="Re-synthesize inputs that haven't changed")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the synthesis cache")
+    parser.add_argument("--raw", action="store_true", help="Synthesize the text as-is, without the text rules")
+    parser.set_defaults(func=run)
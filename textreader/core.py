@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from tts_engines import engine_load_times, get_engine
+from tts_engines.base import TTSEngine
+from tts_engines.cache import SynthesisCache
+from tts_engines.cancel import CancelToken
+from tts_engines.capabilities import CapabilityCache
+from tts_engines.mp3util import mp3_duration
+from tts_engines.pipeline import PipelineStats, synthesize_parallel
+
+from .normalize import RULES, URL_STYLES, TextNormalizer
+
+SETTINGS_DIR = Path.home() / ".textReader"
+SETTINGS_FILE = SETTINGS_DIR / "settings.json"
+CACHE_DIR = SETTINGS_DIR / "cache"
+LATENCY_FILE = SETTINGS_DIR / "latency_stats.json"
+CAPABILITIES_FILE = SETTINGS_DIR / "capabilities.json"
+DEFAULT_SETTINGS = {"debug_mode": False, "playback_speed": 1.0, "tts_engine": "gTTS", "cache_max_mb": 200, "ui_cues": False,
+                    "model_warmup": True, "model_idle_minutes": 10, "model_memory_mb": 0, "model_workers": 0,
+                    "text_rules": list(RULES), "url_style": "domain"}
+
+
+def load_settings() -> dict:
+    settings = dict(DEFAULT_SETTINGS)
+    if SETTINGS_FILE.exists():
+        try:
+            with open(SETTINGS_FILE, "r") as f:
+                settings.update(json.load(f))
+        except Exception:
+            pass
+    return settings
+
+
+def text_normalizer(settings: dict) -> TextNormalizer:
+    """Build the text rules configured in settings; unknown names are ignored."""
+    rules = [rule for rule in settings.get("text_rules", RULES) if rule in RULES]
+    url_style = settings.get("url_style", "domain")
+    return TextNormalizer(rules, url_style if url_style in URL_STYLES else "domain")
+
+
+def open_cache(max_mb: float) -> SynthesisCache:
+    return SynthesisCache(CACHE_DIR, max_bytes=int(max_mb * 1024 * 1024))
+
+
+_capabilities: Optional[CapabilityCache] = None
+
+
+def capability_cache() -> CapabilityCache:
+    """Return the shared dependency probe cache, loading it on first use."""
+    global _capabilities
+    if _capabilities is None:
+        _capabilities = CapabilityCache(CAPABILITIES_FILE)
+    return _capabilities
+
+
+def probe_engine(engine_name: str) -> List[str]:
+    """Run the engine's own dependency check, bypassing the cache."""
+    engine = get_engine(engine_name)
+    if engine is None:
+        return [f"Unknown TTS engine: {engine_name}"]
+    return engine.check_dependencies()
+
+
+def check_engine_dependencies(engine_name: str, debug: bool = False, refresh: bool = False) -> List[str]:
+    """Check dependencies for the selected engine and return missing list.
+
+    Results come from the capability cache; the engine is only loaded and
+    probed when it has no entry for the current PATH/venv, or with refresh.
+    """
+    if debug:
+        print(f"🐛 [DEBUG] Checking dependencies for engine: {engine_name}")
+    cache = capability_cache()
+    cached = None if refresh else cache.cached(engine_name)
+    if cached is not None:
+        if debug:
+            print(f"🐛 [DEBUG] Cached deps for {engine_name}: {cached or 'all satisfied'}")
+        return cached
+    missing_deps = cache.probe(engine_name, lambda: probe_engine(engine_name))
+    if debug:
+        print(f"🐛 [DEBUG] Engine load time for {engine_name}: {engine_load_times().get(engine_name, 0.0):.3f}s")
+        if missing_deps:
+            print(f"🐛 [DEBUG] Missing deps for {engine_name}: {missing_deps}")
+        else:
+            print(f"🐛 [DEBUG] All deps satisfied for {engine_name}")
+    return missing_deps
+
+
+def refresh_engine_dependencies(engine_names: List[str], debug: bool = False) -> Dict[str, List[str]]:
+    """Forget all cached probes and probe engine_names again."""
+    capability_cache().refresh()
+    return {name: check_engine_dependencies(name, debug) for name in engine_names}
+
+
+def audio_duration(path: str) -> float:
+    """Return audio duration in seconds, or 0 if it can't be determined."""
+    try:
+        if path.endswith(".wav"):
+            with wave.open(path, "rb") as wf:
+                rate = wf.getframerate()
+                return wf.getnframes() / float(rate) if rate else 0.0
+        if path.endswith(".mp3"):
+            with open(path, "rb") as f:
+                duration = mp3_duration(f.read())
+            if duration:
+                return duration
+        # Not something the in-process parsers understand
+        if shutil.which("ffprobe") is None:
+            return 0.0
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "default=noprint_wrappers=1:nokey=1", path],
+            capture_output=True,
+            text=True,
+            timeout=5.0,
+            check=False,
+        )
+        return float(result.stdout.strip()) if result.stdout.strip() else 0.0
+    except Exception:
+        return 0.0
+
+
+@dataclass
+class SynthesisResult:
+    output_path: str
+    cached: bool
+    stats: Optional[PipelineStats] = None
+
+
+def synthesize_text(
+    engine: TTSEngine,
+    text: str,
+    output_path: str,
+    cache: Optional[SynthesisCache] = None,
+    workers: Optional[int] = None,
+    cancel: Optional[CancelToken] = None,
+) -> SynthesisResult:
+    """Synthesize text to output_path, serving it from the cache when possible.
+
+    Raises SynthesisCancelled, leaving output_path untouched, if cancel is cancelled first.
+    """
+    if cache is not None:
+        cached_path = cache.get(engine, text)
+        if cached_path:
+            tmp_path = f"{output_path}.part"
+            shutil.copyfile(cached_path, tmp_path)
+            os.replace(tmp_path, output_path)
+            return SynthesisResult(output_path, True)
+    stats = synthesize_parallel(engine, text, output_path, workers=workers, cancel=cancel)
+    if cache is not None:
+        try:
+            cache.put(engine, text, output_path)
+        except OSError:
+            pass
+    return SynthesisResult(output_path, False, stats)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# Each cue is a sequence of (frequency Hz, seconds) notes
+CUES: Dict[str, List[Tuple[float, float]]] = {
+    "error": [(400, 0.2)],
+    "start": [(660, 0.06), (880, 0.08)],
+    "done": [(880, 0.06), (660, 0.1)],
+    "queued": [(1000, 0.05)],
+}
+VOLUME = 0.5
+FADE_SECONDS = 0.005  # ramp each note in and out so it doesn't click
+
+
+def render(notes: List[Tuple[float, float]], sample_rate: int) -> np.ndarray:
+    """Return a cue as float samples in [-1, 1]."""
+    parts = []
+    for freq, seconds in notes:
+        t = np.arange(int(sample_rate * seconds)) / sample_rate
+        tone = np.sin(2 * np.pi * freq * t)
+        ramp = min(len(tone) // 2, int(sample_rate * FADE_SECONDS))
+        if ramp:
+            fade = np.linspace(0.0, 1.0, ramp)
+            tone[:ramp] *= fade
+            tone[-ramp:] *= fade[::-1]
+        parts.append(tone)
+    return np.concatenate(parts) * VOLUME
+
+
+class CueBank:
+    """UI sounds rendered once into mixer Sounds, played on a reserved channel.
+
+    The music stream carries speech, so cues never load or stop it; a cue
+    started while another is playing replaces it.
+    """
+
+    def __init__(self, mixer, channel_id: int = 0) -> None:
+        sample_rate, size, channels = mixer.get_init()
+        if size != -16:
+            raise ValueError(f"unsupported mixer sample format {size}")
+        # Reserved channels are never picked for Sound.play(), so the cue channel stays free
+        mixer.set_reserved(channel_id + 1)
+        self.channel = mixer.Channel(channel_id)
+        self.sounds = {}
+        for name, notes in CUES.items():
+            pcm = (render(notes, sample_rate) * 32767).astype(np.int16)
+            frames = np.repeat(pcm[:, None], channels, axis=1)
+            self.sounds[name] = mixer.Sound(buffer=frames.tobytes())
+
+    def play(self, name: str) -> None:
+        self.channel.play(self.sounds[name])
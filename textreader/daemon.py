@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import hmac
+import json
+import os
+import queue
+import secrets
+import socketserver
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+MAX_BODY_BYTES = 5 * 1024 * 1024
+AUDIO_TYPES = {"mp3": "audio/mpeg", "wav": "audio/wav"}
+# Host headers a local client sends; anything else is a browser tricked by DNS rebinding
+LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "[::1]")
+
+
+class QueueFull(Exception):
+    pass
+
+
+@dataclass
+class Job:
+    kind: str  # "speak" or "synthesize"
+    text: str
+    engine: Optional[str]
+    future: Future = field(default_factory=Future)
+
+
+class SpeechDaemon:
+    """Local speak/synthesize API over HTTP on 127.0.0.1 and/or a Unix socket.
+
+    Jobs go through bounded queues; when one is full requests are rejected
+    with 429 instead of piling up. Speak jobs are served by a single worker,
+    so they are read one after another in the order they arrived;
+    synthesize jobs by a fixed set of ``workers``. play/pause/stop/status
+    are answered immediately, and stop also drops the queued speak jobs.
+
+    ``speak(text, engine)`` (returning once the text has been heard) and ``synthesize(text, engine) -> (bytes, ext)``
+    do the actual work; ``play()``, ``pause()``, ``stop()`` and
+    ``status() -> dict`` are forwarded as-is. ``seek(request)`` moves
+    playback to a position, fraction or sentence and ``index() -> dict``
+    returns the sentence timings of what is playing. ``on_queued(job)`` is
+    called when a speak request is accepted.
+
+    Every request must carry ``Authorization: Bearer <token>``, where the
+    token is made anew for each session and written to ``token_file``
+    (readable by the owner only). Requests with a Host other than loopback,
+    or with an Origin header (i.e. sent by a web page), are refused.
+    """
+
+    def __init__(
+        self,
+        speak: Callable[[str, Optional[str]], Any],
+        synthesize: Callable[[str, Optional[str]], Tuple[bytes, str]],
+        play: Callable[[], Any],
+        pause: Callable[[], Any],
+        stop: Callable[[], Any],
+        status: Callable[[], Dict[str, Any]],
+        max_queue: int = 8,
+        workers: int = 2,
+        on_queued: Optional[Callable[[Job], Any]] = None,
+        seek: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        index: Optional[Callable[[], Dict[str, Any]]] = None,
+        token_file: Optional[str] = None,
+    ) -> None:
+        self.speak = speak
+        self.synthesize = synthesize
+        self.play = play
+        self.pause = pause
+        self.stop = stop
+        self.status = status
+        self.on_queued = on_queued
+        self.seek = seek
+        self.index = index
+        self.token = secrets.token_urlsafe(32)
+        self.token_file = token_file
+        if token_file is not None:
+            write_token(token_file, self.token)
+        self.jobs: "queue.Queue[Optional[Job]]" = queue.Queue(maxsize=max_queue)
+        self.speech: "queue.Queue[Optional[Job]]" = queue.Queue(maxsize=max_queue)
+        self.rejected = 0
+        self.completed = 0
+        self._count_lock = threading.Lock()
+        self._servers: List[socketserver.BaseServer] = []
+        self._workers = [
+            threading.Thread(target=self._work, args=(self.jobs,), name=f"daemon-worker-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        # One reader: a second speak worker would cut off the text being read
+        self._workers.append(threading.Thread(target=self._work, args=(self.speech,), name="daemon-speaker", daemon=True))
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, kind: str, text: str, engine: Optional[str] = None) -> Job:
+        job = Job(kind, text, engine)
+        try:
+            (self.speech if kind == "speak" else self.jobs).put_nowait(job)
+        except queue.Full:
+            with self._count_lock:
+                self.rejected += 1
+            raise QueueFull()
+        if self.on_queued is not None and kind == "speak":
+            self.on_queued(job)
+        return job
+
+    def drop_speech(self) -> int:
+        """Cancel the speak jobs still waiting; returns how many were dropped."""
+        dropped = 0
+        while True:
+            try:
+                job = self.speech.get_nowait()
+            except queue.Empty:
+                return dropped
+            if job is None:
+                # A shutdown marker: leave it for the worker
+                self.speech.put_nowait(None)
+                return dropped
+            if job.future.cancel():
+                dropped += 1
+
+    def _work(self, jobs: "queue.Queue[Optional[Job]]") -> None:
+        while True:
+            job = jobs.get()
+            if job is None:
+                return
+            if not job.future.set_running_or_notify_cancel():
+                continue
+            try:
+                if job.kind == "speak":
+                    job.future.set_result(self.speak(job.text, job.engine))
+                else:
+                    job.future.set_result(self.synthesize(job.text, job.engine))
+            except Exception as e:
+                job.future.set_exception(e)
+            finally:
+                with self._count_lock:
+                    self.completed += 1
+
+    def daemon_status(self) -> Dict[str, Any]:
+        status = dict(self.status())
+        status.update(
+            {
+                "queue_depth": self.jobs.qsize() + self.speech.qsize(),
+                "speak_queue_depth": self.speech.qsize(),
+                "queue_limit": self.jobs.maxsize,
+                "rejected": self.rejected,
+                "completed": self.completed,
+            }
+        )
+        return status
+
+    def serve_http(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        server = ThreadingHTTPServer((host, port), self._handler_class())
+        server.daemon_threads = True
+        self._serve(server)
+        return server
+
+    def serve_unix(self, path: str) -> socketserver.BaseServer:
+        if os.path.exists(path):
+            os.remove(path)
+        # Create the socket owner-only from the start, so no one can connect before the chmod
+        umask = os.umask(0o177)
+        try:
+            server = _ThreadingUnixHTTPServer(path, self._handler_class())
+        finally:
+            os.umask(umask)
+        os.chmod(path, 0o600)
+        self._serve(server)
+        return server
+
+    def _serve(self, server: socketserver.BaseServer) -> None:
+        self._servers.append(server)
+        threading.Thread(target=server.serve_forever, name="daemon-server", daemon=True).start()
+
+    def shutdown(self) -> None:
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+            if isinstance(server, _ThreadingUnixHTTPServer):
+                try:
+                    os.remove(server.server_address)
+                except OSError:
+                    pass
+        if self.token_file is not None:
+            try:
+                os.remove(self.token_file)
+            except OSError:
+                pass
+        for jobs, count in ((self.jobs, len(self._workers) - 1), (self.speech, 1)):
+            for _ in range(count):
+                try:
+                    jobs.put_nowait(None)
+                except queue.Full:
+                    break
+
+    def _handler_class(self):
+        daemon = self
+
+        class Handler(_RequestHandler):
+            pass
+
+        Handler.daemon = daemon
+        return Handler
+
+
+def write_token(path: str, token: str) -> None:
+    """Write the session token to path, readable and writable by the owner only."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        # O_CREAT's mode doesn't apply to a file left over from an earlier session
+        os.fchmod(f.fileno(), 0o600)
+        f.write(token)
+
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    daemon: SpeechDaemon
+    protocol_version = "HTTP/1.1"
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address
+        if isinstance(self.client_address, tuple):
+            return super().address_string()
+        return "unix"
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def _send(self, code: int, body: bytes, content_type: str = "application/json") -> None:
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, code: int, payload: Dict[str, Any]) -> None:
+        self._send(code, json.dumps(payload).encode("utf-8"))
+
+    def _reject(self, code: int, error: str) -> None:
+        # The body may be unread, so the connection can't carry another request
+        self.close_connection = True
+        body = json.dumps({"error": error}).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Connection", "close")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _authorized(self) -> bool:
+        """Refuse browsers and anyone without the session token; True if the request may proceed."""
+        if self.headers.get("Origin") is not None:
+            self._reject(403, "cross-origin requests are not allowed")
+            return False
+        host = (self.headers.get("Host") or "").lower()
+        if host.rsplit(":", 1)[0] not in LOOPBACK_HOSTS and host not in LOOPBACK_HOSTS:
+            self._reject(403, "host not allowed")
+            return False
+        scheme, _, token = (self.headers.get("Authorization") or "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(token.strip().encode(), self.daemon.token.encode()):
+            self._reject(401, "missing or wrong token")
+            return False
+        return True
+
+    def _read_body(self) -> Optional[bytes]:
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._reject(400, "invalid Content-Length")
+            return None
+        if length > MAX_BODY_BYTES:
+            self._reject(413, "request body too large")
+            return None
+        return self.rfile.read(length) if length else b""
+
+    def _read_request(self) -> Optional[Tuple[str, Optional[str]]]:
+        body = self._read_body()
+        if body is None:
+            return None
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            try:
+                data = json.loads(body or b"{}")
+            except ValueError:
+                self._send_json(400, {"error": "invalid JSON"})
+                return None
+            if not isinstance(data, dict):
+                self._send_json(400, {"error": "expected a JSON object"})
+                return None
+            text, engine = data.get("text", ""), data.get("engine")
+            if not isinstance(text, str) or not (engine is None or isinstance(engine, str)):
+                self._send_json(400, {"error": "text and engine must be strings"})
+                return None
+        else:
+            text, engine = body.decode("utf-8", errors="replace"), None
+        if not text.strip():
+            self._send_json(400, {"error": "no text"})
+            return None
+        return text, engine
+
+    def _seek(self) -> None:
+        body = self._read_body()
+        if body is None:
+            return
+        try:
+            request = json.loads(body or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("expected a JSON object")
+            self.daemon.seek(request)
+        except ValueError as e:
+            self._send_json(400, {"error": str(e) or "invalid JSON"})
+            return
+        self._send_json(200, self.daemon.daemon_status())
+
+    def do_GET(self) -> None:
+        if not self._authorized():
+            return
+        if self.path == "/status":
+            self._send_json(200, self.daemon.daemon_status())
+        elif self.path == "/index" and self.daemon.index is not None:
+            self._send_json(200, self.daemon.index())
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self) -> None:
+        if not self._authorized():
+            return
+        if self.path in ("/play", "/pause", "/stop"):
+            if self._read_body() is None:
+                return
+            if self.path == "/stop":
+                self.daemon.drop_speech()
+            getattr(self.daemon, self.path[1:])()
+            self._send_json(200, self.daemon.daemon_status())
+            return
+        if self.path == "/seek" and self.daemon.seek is not None:
+            self._seek()
+            return
+        if self.path not in ("/speak", "/synthesize"):
+            self._send_json(404, {"error": "not found"})
+            return
+        request = self._read_request()
+        if request is None:
+            return
+        text, engine = request
+        try:
+            job = self.daemon.submit(self.path[1:], text, engine)
+        except QueueFull:
+            self._send_json(429, {"error": "queue full", "queue_limit": self.daemon.jobs.maxsize})
+            return
+        if job.kind == "speak":
+            self._send_json(202, {"queued": True, "queue_depth": self.daemon.speech.qsize()})
+            return
+        try:
+            data, ext = job.future.result()
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+            return
+        self._send(200, data, AUDIO_TYPES.get(ext, "application/octet-stream"))
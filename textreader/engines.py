@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from tts_engines import list_engines
+
+from .core import capability_cache, check_engine_dependencies
+
+
+def add_parser(subparsers) -> None:
+    parser = subparsers.add_parser("engines", help="List TTS engines and their missing dependencies")
+    parser.add_argument("--refresh", action="store_true", help="Probe every engine again instead of using cached results")
+    parser.set_defaults(func=run)
+
+
+def run(args) -> int:
+    if args.refresh:
+        capability_cache().refresh()
+    for name in list_engines():
+        missing = check_engine_dependencies(name)
+        print(f"{name}: {'missing ' + ', '.join(missing) if missing else 'ok'}")
+    return 0
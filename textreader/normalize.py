@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import html
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+# Applied in this order; each is optional
+RULES = ("code", "markup", "urls", "symbols", "whitespace", "duplicate_lines")
+URL_STYLES = ("domain", "drop")
+# What the input is written in; None leaves it to detection
+FORMATS = ("plain", "markdown", "html")
+
+# Every pattern is anchored on a character its repeated part can't contain,
+# so a scan never runs past the next candidate and the whole pass stays linear.
+_FENCE_RE = re.compile(r"\s*(```|~~~)")
+_HEADING_RE = re.compile(r"\s{0,3}#{1,6}\s+")
+_BULLET_RE = re.compile(r"\s*(?:[-*+•]|\d{1,3}[.)])\s+")
+_QUOTE_RE = re.compile(r"\s*(?:>\s?)+")
+_LINK_RE = re.compile(r"!?\[([^\[\]\n]*)\]\([^()\s]*\)")
+# A tag: its name right after "<", then attributes; in HTML and Markdown an attribute may be a bare name...
+_ATTR_VALUE = r"""\s*=\s*(?:"[^"<>\n]*"|'[^'<>\n]*'|[^\s"'<>=`]+)"""
+_TAG_RE = re.compile(r"</?[A-Za-z][\w:-]*(?:\s+[A-Za-z_:][\w:.-]*(?:" + _ATTR_VALUE + r")?)*\s*/?>")
+# ...while in plain text the name must be an HTML element's and every attribute needs a value,
+# so "if x<y and y>z" and "vector<int>" are not tags
+_HTML_ELEMENTS = (
+    "a|abbr|b|blockquote|body|br|code|dd|del|div|dl|dt|em|font|h[1-6]|head|hr|html|i|img|ins|kbd|li|mark|"
+    "ol|p|pre|q|s|small|span|strong|sub|sup|table|tbody|td|th|thead|tr|u|ul"
+)
+_PLAIN_TAG_RE = re.compile(
+    r"</?(?:" + _HTML_ELEMENTS + r")(?![\w:-])(?:\s+[A-Za-z_:][\w:.-]*" + _ATTR_VALUE + r")*\s*/?>",
+    re.IGNORECASE,
+)
+# Signs that text is HTML or Markdown: a closing tag, comment or doctype; a heading, fence or link
+_HTML_HINT_RE = re.compile(r"</[A-Za-z][\w:-]*\s*>|<!--|<!doctype\s|<br\s*/?>", re.IGNORECASE)
+_MARKDOWN_HINT_RE = re.compile(r"^ {0,3}(?:#{1,6}\s|```|~~~)|\]\([^()\s]*\)", re.MULTILINE)
+_EMPHASIS_RE = re.compile(r"\*\*|__|`|(?<!\w)[*_](?=\w)|(?<=\w)[*_](?!\w)")
+_URL_RE = re.compile(r"\b(?:https?://|www\.)[^\s<>\"'()\[\]{}]*[^\s<>\"'()\[\]{}.,;:!?]")
+_URL_DROP_RE = re.compile(r"\s*" + _URL_RE.pattern)
+_HOST_RE = re.compile(r"(?:https?://)?(?:www\.)?([^/:?#]+)")
+_BOX_RE = re.compile(r"[\u2500-\u259f\u25a0-\u25ff]+")  # box drawing, blocks, geometric shapes
+_RULER_RE = re.compile(r"([^\w\s])\1{3,}")
+_TABLE_RE = re.compile(r"\s*\|")
+_INVISIBLE_RE = re.compile(r"[\u200b-\u200f\u2060\ufeff\x00-\x08\x0b-\x1f\x7f]")
+_ALNUM_RE = re.compile(r"[^\W_]")
+_TERMINAL = ".!?:;"
+# A line of its own like "Page 3", "3 of 12", "3/12" or "- 3 -" ends a page, as does a form feed
+_PAGE_NUMBER_RE = re.compile(
+    r"\s*(?:page\s+\d{1,4}(?:\s*(?:of|/)\s*\d{1,4})?|\d{1,4}\s*(?:of|/)\s*\d{1,4}|[-–—]\s*\d{1,4}\s*[-–—])\s*$",
+    re.IGNORECASE,
+)
+_DIGITS_RE = re.compile(r"\d+")
+_LINE_ENDS = "\r\n\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+# Lines up to this long without sentence punctuation can be page headers or footers
+DUPLICATE_MAX_CHARS = 80
+# Only the first and last lines of a page are looked at
+EDGE_LINES = 2
+# ...and compared with those of the pages just before
+EDGE_PAGES = 2
+
+
+@dataclass
+class NormalizedText:
+    text: str
+    original_chars: int
+    removed: Dict[str, int] = field(default_factory=dict)  # chars removed per rule
+
+    @property
+    def removed_chars(self) -> int:
+        return self.original_chars - len(self.text)
+
+    def summary(self) -> str:
+        parts = [f"{rule} {count:,}" for rule, count in self.removed.items() if count > 0]
+        return ", ".join(parts) or "nothing"
+
+
+class _PageEdges:
+    """Finds running headers and footers: short lines repeated at the top or bottom of pages.
+
+    Only the EDGE_LINES first and last lines of a page are candidates, and
+    one is dropped when the same line (ignoring case and numbers) was also
+    at the edge of one of the EDGE_PAGES pages before. Text without page
+    breaks is left alone, so refrains and repeated answers are still read.
+    """
+
+    def __init__(self, out: List[str], removed: Dict[str, int]) -> None:
+        self.out = out
+        self.removed = removed
+        self.previous: Deque[Set[str]] = deque(maxlen=EDGE_PAGES)
+        self.current: Set[str] = set()
+        self.lines = 0  # lines on this page so far
+        self.last: Deque[Tuple[int, Optional[str]]] = deque(maxlen=EDGE_LINES)  # (index in out, key)
+
+    @staticmethod
+    def _key(line: str) -> Optional[str]:
+        if len(line) > DUPLICATE_MAX_CHARS or line[-1:] in _TERMINAL:
+            return None
+        return _DIGITS_RE.sub("#", line.lower())
+
+    def _repeated(self, key: str) -> bool:
+        self.current.add(key)
+        return any(key in page for page in self.previous)
+
+    def is_header(self, line: str) -> bool:
+        """True if line, about to be added, is a header repeated from earlier pages."""
+        self.lines += 1
+        key = self._key(line) if self.lines <= EDGE_LINES else None
+        if key is not None and self._repeated(key):
+            self.removed["duplicate_lines"] += len(line) + 1
+            return True
+        return False
+
+    def added(self, line: str) -> None:
+        self.last.append((len(self.out) - 1, self._key(line)))
+        if _PAGE_NUMBER_RE.match(line):
+            self.end_page()
+
+    def end_page(self) -> None:
+        """Drop repeated footers from the page that just ended."""
+        for index, key in self.last:
+            if key is not None and self._repeated(key) and self.out[index]:
+                self.removed["duplicate_lines"] += len(self.out[index]) + 1
+                self.out[index] = ""
+        self.previous.append(self.current)
+        self.current = set()
+        self.lines = 0
+        self.last.clear()
+
+
+class TextNormalizer:
+    """Turn pasted text into what is worth speaking.
+
+    Fenced code blocks are skipped, Markdown/HTML markup is reduced to its
+    text, URLs are shortened to their host (or dropped), box-drawing and
+    ruler lines are removed, whitespace is collapsed and page headers and
+    footers repeated across page breaks are dropped. Headings and list items
+    are kept as separate sentences. Runs in one pass over the lines, linear
+    in the input size; a code fence that is never closed isn't code, and
+    the text after it is read.
+
+    Any tag is removed from HTML and Markdown, which ``normalize`` detects
+    unless told the format. In plain text only HTML elements whose
+    attributes all have values are, so "x<y and y>z" or "vector<int>" are
+    kept.
+    """
+
+    def __init__(self, rules: Iterable[str] = RULES, url_style: str = "domain") -> None:
+        rules = set(rules)
+        unknown = rules - set(RULES)
+        if unknown:
+            raise ValueError(f"Unknown text rules: {', '.join(sorted(unknown))}")
+        self.rules = tuple(rule for rule in RULES if rule in rules)
+        if url_style not in URL_STYLES:
+            raise ValueError(f"Unknown URL style: {url_style}")
+        self.url_style = url_style
+
+    def _url(self, match: "re.Match[str]") -> str:
+        if self.url_style == "drop":
+            return ""
+        return _HOST_RE.match(match.group(0)).group(1)
+
+    def _markup(self, line: str, tag_re: "re.Pattern[str]") -> Tuple[str, bool]:
+        """Strip markup from a line; True if it starts a heading or list item."""
+        block = False
+        match = _HEADING_RE.match(line) or _BULLET_RE.match(line)
+        if match:
+            line = line[match.end():]
+            block = True
+        else:
+            match = _QUOTE_RE.match(line)
+            if match and match.group(0).strip():
+                line = line[match.end():]
+        if "[" in line:
+            line = _LINK_RE.sub(r"\1", line)
+        if "<" in line:
+            line = tag_re.sub("", line)
+        if "&" in line:
+            line = html.unescape(line)
+        return _EMPHASIS_RE.sub("", line), block
+
+    def _symbols(self, line: str) -> str:
+        line = _BOX_RE.sub(" ", line)
+        line = _RULER_RE.sub(" ", line)
+        if _TABLE_RE.match(line):
+            line = ", ".join(cell.strip() for cell in line.split("|") if cell.strip())
+        return line if _ALNUM_RE.search(line) else ""
+
+    def _line(
+        self,
+        raw: str,
+        out: List[str],
+        removed: Dict[str, int],
+        edges: Optional[_PageEdges],
+        tag_re: "re.Pattern[str]",
+    ) -> None:
+        rules = self.rules
+        if not raw.strip():
+            out.append("")
+            return
+        line = raw
+        block = False
+        if "markup" in rules:
+            before = len(line)
+            line, block = self._markup(line, tag_re)
+            removed["markup"] += before - len(line)
+        if "urls" in rules and ("://" in line or "www." in line):
+            before = len(line)
+            line = (_URL_DROP_RE if self.url_style == "drop" else _URL_RE).sub(self._url, line)
+            removed["urls"] += before - len(line)
+        if "symbols" in rules:
+            before = len(line)
+            line = self._symbols(line)
+            removed["symbols"] += before - len(line)
+        if "whitespace" in rules:
+            line = " ".join(_INVISIBLE_RE.sub("", line).split())
+        if not line.strip():
+            return
+        if edges is not None and edges.is_header(line):
+            return
+        if block:
+            # A blank line makes the pipeline read it as a sentence of its own
+            out.append("")
+            out.append(line)
+            out.append("")
+        else:
+            out.append(line)
+        if edges is not None:
+            edges.added(line)
+
+    def normalize(self, text: str, format: Optional[str] = None) -> NormalizedText:
+        """Apply the rules to text, written in format (one of FORMATS; None = detect it)."""
+        if format is None:
+            format = detect_format(text)
+        elif format not in FORMATS:
+            raise ValueError(f"Unknown text format: {format}")
+        tag_re = _PLAIN_TAG_RE if format == "plain" else _TAG_RE
+        rules = self.rules
+        removed = dict.fromkeys(rules, 0)
+        out: List[str] = []
+        edges = _PageEdges(out, removed) if "duplicate_lines" in rules else None
+        fence = None
+        fenced: List[Tuple[str, bool]] = []  # lines after an opening fence, until it is closed
+        for raw in text.splitlines(keepends=True):
+            page_break = raw.endswith("\f")
+            raw = raw.rstrip(_LINE_ENDS)
+            if "code" in rules:
+                match = _FENCE_RE.match(raw)
+                if fence is not None:
+                    if match and match.group(1) == fence:
+                        removed["code"] += sum(len(line) + 1 for line, _ in fenced) + len(raw) + 1
+                        fence = None
+                        fenced = []
+                    else:
+                        fenced.append((raw, page_break))
+                    continue
+                if match:
+                    fence = match.group(1)
+                    removed["code"] += len(raw) + 1
+                    continue
+            self._line(raw, out, removed, edges, tag_re)
+            if page_break and edges is not None:
+                edges.end_page()
+        # Never closed: the fence was a stray one, so what follows it is read
+        for raw, page_break in fenced:
+            self._line(raw, out, removed, edges, tag_re)
+            if page_break and edges is not None:
+                edges.end_page()
+        if edges is not None:
+            edges.end_page()
+        if "whitespace" in rules:
+            lines: List[str] = []
+            for line in out:
+                if line or (lines and lines[-1]):
+                    lines.append(line)
+            result = "\n".join(lines).strip("\n")
+        else:
+            result = "\n".join(out)
+        normalized = NormalizedText(result, len(text), removed)
+        if "whitespace" in rules:
+            other = sum(count for rule, count in removed.items() if rule != "whitespace")
+            removed["whitespace"] = max(0, normalized.removed_chars - other)
+        return normalized
+
+
+def detect_format(text: str) -> str:
+    """Guess whether text is "html", "markdown" or "plain" from the markup it contains."""
+    if _HTML_HINT_RE.search(text):
+        return "html"
+    if _MARKDOWN_HINT_RE.search(text):
+        return "markdown"
+    return "plain"
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable, List, Optional
+
+STOPPED = "stopped"
+PLAYING = "playing"
+PAUSED = "paused"
+
+
+class PlaybackState:
+    """Playback state shared by the audio threads and the UI.
+
+    Every transition bumps ``version``, wakes threads blocked in
+    ``wait_change`` and is pushed to listeners, so nothing has to poll to
+    notice a stop, a pause or the end of a clip. ``advance()`` bumps
+    ``track`` when the mixer moves on to a queued track. Other state the
+    waiters depend on is changed under ``cond`` followed by ``notify()``,
+    and waited for with ``wait_for``.
+    """
+
+    def __init__(self) -> None:
+        self.cond = threading.Condition()
+        self.state = STOPPED
+        self.version = 0
+        self.track = 0
+        self._listeners: List[Callable[[str], None]] = []
+
+    def add_listener(self, callback: Callable[[str], None]) -> None:
+        """Call callback(state) after every transition (from the transitioning thread)."""
+        self._listeners.append(callback)
+
+    def snapshot(self):
+        """Return (state, version) read atomically."""
+        with self.cond:
+            return self.state, self.version
+
+    def set(self, state: str, if_version: Optional[int] = None) -> bool:
+        """Move to state; with if_version, only if nothing else changed it since."""
+        with self.cond:
+            if if_version is not None and if_version != self.version:
+                return False
+            self.state = state
+            self.version += 1
+            self.cond.notify_all()
+        for callback in self._listeners:
+            try:
+                callback(state)
+            except Exception:
+                pass
+        return True
+
+    def advance(self) -> None:
+        """Note that the mixer moved on to the queued track."""
+        with self.cond:
+            self.track += 1
+            self.cond.notify_all()
+
+    def notify(self) -> None:
+        """Wake the wait_for callers after changing something their predicates read."""
+        with self.cond:
+            self.cond.notify_all()
+
+    def wait_change(self, version: int, timeout: Optional[float] = None) -> bool:
+        """Block until the version moves past version; False if the timeout ran out first."""
+        with self.cond:
+            return self.cond.wait_for(lambda: self.version != version, timeout)
+
+    def wait_for(self, predicate: Callable[[], bool], timeout: Optional[float] = None) -> bool:
+        """Block until predicate() holds, re-checking it on every transition and notify(); False on timeout."""
+        with self.cond:
+            return self.cond.wait_for(predicate, timeout)
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from tts_engines.base import TTSEngine
+from tts_engines.cache import SynthesisCache
+from tts_engines.cancel import CancelToken, SynthesisCancelled
+from tts_engines.pipeline import synthesize_parallel
+
+# Added to the speculating thread's nice value, and inherited by the engine processes it starts
+NICE_INCREMENT = 10
+# Finished speculations remembered for the hit counter; older ones count as wasted
+MAX_UNREAD = 16
+
+
+class _Speculation:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.key: Optional[str] = None  # cache key, once the text is normalized
+        self.cancel = CancelToken()
+
+
+def lower_thread_priority(increment: int = NICE_INCREMENT) -> bool:
+    """Make the calling thread nicer (Linux, where nice is per thread); False where unsupported."""
+    get_native_id = getattr(threading, "get_native_id", None)
+    if get_native_id is None or not hasattr(os, "setpriority"):
+        return False
+    try:
+        tid = get_native_id()
+        os.setpriority(os.PRIO_PROCESS, tid, os.getpriority(os.PRIO_PROCESS, tid) + increment)
+        return True
+    except OSError:
+        return False
+
+
+class Prefetcher:
+    """Speculatively synthesizes newly selected text into the cache, so reading it starts at once.
+
+    A watcher thread calls ``read_text()`` each time ``changes()`` (an
+    object with ``wait(timeout) -> bool`` and ``close()``, such as
+    SelectionEvents) reports a change and once more ``debounce`` seconds
+    later; without it, or if it raises OSError, every ``interval`` seconds.
+    Text that stays the same for ``debounce`` seconds is normalized with
+    ``normalize(text)`` and, unless it is longer than ``max_chars`` or
+    already cached, synthesized with ``get_engine()`` one chunk at a time on
+    a low-priority thread. It waits while ``busy()`` (a read is being
+    synthesized), woken through ``busy_changed`` (a Condition notified when
+    busy() may have changed) if given, and is cancelled as soon as the text
+    changes again or a read starts. The text present when the watcher
+    starts is never synthesized.
+
+    ``record_read(engine, text)`` is called for every hotkey read and counts
+    a hit when that text was speculated in full; ``stats()`` reports the hit
+    rate next to the time spent on speculations that were never read.
+    """
+
+    def __init__(
+        self,
+        cache: SynthesisCache,
+        read_text: Callable[[], str],
+        get_engine: Callable[[], Optional[TTSEngine]],
+        normalize: Callable[[str], str] = lambda text: text,
+        busy: Callable[[], bool] = lambda: False,
+        debounce: float = 1.0,
+        max_chars: int = 5000,
+        interval: float = 0.5,
+        changes: Optional[Callable[[], Any]] = None,
+        busy_changed: Optional[threading.Condition] = None,
+    ) -> None:
+        self.cache = cache
+        self.read_text = read_text
+        self.get_engine = get_engine
+        self.normalize = normalize
+        self.busy = busy
+        self.debounce = debounce
+        self.max_chars = max_chars
+        self.interval = interval
+        self.changes = changes
+        self.busy_changed = busy_changed
+        self.on_error: Optional[Callable[[Exception], Any]] = None
+        self.speculated = 0
+        self.completed = 0
+        self.cancelled = 0
+        self.skipped = 0  # too long, empty or already cached
+        self.hits = 0
+        self.misses = 0
+        self.late = 0  # misses whose text was still being speculated
+        self.synth_seconds = 0.0
+        self.hit_seconds = 0.0
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()  # one speculation synthesizes at a time
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._events: Any = None
+        self._seen: Optional[str] = None
+        self._seen_at = 0.0
+        self._handled = True  # the text in _seen has been speculated (or must not be)
+        self._job: Optional[_Speculation] = None
+        self._unread: "OrderedDict[str, float]" = OrderedDict()  # cache key -> synthesis seconds
+
+    def start(self) -> "Prefetcher":
+        self._stopped.clear()
+        if self._thread is None or not self._thread.is_alive():
+            self._seen = None
+            self._thread = threading.Thread(target=self._watch, name="prefetch watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        events = self._events
+        if events is not None:
+            events.close()
+        self.cancel()
+
+    def cancel(self) -> None:
+        """Cancel the speculation in flight, e.g. because a read needs the CPU."""
+        with self._lock:
+            if self._job is not None:
+                self._job.cancel.cancel()
+                self._job = None
+
+    def _watch(self) -> None:
+        events = None
+        if self.changes is not None:
+            try:
+                events = self._events = self.changes()
+            except OSError:
+                pass
+        if events is None:
+            while not self._stopped.wait(self.interval):
+                self._read()
+            return
+        self._read()
+        settling = False
+        while not self._stopped.is_set():
+            # Read again once the text has had debounce seconds to settle, so its speculation starts
+            changed = events.wait(self.debounce if settling else None)
+            if self._stopped.is_set():
+                break
+            if changed or settling:
+                settling = changed
+                self._read()
+        self._events = None
+
+    def _read(self) -> None:
+        try:
+            text = self.read_text()
+        except Exception:
+            return
+        self.observe(text or "")
+
+    def observe(self, text: str, now: Optional[float] = None) -> None:
+        """Feed the current selection; starts a speculation once it has settled."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if text != self._seen:
+                first = self._seen is None
+                self._seen, self._seen_at, self._handled = text, now, first
+                if self._job is not None:
+                    # The selection moved on: what was being synthesized is no longer wanted
+                    self._job.cancel.cancel()
+                    self._job = None
+                return
+            if self._handled or not text.strip() or now - self._seen_at < self.debounce:
+                return
+            self._handled = True
+            job = self._job = _Speculation(text)
+        threading.Thread(target=self._speculate, args=(job,), name="prefetch", daemon=True).start()
+
+    def _speculate(self, job: _Speculation) -> None:
+        lower_thread_priority()
+        try:
+            with self._run_lock:
+                self._run(job)
+        finally:
+            with self._lock:
+                if self._job is job:
+                    self._job = None
+
+    def _wake_busy(self) -> None:
+        with self.busy_changed:
+            self.busy_changed.notify_all()
+
+    def _run(self, job: _Speculation) -> None:
+        if self.busy_changed is not None:
+            with job.cancel.on_cancel(self._wake_busy):
+                with self.busy_changed:
+                    self.busy_changed.wait_for(lambda: job.cancel.cancelled or not self.busy())
+        while self.busy() and not job.cancel.cancelled:
+            job.cancel.wait(self.interval)
+        engine = self.get_engine()
+        if job.cancel.cancelled or engine is None:
+            return
+        text = self.normalize(job.text)
+        if not text.strip() or len(text) > self.max_chars or self.cache.contains(engine, text):
+            with self._lock:
+                self.skipped += 1
+            return
+        job.key = self.cache.key_for(engine, text)
+        with self._lock:
+            self.speculated += 1
+        work_dir = tempfile.mkdtemp(prefix="textreader-prefetch-")
+        start = time.monotonic()
+        try:
+            output_path = os.path.join(work_dir, f"prefetch.{engine.output_ext}")
+            synthesize_parallel(engine, text, output_path, workers=1, cancel=job.cancel)
+            self.cache.put(engine, text, output_path)
+        except SynthesisCancelled:
+            with self._lock:
+                self.cancelled += 1
+                self.synth_seconds += time.monotonic() - start
+            return
+        except Exception as e:
+            with self._lock:
+                self.synth_seconds += time.monotonic() - start
+            if self.on_error is not None:
+                self.on_error(e)
+            return
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        seconds = time.monotonic() - start
+        with self._lock:
+            self.completed += 1
+            self.synth_seconds += seconds
+            self._unread[job.key] = seconds
+            while len(self._unread) > MAX_UNREAD:
+                self._unread.popitem(last=False)
+
+    def record_read(self, engine: TTSEngine, text: str) -> bool:
+        """Count a read of text (after the text rules) as a hit or miss, and cancel any speculation."""
+        key = self.cache.key_for(engine, text)
+        with self._lock:
+            job = self._job
+            if job is not None:
+                job.cancel.cancel()
+                self._job = None
+            # The selection being read shouldn't be speculated again afterwards
+            self._handled = True
+            seconds = self._unread.pop(key, None)
+            if seconds is not None:
+                self.hits += 1
+                self.hit_seconds += seconds
+                return True
+            self.misses += 1
+            if job is not None and (job.key is None or job.key == key):
+                self.late += 1
+            return False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            reads = self.hits + self.misses
+            return {
+                "reads": reads,
+                "hits": self.hits,
+                "misses": self.misses,
+                "late": self.late,
+                "hit_rate": self.hits / reads if reads else 0.0,
+                "speculated": self.speculated,
+                "completed": self.completed,
+                "cancelled": self.cancelled,
+                "skipped": self.skipped,
+                "synth_seconds": round(self.synth_seconds, 3),
+                "wasted_seconds": round(self.synth_seconds - self.hit_seconds, 3),
+            }
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import bisect
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from tts_engines.pipeline import iter_chunks, iter_sentences
+
+# "Previous sentence" this soon after a sentence starts goes to the one before it
+RESTART_WINDOW = 1.5
+
+
+@dataclass
+class Segment:
+    start: float  # seconds into the read's audio at speed 1.0
+    end: float
+    char_start: int  # offsets into the read's chunks joined by single spaces
+    char_end: int
+    chunk: int  # synthesized chunk (mixer track) the sentence is in
+
+
+class SeekIndex:
+    """Where each sentence of a read is heard in its audio.
+
+    Chunk durations are measured as chunks are synthesized; the sentences of
+    a chunk share its duration in proportion to their length. Times are at
+    speed 1.0, so callers divide by the playback speed.
+
+    With ``max_chunks``, only the sentences of the last ``max_chunks``
+    chunks are kept, so indexing a read of any length takes bounded memory;
+    positions before them resolve to the oldest one kept. ``chunk_at`` and
+    ``chunk_bounds`` then number the chunks kept, oldest first.
+    """
+
+    def __init__(self, max_chunks: int = 0) -> None:
+        self.max_chunks = max_chunks
+        self.segments: List[Segment] = []
+        self.chunk_starts: List[float] = []
+        self.chunks = 0  # chunks added, including any no longer kept
+        self.duration = 0.0
+        self.chars = 0
+        self._starts: List[float] = []
+        self._char_starts: List[int] = []
+
+    @classmethod
+    def estimate(cls, text: str, duration: float) -> "SeekIndex":
+        """Index a clip whose chunk durations weren't measured (e.g. a cache hit)."""
+        index = cls()
+        chunks = list(iter_chunks(text))
+        total = sum(len(chunk) for chunk in chunks) or 1
+        for chunk in chunks:
+            index.add_chunk(chunk, duration * len(chunk) / total)
+        return index
+
+    def add_chunk(self, text: str, duration: float) -> None:
+        chunk = self.chunks
+        self.chunks += 1
+        self.chunk_starts.append(self.duration)
+        chunk_char_start = self.chars + 1 if self.chars else 0
+        sentences: List[Tuple[int, str]] = []
+        pos = 0
+        for sentence in iter_sentences(text):
+            sentence = sentence.strip()
+            if sentence:
+                pos = text.find(sentence, pos)
+                sentences.append((pos, sentence))
+                pos += len(sentence)
+        if not sentences:
+            sentences = [(0, text)]
+        total = sum(len(sentence) for _, sentence in sentences) or 1
+        start = self.duration
+        for offset, sentence in sentences:
+            seconds = duration * len(sentence) / total
+            char_start = chunk_char_start + offset
+            self.segments.append(Segment(start, start + seconds, char_start, char_start + len(sentence), chunk))
+            self._starts.append(start)
+            self._char_starts.append(char_start)
+            start += seconds
+        self.duration += duration
+        self.chars = chunk_char_start + len(text)
+        if self.max_chunks and len(self.chunk_starts) > self.max_chunks:
+            self._drop_before(self.chunks - self.max_chunks)
+
+    def _drop_before(self, chunk: int) -> None:
+        """Forget the sentences of chunks numbered below chunk."""
+        del self.chunk_starts[:len(self.chunk_starts) - (self.chunks - chunk)]
+        kept = 0
+        while kept < len(self.segments) and self.segments[kept].chunk < chunk:
+            kept += 1
+        del self.segments[:kept]
+        del self._starts[:kept]
+        del self._char_starts[:kept]
+
+    def segment_at(self, seconds: float) -> int:
+        return max(0, bisect.bisect_right(self._starts, seconds) - 1)
+
+    def next_start(self, seconds: float) -> Optional[float]:
+        """Start of the sentence after the one at seconds, or None at the last one."""
+        i = self.segment_at(seconds) + 1
+        return self._starts[i] if i < len(self._starts) else None
+
+    def previous_start(self, seconds: float) -> float:
+        """Start of the sentence at seconds, or of the one before if it has only just begun."""
+        if not self._starts:
+            return 0.0
+        i = self.segment_at(seconds)
+        if seconds - self._starts[i] < RESTART_WINDOW and i > 0:
+            i -= 1
+        return self._starts[i]
+
+    def time_at_char(self, offset: int) -> float:
+        if not self.segments:
+            return 0.0
+        segment = self.segments[max(0, bisect.bisect_right(self._char_starts, offset) - 1)]
+        length = max(1, segment.char_end - segment.char_start)
+        fraction = min(1.0, max(0.0, (offset - segment.char_start) / length))
+        return segment.start + (segment.end - segment.start) * fraction
+
+    def chunk_at(self, seconds: float) -> int:
+        return max(0, bisect.bisect_right(self.chunk_starts, seconds) - 1)
+
+    def chunk_bounds(self, chunk: int) -> Tuple[float, float]:
+        end = self.chunk_starts[chunk + 1] if chunk + 1 < len(self.chunk_starts) else self.duration
+        return self.chunk_starts[chunk], end
+
+    def to_dict(self, speed: float = 1.0) -> Dict[str, Any]:
+        """JSON-ready index with times at the given playback speed."""
+        segments = []
+        for segment in self.segments:
+            row = asdict(segment)
+            row["start"] /= speed
+            row["end"] /= speed
+            segments.append(row)
+        return {"duration": self.duration / speed, "chars": self.chars, "segments": segments}
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import threading
+from typing import Optional
+
+# From X11/X.h and X11/extensions/Xfixes.h
+_SET_SELECTION_OWNER_NOTIFY_MASK = 1
+_SELECTION_NOTIFY = 0  # XFixesSelectionNotify, relative to the extension's event base
+_XEVENT_SIZE = 192  # sizeof(XEvent): 24 longs
+
+
+class SelectionEvents:
+    """Blocks until the X primary selection or clipboard changes, through the XFixes extension.
+
+    Raises OSError where there is no X display or no libX11/libXfixes, so
+    callers can fall back to reading the selection on a timer. Only the
+    thread calling ``wait`` uses the display connection; ``close()`` may be
+    called from any thread and wakes it.
+    """
+
+    def __init__(self, selections=("PRIMARY", "CLIPBOARD")) -> None:
+        x11_path = ctypes.util.find_library("X11")
+        xfixes_path = ctypes.util.find_library("Xfixes")
+        if not os.environ.get("DISPLAY") or x11_path is None or xfixes_path is None:
+            raise OSError("no X display or XFixes")
+        x11 = ctypes.CDLL(x11_path)
+        xfixes = ctypes.CDLL(xfixes_path)
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x11.XDefaultRootWindow.restype = ctypes.c_ulong
+        x11.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+        x11.XInternAtom.restype = ctypes.c_ulong
+        x11.XInternAtom.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+        x11.XConnectionNumber.argtypes = [ctypes.c_void_p]
+        x11.XPending.argtypes = [ctypes.c_void_p]
+        x11.XNextEvent.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        x11.XFlush.argtypes = [ctypes.c_void_p]
+        x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        xfixes.XFixesQueryExtension.argtypes = [
+            ctypes.c_void_p, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int)
+        ]
+        xfixes.XFixesSelectSelectionInput.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong]
+        display = x11.XOpenDisplay(None)
+        if not display:
+            raise OSError("cannot open the X display")
+        event_base, error_base = ctypes.c_int(), ctypes.c_int()
+        if not xfixes.XFixesQueryExtension(display, ctypes.byref(event_base), ctypes.byref(error_base)):
+            x11.XCloseDisplay(display)
+            raise OSError("the X server has no XFixes extension")
+        root = x11.XDefaultRootWindow(display)
+        for name in selections:
+            atom = x11.XInternAtom(display, name.encode("ascii"), False)
+            xfixes.XFixesSelectSelectionInput(display, root, atom, _SET_SELECTION_OWNER_NOTIFY_MASK)
+        x11.XFlush(display)
+        self._x11 = x11
+        self._display = display
+        self._notify_type = event_base.value + _SELECTION_NOTIFY
+        self._fd = x11.XConnectionNumber(display)
+        self._event = ctypes.create_string_buffer(_XEVENT_SIZE)
+        self._wake_read, self._wake_write = os.pipe()
+        self._closed = False
+        self._close_lock = threading.Lock()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until a selection changes (True), or until timeout or close() (False)."""
+        while not self._closed:
+            changed = False
+            while self._x11.XPending(self._display):
+                self._x11.XNextEvent(self._display, self._event)
+                if ctypes.c_int.from_buffer(self._event).value == self._notify_type:
+                    changed = True
+            if changed:
+                return True
+            ready, _, _ = select.select([self._fd, self._wake_read], [], [], timeout)
+            if not ready or self._wake_read in ready:
+                break
+        with self._close_lock:
+            if self._closed and self._display:
+                self._x11.XCloseDisplay(self._display)
+                self._display = None
+                os.close(self._wake_read)
+                os.close(self._wake_write)
+        return False
+
+    def close(self) -> None:
+        """Make wait() return False; the waiting thread then closes the connection."""
+        with self._close_lock:
+            if not self._closed:
+                self._closed = True
+                os.write(self._wake_write, b"\0")
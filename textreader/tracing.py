@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import bisect
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from .core import LATENCY_FILE
+
+# Log-spaced bucket upper bounds from 1 ms to ~10 min, 10% apart, so any
+# percentile read from a histogram is within 10% of the true value
+BUCKET_GROWTH = 1.1
+BUCKET_BOUNDS: List[float] = [0.001 * BUCKET_GROWTH ** i for i in range(141)]
+PERCENTILES = (50, 95, 99)
+SAVE_INTERVAL = 5.0
+
+
+class Histogram:
+    """Fixed-size latency histogram; memory doesn't grow with the number of samples."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, p: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * p / 100.0))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                upper = BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else self.max
+                lower = BUCKET_BOUNDS[index - 1] if index else 0.0
+                # Geometric middle of the bucket, clamped to what was actually seen
+                estimate = math.sqrt(lower * upper) if lower else upper
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        result = {"count": self.count, "mean": self.total / self.count if self.count else 0.0, "max": self.max}
+        for p in PERCENTILES:
+            result[f"p{p}"] = self.percentile(p)
+        return result
+
+    def to_dict(self) -> Dict[str, object]:
+        # Only non-empty buckets are stored, keyed by index
+        return {
+            "buckets": {str(i): c for i, c in enumerate(self.counts) if c},
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "Histogram":
+        hist = cls()
+        for index, count in data.get("buckets", {}).items():
+            if 0 <= int(index) < len(hist.counts):
+                hist.counts[int(index)] = int(count)
+        hist.count = int(data.get("count", sum(hist.counts)))
+        hist.total = float(data.get("total", 0.0))
+        hist.min = float(data.get("min", 0.0)) if hist.count else math.inf
+        hist.max = float(data.get("max", 0.0))
+        return hist
+
+
+class LatencyStats:
+    """Per-engine, per-stage latency histograms, persisted across sessions."""
+
+    def __init__(self, path: Optional[os.PathLike] = None) -> None:
+        self.path = Path(path) if path else None
+        self._histograms: Dict[str, Dict[str, Histogram]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = 0.0
+        if self.path is not None and self.path.exists():
+            try:
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+                for engine, stages in data.get("engines", {}).items():
+                    self._histograms[engine] = {stage: Histogram.from_dict(h) for stage, h in stages.items()}
+            except (OSError, ValueError):
+                pass
+
+    def record(self, engine: str, stage: str, seconds: float) -> None:
+        with self._lock:
+            hist = self._histograms.setdefault(engine, {}).get(stage)
+            if hist is None:
+                hist = self._histograms[engine][stage] = Histogram()
+            hist.record(seconds)
+            self._dirty = True
+
+    @contextmanager
+    def span(self, engine: str, stage: str, debug: bool = False) -> Iterator[None]:
+        """Time the enclosed block and record it under engine/stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.record(engine, stage, elapsed)
+            if debug:
+                print(f"🐛 [DEBUG] ⏱ {stage}: {elapsed * 1000:.1f} ms")
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Return {engine: {stage: {count, mean, max, p50, p95, p99}}} in seconds."""
+        with self._lock:
+            return {
+                engine: {stage: hist.summary() for stage, hist in sorted(stages.items())}
+                for engine, stages in sorted(self._histograms.items())
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms = {}
+            self._dirty = True
+        self.save()
+
+    def save(self, force: bool = True) -> None:
+        """Write the histograms to disk; with force=False, at most every SAVE_INTERVAL seconds."""
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty or (not force and time.monotonic() - self._last_save < SAVE_INTERVAL):
+                return
+            data = {
+                "bucket_growth": BUCKET_GROWTH,
+                "engines": {
+                    engine: {stage: hist.to_dict() for stage, hist in stages.items()}
+                    for engine, stages in self._histograms.items()
+                },
+            }
+            self._dirty = False
+            self._last_save = time.monotonic()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".part")
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    def dump_json(self, path: os.PathLike) -> None:
+        """Write the percentile summary (not the raw buckets) as readable JSON."""
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+
+def add_parser(subparsers) -> None:
+    parser = subparsers.add_parser("stats", help="Print recorded per-engine latency percentiles as JSON")
+    parser.add_argument("-o", "--output", help="Write to this file instead of stdout")
+    parser.add_argument("--reset", action="store_true", help="Clear the recorded latencies")
+    parser.set_defaults(func=run)
+
+
+def run(args) -> int:
+    stats = LatencyStats(LATENCY_FILE)
+    if args.reset:
+        stats.reset()
+        print("Latency stats cleared")
+        return 0
+    if args.output:
+        stats.dump_json(args.output)
+    else:
+        print(json.dumps(stats.summary(), indent=2))
+    return 0
@@ -1,37 +1,131 @@
 from __future__ import annotations
 
+import ast
 import importlib
 import inspect
+import os
 import pkgutil
-from typing import Dict, List, Optional, Type
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 
 from .base import TTSEngine
 
 
-def _discover_engines() -> Dict[str, TTSEngine]:
-    engines: Dict[str, TTSEngine] = {}
+@dataclass
+class EngineInfo:
+    name: str
+    module: str
+    class_name: str
+    output_ext: str = ""
+    load_seconds: Optional[float] = None
+
+
+def _literal_kwargs(cls: ast.ClassDef) -> Dict[str, str]:
+    """Return string literal keyword arguments of the super().__init__ call in cls.__init__."""
+    for node in ast.walk(cls):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == "__init__"):
+            continue
+        target = node.func.value
+        if isinstance(target, ast.Call) and isinstance(target.func, ast.Name) and target.func.id == "super":
+            return {
+                kw.arg: kw.value.value
+                for kw in node.keywords
+                if kw.arg and isinstance(kw.value, ast.Constant) and isinstance(kw.value.value, str)
+            }
+    return {}
+
+
+def _scan_module(module_name: str, path: str) -> List[EngineInfo]:
+    """Find engine classes in a module's source without importing it."""
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    found: List[EngineInfo] = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        if not any(isinstance(base, ast.Name) and base.id == "TTSEngine" for base in node.bases):
+            continue
+        kwargs = _literal_kwargs(node)
+        if "name" in kwargs:
+            found.append(EngineInfo(kwargs["name"], module_name, node.name, kwargs.get("output_ext", "")))
+    return found
+
+
+def _import_scan(module_name: str) -> List[EngineInfo]:
+    """Fallback for engines whose name isn't a literal: import and instantiate."""
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    found: List[EngineInfo] = []
+    for _, obj in inspect.getmembers(module, inspect.isclass):
+        if obj is TTSEngine or not issubclass(obj, TTSEngine) or obj.__module__ != module.__name__:
+            continue
+        try:
+            instance = obj()
+        except Exception:
+            continue
+        _ENGINES[instance.name] = instance
+        found.append(EngineInfo(instance.name, module_name, obj.__name__, instance.output_ext, 0.0))
+    return found
+
+
+def _discover_engines() -> Dict[str, EngineInfo]:
+    infos: Dict[str, EngineInfo] = {}
     for module_info in pkgutil.iter_modules(__path__):
         if not module_info.name.startswith("engine_"):
             continue
-        module = importlib.import_module(f"{__name__}.{module_info.name}")
-        for _, obj in inspect.getmembers(module, inspect.isclass):
-            if obj is TTSEngine:
+        path = os.path.join(__path__[0], f"{module_info.name}.py")
+        try:
+            found = _scan_module(module_info.name, path)
+        except (OSError, SyntaxError):
+            found = []
+        if not found:
+            try:
+                found = _import_scan(module_info.name)
+            except Exception:
                 continue
-            if issubclass(obj, TTSEngine):
-                try:
-                    instance = obj()
-                except Exception:
-                    continue
-                engines[instance.name] = instance
-    return engines
+        for info in found:
+            infos[info.name] = info
+    return infos
 
 
-_ENGINES: Dict[str, TTSEngine] = _discover_engines()
+_ENGINES: Dict[str, TTSEngine] = {}
+_lock = threading.Lock()
+_INFOS: Dict[str, EngineInfo] = _discover_engines()
 
 
 def list_engines() -> List[str]:
-    return sorted(_ENGINES.keys())
+    return sorted(_INFOS.keys())
+
+
+def engine_info(name: str) -> Optional[EngineInfo]:
+    return _INFOS.get(name)
+
+
+def engine_load_times() -> Dict[str, float]:
+    """Seconds spent importing and instantiating each engine loaded so far."""
+    return {name: info.load_seconds for name, info in _INFOS.items() if info.load_seconds is not None}
 
 
 def get_engine(name: str) -> Optional[TTSEngine]:
-    return _ENGINES.get(name)
+    """Return the engine called name, importing its module on first use."""
+    engine = _ENGINES.get(name)
+    if engine is not None:
+        return engine
+    info = _INFOS.get(name)
+    if info is None:
+        return None
+    with _lock:
+        engine = _ENGINES.get(name)
+        if engine is not None:
+            return engine
+        start = time.perf_counter()
+        try:
+            module = importlib.import_module(f"{__name__}.{info.module}")
+            engine = getattr(module, info.class_name)()
+        except Exception:
+            return None
+        info.load_seconds = time.perf_counter() - start
+        info.output_ext = engine.output_ext
+        _ENGINES[name] = engine
+    return engine
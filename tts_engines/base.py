@@ -1,16 +1,61 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import Callable, List, Optional
+
+from .cancel import CancelToken
+
+
+def subprocess_timeout(text: str) -> float:
+    """Timeout for one engine subprocess: 20 s, plus time for long inputs (~100 chars/s)."""
+    return 20.0 + len(text) / 100.0
 
 
 @dataclass
 class TTSEngine:
     name: str
     output_ext: str
+    voice: str = "default"
+    # True if several synthesize() calls may run concurrently (e.g. one subprocess each)
+    parallel_safe: bool = False
+    # Chunks the pipeline may synthesize at once if parallel_safe (0 = CPU count); set by network-bound engines
+    max_parallel: int = 0
 
     def check_dependencies(self) -> List[str]:
         return []
 
-    def synthesize(self, text: str, output_path: str) -> None:
+    def synthesize(self, text: str, output_path: str, cancel: Optional[CancelToken] = None) -> None:
+        """Write audio for text to output_path.
+
+        Once cancel is cancelled, stop as soon as possible (kill the
+        subprocess, drop the request) and raise SynthesisCancelled.
+        """
         raise NotImplementedError()
+
+    def synthesize_to_buffer(self, text: str, cancel: Optional[CancelToken] = None) -> Optional[bytes]:
+        """Return encoded audio (in output_ext format) without touching disk.
+
+        Returns None if the engine can only write files; callers then fall
+        back to synthesize().
+        """
+        return None
+
+    def load_state(self) -> Optional[str]:
+        """Return "unloaded", "loading", "ready" or "failed" for engines that load a model, else None."""
+        return None
+
+    def load_stats(self) -> dict:
+        """Return model load time and memory figures for engines that load a model."""
+        return {}
+
+    def warm_up(self) -> None:
+        """Start loading the engine's model in the background; a no-op for engines without one."""
+
+    def set_model_limits(self, idle_timeout: float, memory_budget_mb: float, workers: int = 0) -> None:
+        """Unload the model after idle_timeout seconds unused, or once RSS exceeds memory_budget_mb (0 = never).
+
+        workers sets how many model instances may run at once (0 = fit to cores and memory).
+        """
+
+    def add_load_listener(self, callback: Callable[[str], None]) -> None:
+        """Call callback(state) whenever load_state() changes."""
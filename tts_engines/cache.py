@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .base import TTSEngine
+
+CACHE_FORMAT = "1"
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so trivially different selections share a cache entry."""
+    return " ".join(text.split())
+
+
+class SynthesisCache:
+    """Content-addressed on-disk cache of synthesized audio with LRU eviction.
+
+    Entries are keyed by (engine name, voice, normalized text, output_ext).
+    Recency is tracked in memory and mirrored to file mtimes so the LRU order
+    survives restarts.
+    """
+
+    def __init__(self, root: os.PathLike, max_bytes: int = 200 * 1024 * 1024) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[Path, int]]" = OrderedDict()
+        self._bytes = 0
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self) -> None:
+        found = []
+        for path in self.root.iterdir():
+            if not path.is_file() or path.name.startswith("."):
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            found.append((st.st_mtime, path.stem, path, st.st_size))
+        for _, key, path, size in sorted(found):
+            self._entries[key] = (path, size)
+            self._bytes += size
+
+    @staticmethod
+    def key_for(engine: TTSEngine, text: str) -> str:
+        parts = (CACHE_FORMAT, engine.name, engine.voice, engine.output_ext, normalize_text(text))
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, engine: TTSEngine, text: str) -> Optional[str]:
+        """Return the cached file path for this engine/text, or None on a miss."""
+        key = self.key_for(engine, text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not entry[0].exists():
+                self._forget(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        try:
+            os.utime(entry[0])
+        except OSError:
+            pass
+        return str(entry[0])
+
+    def contains(self, engine: TTSEngine, text: str) -> bool:
+        """Whether this engine/text is cached, without counting a hit or miss or refreshing it."""
+        key = self.key_for(engine, text)
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[0].exists()
+
+    def put(self, engine: TTSEngine, text: str, source_path: str) -> Optional[str]:
+        """Copy a synthesized file into the cache atomically and return its cached path."""
+        key = self.key_for(engine, text)
+        target = self.root / f"{key}.{engine.output_ext}"
+        size = os.path.getsize(source_path)
+        if size == 0 or size > self.max_bytes:
+            return None
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as dst, open(source_path, "rb") as src:
+                shutil.copyfileobj(src, dst)
+            os.replace(tmp_path, target)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        with self._lock:
+            if key in self._entries:
+                self._forget(key)
+            self._entries[key] = (target, size)
+            self._bytes += size
+            self._evict()
+        return str(target)
+
+    def _forget(self, key: str) -> None:
+        _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            key = next(iter(self._entries))
+            path, _ = self._entries[key]
+            self._forget(key)
+            self.evictions += 1
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            for path, _ in self._entries.values():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes_used": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import subprocess
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Iterator, List, Optional, Sequence, TypeVar, Union
+
+T = TypeVar("T")
+
+
+class SynthesisCancelled(RuntimeError):
+    """Raised when synthesis is cancelled before the whole text is done."""
+
+
+class CancelToken:
+    """Cancels one read's synthesis, including work already in progress.
+
+    ``cancel()`` may be called from any thread. Engines check ``cancelled``
+    between steps, and register ``on_cancel`` callbacks to interrupt what
+    they are blocked on: a subprocess is killed, a wait is woken.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            _call(callback)
+
+    def check(self) -> None:
+        """Raise SynthesisCancelled if cancelled."""
+        if self._event.is_set():
+            raise SynthesisCancelled("Synthesis cancelled")
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Sleep up to timeout, waking early on cancel; True if cancelled."""
+        return self._event.wait(timeout)
+
+    @contextmanager
+    def on_cancel(self, callback: Callable[[], None]) -> Iterator[None]:
+        """Call callback if the token is cancelled inside the block (at once if it already is)."""
+        with self._lock:
+            registered = not self._event.is_set()
+            if registered:
+                self._callbacks.append(callback)
+        if not registered:
+            _call(callback)
+        try:
+            yield
+        finally:
+            with self._lock:
+                if callback in self._callbacks:
+                    self._callbacks.remove(callback)
+
+    def result(self, future: "Future[T]", timeout: Optional[float] = None) -> T:
+        """future.result(), but give up on cancel: the future is cancelled and SynthesisCancelled raised."""
+        done = threading.Event()
+        future.add_done_callback(lambda _: done.set())
+        with self.on_cancel(done.set):
+            done.wait(timeout)
+        if not future.done() and self.cancelled:
+            future.cancel()
+            raise SynthesisCancelled("Synthesis cancelled")
+        return future.result(timeout=0)
+
+
+def _call(callback: Callable[[], None]) -> None:
+    try:
+        callback()
+    except Exception:
+        # Typically the resource was already released, e.g. the process exited
+        pass
+
+
+def run_process(
+    args: Sequence[str],
+    cancel: Optional[CancelToken] = None,
+    input: Union[bytes, str, None] = None,
+    capture_output: bool = False,
+    text: bool = False,
+    timeout: Optional[float] = None,
+) -> subprocess.CompletedProcess:
+    """subprocess.run(check=False) that kills the process as soon as cancel is cancelled."""
+    if cancel is not None:
+        cancel.check()
+    pipe = subprocess.PIPE if capture_output else None
+    with subprocess.Popen(
+        args, stdin=subprocess.PIPE if input is not None else None, stdout=pipe, stderr=pipe, text=text
+    ) as process:
+        with cancel.on_cancel(process.kill) if cancel is not None else nullcontext():
+            try:
+                stdout, stderr = process.communicate(input, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                raise
+        if cancel is not None:
+            cancel.check()
+        return subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import site
+import sys
+import sysconfig
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+CAPABILITIES_FORMAT = "3"
+
+
+def environment_fingerprint() -> str:
+    """Hash of everything an engine's dependency check depends on.
+
+    Covers PATH and library search paths, the interpreter and venv, and the
+    mtimes of the PATH and site-packages directories, so installing or removing a
+    package or system binary changes the fingerprint.
+    """
+    parts = [
+        CAPABILITIES_FORMAT,
+        sys.executable,
+        sys.version,
+        sys.prefix,
+        os.environ.get("PATH", ""),
+        os.environ.get("LD_LIBRARY_PATH", ""),
+        os.environ.get("DYLD_LIBRARY_PATH", ""),
+    ]
+    # Package directories rather than all of sys.path, whose first entry depends on how we were started
+    dirs = os.environ.get("PATH", "").split(os.pathsep)
+    dirs += sorted({sysconfig.get_path("purelib"), sysconfig.get_path("platlib"), site.getusersitepackages()})
+    for directory in dirs:
+        try:
+            parts.append(f"{directory}:{os.stat(directory).st_mtime_ns}")
+        except OSError:
+            parts.append(f"{directory}:-")
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+class CapabilityCache:
+    """Persisted results of engine dependency checks.
+
+    Each engine is probed once; the result is reused until the environment
+    fingerprint changes or refresh() is called, so the UI and read path never
+    repeat PATH scans or package lookups.
+    """
+
+    def __init__(self, path: Optional[os.PathLike] = None) -> None:
+        self.path = Path(path) if path else None
+        self.fingerprint = environment_fingerprint()
+        self._results: Dict[str, Dict[str, object]] = {}
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            try:
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+                if data.get("fingerprint") == self.fingerprint:
+                    self._results = data.get("engines", {})
+            except (OSError, ValueError):
+                pass
+
+    def cached(self, engine_name: str) -> Optional[List[str]]:
+        """Return the missing-dependency list from the last probe, or None if not probed."""
+        with self._lock:
+            result = self._results.get(engine_name)
+            return list(result["missing"]) if result is not None else None
+
+    def probe(self, engine_name: str, check: Callable[[], List[str]]) -> List[str]:
+        """Run check() and store its result for engine_name."""
+        start = time.perf_counter()
+        missing = list(check())
+        with self._lock:
+            self._results[engine_name] = {
+                "missing": missing,
+                "probe_seconds": time.perf_counter() - start,
+                "probed_at": time.time(),
+            }
+        self._save()
+        return missing
+
+    def missing(self, engine_name: str, check: Callable[[], List[str]]) -> List[str]:
+        cached = self.cached(engine_name)
+        return cached if cached is not None else self.probe(engine_name, check)
+
+    def refresh(self) -> None:
+        """Forget every result so the next lookups probe again."""
+        with self._lock:
+            self.fingerprint = environment_fingerprint()
+            self._results = {}
+        self._save()
+
+    def revalidate(self) -> bool:
+        """Drop the results if the environment changed since they were taken; True if it did."""
+        fingerprint = environment_fingerprint()
+        with self._lock:
+            if fingerprint == self.fingerprint:
+                return False
+            self.fingerprint = fingerprint
+            self._results = {}
+        self._save()
+        return True
+
+    def results(self) -> Dict[str, Dict[str, object]]:
+        with self._lock:
+            return {name: dict(result) for name, result in self._results.items()}
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            data = {"fingerprint": self.fingerprint, "engines": self._results}
+            text = json.dumps(data, indent=2)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".part")
+            with open(tmp_path, "w") as f:
+                f.write(text)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
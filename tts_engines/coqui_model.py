@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import gc
+import threading
+import time
+from typing import Callable, List, Optional
+
+from .cancel import CancelToken
+from .coqui_pool import (
+    ESTIMATED_WORKER_MB,
+    TORCH_THREADS,
+    WARMUP_TEXT,
+    CoquiWorkerPool,
+    physical_memory_mb,
+    plan_workers,
+    process_rss_mb,
+)
+
+UNLOADED = "unloaded"
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+# Share of the memory budget left free when sizing the pool, since workers grow while inferring
+BUDGET_HEADROOM = 0.2
+
+
+class CoquiModel:
+    """Lifecycle of the Coqui model: one in-process instance or a worker pool.
+
+    The model can be warmed up in the background before the first request.
+    It is unloaded after ``idle_timeout`` seconds without use, or straight
+    after a request once the process and its workers use more than
+    ``memory_budget_mb``, and is loaded again on the next request. The pool
+    is sized to what is left of the budget besides this process, so a full
+    pool doesn't exceed it. ``workers`` picks the pool size
+    (0 = fit to cores and memory, 1 = in-process); it applies from the next
+    load.
+    """
+
+    def __init__(self, model_name: str, idle_timeout: float = 600.0, memory_budget_mb: float = 0.0, workers: int = 0) -> None:
+        self.model_name = model_name
+        self.idle_timeout = idle_timeout
+        self.memory_budget_mb = memory_budget_mb
+        self.workers = workers
+        self.state = UNLOADED
+        self.error: Optional[str] = None
+        self.load_seconds = 0.0
+        self.model_mb = 0.0
+        self.loads = 0
+        self._model = None
+        self._busy = 0
+        self._last_used = 0.0
+        self._cond = threading.Condition()
+        # Coqui models are not safe to call from several threads at once
+        self._infer_lock = threading.Lock()
+        self._listeners: List[Callable[[str], None]] = []
+        self._reaper: Optional[threading.Thread] = None
+
+    def add_listener(self, callback: Callable[[str], None]) -> None:
+        """Call callback(state) after every load state change."""
+        self._listeners.append(callback)
+
+    def _set_state(self, state: str) -> None:
+        with self._cond:
+            self.state = state
+            self._cond.notify_all()
+        for callback in self._listeners:
+            try:
+                callback(state)
+            except Exception:
+                pass
+
+    def configure(
+        self, idle_timeout: Optional[float] = None, memory_budget_mb: Optional[float] = None, workers: Optional[int] = None
+    ) -> None:
+        with self._cond:
+            if idle_timeout is not None:
+                self.idle_timeout = idle_timeout
+            if memory_budget_mb is not None:
+                self.memory_budget_mb = memory_budget_mb
+            if workers is not None:
+                self.workers = workers
+            self._cond.notify_all()
+
+    def warm_up(self) -> None:
+        """Start loading the model (and one dummy inference) in a background thread."""
+        with self._cond:
+            if self.state in (LOADING, READY):
+                return
+            self.state = LOADING
+        threading.Thread(target=self._load, args=(True,), name="coqui warm-up", daemon=True).start()
+
+    def _load(self, prime: bool) -> None:
+        self._set_state(LOADING)
+        start = time.perf_counter()
+        rss_before = process_rss_mb()
+        try:
+            if self._use_pool():
+                # Workers always prime themselves, so they are ready for real requests
+                model = CoquiWorkerPool(self.model_name, size=max(0, self.workers), ram_ceiling_mb=self._pool_ceiling_mb())
+                model.start()
+            else:
+                from TTS.api import TTS as CoquiTTS
+
+                model = CoquiTTS(model_name=self.model_name, progress_bar=False)
+                if prime:
+                    with self._infer_lock:
+                        model.tts(text=WARMUP_TEXT)
+        except Exception as e:
+            with self._cond:
+                self.error = str(e)
+            self._set_state(FAILED)
+            return
+        with self._cond:
+            self._model = model
+            self._last_used = time.monotonic()
+            self.load_seconds = time.perf_counter() - start
+            if isinstance(model, CoquiWorkerPool):
+                self.model_mb = model.worker_mb
+            else:
+                self.model_mb = max(0.0, process_rss_mb() - rss_before)
+            self.loads += 1
+            self.error = None
+        self._set_state(READY)
+        self._start_reaper()
+
+    def _acquire(self):
+        """Return the loaded model, loading it (or waiting for a warm-up) first."""
+        with self._cond:
+            while self.state == LOADING:
+                self._cond.wait()
+            if self._model is None:
+                self.state = LOADING
+                load = True
+            else:
+                load = False
+            self._busy += 1
+        if load:
+            self._load(prime=False)
+        with self._cond:
+            if self._model is None:
+                self._busy -= 1
+                raise RuntimeError(f"Coqui model failed to load: {self.error}")
+            return self._model
+
+    def _release(self) -> None:
+        with self._cond:
+            self._busy -= 1
+            self._last_used = time.monotonic()
+            over_budget = self.memory_budget_mb > 0 and self._resident_mb() > self.memory_budget_mb
+            self._cond.notify_all()
+        if over_budget:
+            self.unload()
+
+    def synthesize(self, text: str, output_path: str, cancel: Optional[CancelToken] = None) -> None:
+        model = self._acquire()
+        try:
+            if isinstance(model, CoquiWorkerPool):
+                model.synthesize(text, output_path, cancel)
+            else:
+                with self._infer_lock:
+                    # An inference can't be interrupted in-process, but the chunks queued behind it are skipped
+                    if cancel is not None:
+                        cancel.check()
+                    model.tts_to_file(text=text, file_path=output_path)
+        finally:
+            self._release()
+
+    def unload(self) -> bool:
+        """Drop the model unless a request is using it; True if it was unloaded."""
+        with self._cond:
+            if self._model is None or self._busy:
+                return False
+            model, self._model = self._model, None
+        if isinstance(model, CoquiWorkerPool):
+            model.stop()
+        del model
+        gc.collect()
+        self._set_state(UNLOADED)
+        return True
+
+    def _start_reaper(self) -> None:
+        with self._cond:
+            if self._reaper is not None and self._reaper.is_alive():
+                return
+            self._reaper = threading.Thread(target=self._reap_idle, name="coqui idle unload", daemon=True)
+            self._reaper.start()
+
+    def _reap_idle(self) -> None:
+        """Sleep until the model has been idle for idle_timeout, then unload it."""
+        while True:
+            with self._cond:
+                if self._model is None:
+                    return
+                if self.idle_timeout <= 0 or self._busy:
+                    self._cond.wait()
+                    continue
+                remaining = self._last_used + self.idle_timeout - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+            self.unload()
+
+    def _use_pool(self) -> bool:
+        if self.workers != 0:
+            return self.workers > 1
+        ceiling = self._pool_ceiling_mb() or physical_memory_mb() / 2
+        return plan_workers(TORCH_THREADS, ESTIMATED_WORKER_MB, ceiling) > 1
+
+    def parallelism(self) -> int:
+        """Inferences that can run at once: the pool's size, 1 in-process, or what the next load would give."""
+        with self._cond:
+            model = self._model
+        if isinstance(model, CoquiWorkerPool):
+            return max(1, model.size)
+        if model is not None or not self._use_pool():
+            return 1
+        if self.workers > 1:
+            return self.workers
+        return plan_workers(TORCH_THREADS, ESTIMATED_WORKER_MB, self._pool_ceiling_mb() or physical_memory_mb() / 2)
+
+    def _pool_ceiling_mb(self) -> float:
+        """RAM the pool's workers may use: the budget less this process and headroom (0 = no budget)."""
+        if self.memory_budget_mb <= 0:
+            return 0.0
+        available = (self.memory_budget_mb - process_rss_mb()) * (1 - BUDGET_HEADROOM)
+        # Still positive, so a budget this process already fills means one worker rather than no limit
+        return max(available, 1.0)
+
+    def _resident_mb(self) -> float:
+        """Memory used by the model: this process plus any pool workers."""
+        model = self._model
+        return process_rss_mb() + (model.rss_mb() if isinstance(model, CoquiWorkerPool) else 0.0)
+
+    def stats(self) -> dict:
+        with self._cond:
+            model = self._model
+            return {
+                "state": self.state,
+                "workers": model.size if isinstance(model, CoquiWorkerPool) else (1 if model is not None else 0),
+                "workers_ready": model.ready() if isinstance(model, CoquiWorkerPool) else (1 if model is not None else 0),
+                "load_seconds": self.load_seconds,
+                "model_mb": self.model_mb,
+                "resident_mb": self._resident_mb(),
+                "loads": self.loads,
+                "error": self.error,
+            }
+
+
+_model: Optional[CoquiModel] = None
+_model_lock = threading.Lock()
+
+
+def get_model(model_name: str) -> CoquiModel:
+    global _model
+    with _model_lock:
+        if _model is None:
+            _model = CoquiModel(model_name)
+        return _model
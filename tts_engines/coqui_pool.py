@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from contextlib import nullcontext
+from typing import List, Optional
+
+from .cancel import CancelToken, SynthesisCancelled
+
+# Torch threads per worker; several narrow workers beat one wide one for short sentences
+TORCH_THREADS = 2
+# Used to size the pool until the first worker reports its real footprint
+ESTIMATED_WORKER_MB = 600.0
+# Short enough to be cheap, long enough to run every layer of the model once
+WARMUP_TEXT = "Warming up."
+# How often a cancellable request waiting for an idle worker checks for cancellation
+CANCEL_CHECK_INTERVAL = 0.1
+
+
+def process_rss_mb(pid: Optional[int] = None) -> float:
+    """Return the resident memory of a process (default: this one) in MB, or 0 if unknown."""
+    try:
+        with open(f"/proc/{pid or 'self'}/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError, IndexError):
+        pass
+    if pid is not None:
+        return 0.0
+    try:
+        import resource
+
+        # Peak rather than current RSS, but the best available without /proc
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if os.uname().sysname == "Darwin" else peak / 1024
+    except Exception:
+        return 0.0
+
+
+def physical_memory_mb() -> float:
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (ValueError, AttributeError, OSError):
+        return 0.0
+
+
+def plan_workers(torch_threads: int, worker_mb: float, ram_ceiling_mb: float) -> int:
+    """Number of workers that fit both the CPU cores and the RAM ceiling (at least one)."""
+    by_cpu = (os.cpu_count() or 1) // max(1, torch_threads)
+    by_ram = int(ram_ceiling_mb // worker_mb) if ram_ceiling_mb > 0 and worker_mb > 0 else by_cpu
+    return max(1, min(by_cpu, by_ram))
+
+
+def _worker_main(conn, model_name: str, torch_threads: int) -> None:
+    """Worker process: load one model, then synthesize requests until told to stop."""
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(torch_threads)
+    try:
+        start = time.perf_counter()
+        import torch
+
+        torch.set_num_threads(torch_threads)
+        torch.set_num_interop_threads(1)
+        from TTS.api import TTS as CoquiTTS
+
+        model = CoquiTTS(model_name=model_name, progress_bar=False)
+        model.tts(text=WARMUP_TEXT)
+        conn.send(("ready", time.perf_counter() - start))
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+        return
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        text, output_path = request
+        try:
+            model.tts_to_file(text=text, file_path=output_path)
+            conn.send(("ok", None))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+class _Worker:
+    def __init__(self, ctx, model_name: str, torch_threads: int) -> None:
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main, args=(child, model_name, torch_threads), name="coqui worker", daemon=True
+        )
+        self.process.start()
+        child.close()
+
+    def wait_ready(self, timeout: float) -> float:
+        """Block until the model is loaded; return the load time in seconds."""
+        if not self.conn.poll(timeout):
+            self.stop()
+            raise RuntimeError("Coqui worker did not start in time")
+        try:
+            status, value = self.conn.recv()
+        except EOFError:
+            self.process.join(timeout=1)
+            status, value = "error", f"worker exited with code {self.process.exitcode}"
+        if status != "ready":
+            self.stop()
+            raise RuntimeError(f"Coqui worker failed to load: {value}")
+        return value
+
+    def synthesize(self, text: str, output_path: str) -> None:
+        self.conn.send((text, output_path))
+        status, value = self.conn.recv()
+        if status != "ok":
+            raise RuntimeError(value)
+
+    def rss_mb(self) -> float:
+        return process_rss_mb(self.process.pid)
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=2)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class CoquiWorkerPool:
+    """Coqui models in separate processes, each request going to an idle one.
+
+    Each worker owns a model and a fixed number of torch threads, so
+    concurrent requests run truly in parallel instead of queueing on one
+    model. The pool starts with one worker; once it has loaded, its memory
+    use sizes the rest of the pool against the cores and ``ram_ceiling_mb``.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        size: int = 0,
+        torch_threads: int = TORCH_THREADS,
+        ram_ceiling_mb: float = 0.0,
+        startup_timeout: float = 300.0,
+    ) -> None:
+        self.model_name = model_name
+        self.requested_size = size
+        self.torch_threads = torch_threads
+        self.ram_ceiling_mb = ram_ceiling_mb or physical_memory_mb() / 2
+        self.startup_timeout = startup_timeout
+        self.size = 0
+        self.load_seconds = 0.0
+        self.worker_mb = 0.0
+        self.restarts = 0
+        self._ctx = multiprocessing.get_context("spawn")
+        self._workers: List[_Worker] = []
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._stopped = False
+        self._growing = False
+
+    def target_size(self) -> int:
+        if self.requested_size > 0:
+            return self.requested_size
+        return plan_workers(self.torch_threads, self.worker_mb or ESTIMATED_WORKER_MB, self.ram_ceiling_mb)
+
+    def start(self) -> None:
+        """Start the first worker and wait for it; the others load in the background."""
+        first = self._spawn()
+        self.worker_mb = first.rss_mb()
+        self.size = self.target_size()
+        if self.size > 1:
+            threading.Thread(target=self._grow, name="coqui pool grow", daemon=True).start()
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._ctx, self.model_name, self.torch_threads)
+        seconds = worker.wait_ready(self.startup_timeout)
+        with self._lock:
+            if self._stopped:
+                worker.stop()
+                raise RuntimeError("Coqui worker pool stopped")
+            self._workers.append(worker)
+            self.load_seconds = max(self.load_seconds, seconds)
+        self._idle.put(worker)
+        return worker
+
+    def _grow(self) -> None:
+        with self._lock:
+            if self._growing:
+                return
+            self._growing = True
+        try:
+            while not self._stopped:
+                with self._lock:
+                    if len(self._workers) >= self.size:
+                        return
+                try:
+                    self._spawn()
+                except Exception:
+                    # Out of memory or similar: keep the workers that did start
+                    with self._lock:
+                        self.size = len(self._workers)
+                    return
+        finally:
+            with self._lock:
+                self._growing = False
+
+    def _replace(self, worker: _Worker) -> None:
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+            self.restarts += 1
+        worker.stop()
+        if not self._stopped:
+            threading.Thread(target=self._grow, name="coqui pool restart", daemon=True).start()
+
+    def _take_idle(self, cancel: Optional[CancelToken]) -> Optional[_Worker]:
+        if cancel is None:
+            return self._idle.get()
+        while True:
+            cancel.check()
+            try:
+                return self._idle.get(timeout=CANCEL_CHECK_INTERVAL)
+            except queue.Empty:
+                pass
+
+    def synthesize(self, text: str, output_path: str, cancel: Optional[CancelToken] = None) -> None:
+        """Synthesize on an idle worker; on cancel the worker is killed mid-inference and replaced."""
+        for attempt in range(2):
+            worker = self._take_idle(cancel)
+            if worker is None:
+                self._idle.put(None)
+                raise RuntimeError("Coqui worker pool stopped")
+            killed: List[bool] = []
+
+            def kill(worker: _Worker = worker) -> None:
+                killed.append(True)
+                worker.process.kill()
+
+            try:
+                with cancel.on_cancel(kill) if cancel is not None else nullcontext():
+                    worker.synthesize(text, output_path)
+                if killed:
+                    # Cancelled just as the worker answered; it is dead all the same
+                    raise EOFError()
+            except (EOFError, OSError):
+                # The worker died (killed or crashed); replace it and retry once
+                self._replace(worker)
+                if cancel is not None and cancel.cancelled:
+                    raise SynthesisCancelled("Synthesis cancelled")
+                if attempt:
+                    raise RuntimeError("Coqui worker crashed")
+                continue
+            except Exception:
+                self._idle.put(worker)
+                raise
+            self._idle.put(worker)
+            return
+
+    def ready(self) -> int:
+        """Number of workers that have loaded their model."""
+        with self._lock:
+            return len(self._workers)
+
+    def busy(self) -> int:
+        with self._lock:
+            return len(self._workers) - self._idle.qsize()
+
+    def rss_mb(self) -> float:
+        with self._lock:
+            workers = list(self._workers)
+        return sum(worker.rss_mb() for worker in workers)
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stopped = True
+            workers, self._workers = self._workers, []
+        # Wake anyone waiting for a worker
+        self._idle.put(None)
+        for worker in workers:
+            worker.stop()
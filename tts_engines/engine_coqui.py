@@ -1,36 +1,51 @@
 from __future__ import annotations
 
-import threading
-from typing import List
+import importlib.util
+from typing import Callable, List, Optional
 
 from .base import TTSEngine
+from .cancel import CancelToken
+from .coqui_model import get_model
 
-_coqui_engine = None
-_coqui_lock = threading.Lock()
-
-
-def _get_engine():
-    global _coqui_engine
-    if _coqui_engine is None:
-        from TTS.api import TTS as CoquiTTS
-
-        _coqui_engine = CoquiTTS(model_name="tts_models/en/ljspeech/tacotron2-DDC", progress_bar=False)
-    return _coqui_engine
+_MODEL_NAME = "tts_models/en/ljspeech/tacotron2-DDC"
 
 
 class CoquiEngine(TTSEngine):
     def __init__(self) -> None:
-        super().__init__(name="Coqui TTS", output_ext="wav")
+        super().__init__(name="Coqui TTS", output_ext="wav", voice=_MODEL_NAME)
+        self.model = get_model(_MODEL_NAME)
+        self.model.add_listener(lambda state: self._match_model())
+        self._match_model()
+
+    def _match_model(self) -> None:
+        # Chunks run concurrently only on a worker pool, one per worker; a single
+        # in-process model takes them one at a time on its lock, so they go in order
+        workers = self.model.parallelism()
+        self.parallel_safe = workers > 1
+        self.max_parallel = workers
 
     def check_dependencies(self) -> List[str]:
         missing: List[str] = []
-        try:
-            import TTS  # noqa: F401
-        except Exception:
+        # find_spec locates the package without importing it (TTS takes seconds to import)
+        if importlib.util.find_spec("TTS") is None:
             missing.append("TTS")
         return missing
 
-    def synthesize(self, text: str, output_path: str) -> None:
-        engine = _get_engine()
-        with _coqui_lock:
-            engine.tts_to_file(text=text, file_path=output_path)
+    def load_state(self) -> Optional[str]:
+        return self.model.state
+
+    def load_stats(self) -> dict:
+        return self.model.stats()
+
+    def warm_up(self) -> None:
+        self.model.warm_up()
+
+    def set_model_limits(self, idle_timeout: float, memory_budget_mb: float, workers: int = 0) -> None:
+        self.model.configure(idle_timeout, memory_budget_mb, workers)
+        self._match_model()
+
+    def add_load_listener(self, callback: Callable[[str], None]) -> None:
+        self.model.add_listener(callback)
+
+    def synthesize(self, text: str, output_path: str, cancel: Optional[CancelToken] = None) -> None:
+        self.model.synthesize(text, output_path, cancel)
@@ -1,25 +1,73 @@
 from __future__ import annotations
 
 import shutil
-import subprocess
-from typing import List
+from typing import List, Optional
 
-from .base import TTSEngine
+from .base import TTSEngine, subprocess_timeout
+from .cancel import CancelToken, SynthesisCancelled, run_process
+from .espeak_lib import EspeakLibrary, get_library
+from .wavutil import fix_wav_header
 
 
 class EspeakEngine(TTSEngine):
     def __init__(self) -> None:
         super().__init__(name="eSpeak-NG", output_ext="wav")
+        # Synthesize through an in-process libespeak-ng when available instead
+        # of forking espeak-ng (and reloading the voice) for every request
+        self.use_warm_server = True
+
+    @property
+    def use_warm_server(self) -> bool:
+        return self._use_library
+
+    @use_warm_server.setter
+    def use_warm_server(self, value: bool) -> None:
+        self._use_library = value
+        # libespeak-ng is a single synthesizer per process, so its calls run one at a
+        # time; only the espeak-ng processes can synthesize chunks in parallel
+        self.parallel_safe = not value or EspeakLibrary.find() is None
 
     def check_dependencies(self) -> List[str]:
         missing: List[str] = []
-        if shutil.which("espeak-ng") is None:
+        if shutil.which("espeak-ng") is None and EspeakLibrary.find() is None:
             missing.append("espeak-ng (system package)")
         return missing
 
-    def synthesize(self, text: str, output_path: str) -> None:
-        subprocess.run(
+    def _warm_synthesize(self, text: str, cancel: Optional[CancelToken]) -> Optional[bytes]:
+        if not self.use_warm_server or EspeakLibrary.find() is None:
+            return None
+        try:
+            return get_library().synthesize(text, cancel)
+        except SynthesisCancelled:
+            raise
+        except Exception:
+            # Fall back to one process per request for the rest of the session
+            self.use_warm_server = False
+            return None
+
+    def synthesize(self, text: str, output_path: str, cancel: Optional[CancelToken] = None) -> None:
+        data = self._warm_synthesize(text, cancel)
+        if data:
+            with open(output_path, "wb") as f:
+                f.write(data)
+            return
+        run_process(
             ["espeak-ng", "-w", output_path, text],
-            check=False,
-            timeout=20,
+            cancel,
+            timeout=subprocess_timeout(text),
+        )
+
+    def synthesize_to_buffer(self, text: str, cancel: Optional[CancelToken] = None) -> Optional[bytes]:
+        data = self._warm_synthesize(text, cancel)
+        if data:
+            return data
+        result = run_process(
+            ["espeak-ng", "--stdout", text],
+            cancel,
+            capture_output=True,
+            timeout=subprocess_timeout(text),
         )
+        if result.returncode != 0 or not result.stdout:
+            return None
+        # --stdout can't seek back to patch the sizes, so fix them up here
+        return fix_wav_header(result.stdout)
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import shutil
-import subprocess
-from typing import List
+from typing import List, Optional
 
-from .base import TTSEngine
+from .base import TTSEngine, subprocess_timeout
+from .cancel import CancelToken, SynthesisCancelled, run_process
+from .festival_server import FestivalServer, get_server
+from .wavutil import fix_wav_header
 
 
 class FestivalEngine(TTSEngine):
     def __init__(self) -> None:
-        super().__init__(name="Festival", output_ext="wav")
+        super().__init__(name="Festival", output_ext="wav", parallel_safe=True)
+        # Keep one festival --server running instead of paying Scheme init
+        # and voice loading in a new text2wave process for every request
+        self.use_warm_server = True
 
     def check_dependencies(self) -> List[str]:
         missing: List[str] = []
@@ -17,11 +22,44 @@ class FestivalEngine(TTSEngine):
             missing.append("festival (system package)")
         return missing
 
-    def synthesize(self, text: str, output_path: str) -> None:
-        subprocess.run(
+    def _warm_synthesize(self, text: str, cancel: Optional[CancelToken]) -> Optional[bytes]:
+        if not self.use_warm_server or not FestivalServer.available():
+            return None
+        try:
+            return get_server().synthesize(text, cancel)
+        except SynthesisCancelled:
+            raise
+        except Exception:
+            # Fall back to one process per request for the rest of the session
+            self.use_warm_server = False
+            return None
+
+    def synthesize(self, text: str, output_path: str, cancel: Optional[CancelToken] = None) -> None:
+        data = self._warm_synthesize(text, cancel)
+        if data:
+            with open(output_path, "wb") as f:
+                f.write(data)
+            return
+        run_process(
             ["text2wave", "-o", output_path],
+            cancel,
             input=text,
             text=True,
-            check=False,
-            timeout=20,
+            timeout=subprocess_timeout(text),
+        )
+
+    def synthesize_to_buffer(self, text: str, cancel: Optional[CancelToken] = None) -> Optional[bytes]:
+        data = self._warm_synthesize(text, cancel)
+        if data:
+            return data
+        # text2wave writes the waveform to stdout when no -o is given
+        result = run_process(
+            ["text2wave"],
+            cancel,
+            input=text.encode("utf-8"),
+            capture_output=True,
+            timeout=subprocess_timeout(text),
         )
+        if result.returncode != 0 or not result.stdout:
+            return None
+        return fix_wav_header(result.stdout)
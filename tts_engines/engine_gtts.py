@@ -1,24 +1,43 @@
 from __future__ import annotations
 
-from typing import List
+import importlib.util
+import threading
+from typing import List, Optional
 
 from .base import TTSEngine
+from .cancel import CancelToken
+from .gtts_client import DEFAULT_CONNECTIONS, GTTSClient
 
 
 class GTTSEngine(TTSEngine):
     def __init__(self) -> None:
-        super().__init__(name="gTTS", output_ext="mp3")
+        # Network-bound: as many chunks in flight as there are connections, whatever the core count
+        super().__init__(name="gTTS", output_ext="mp3", voice="en", parallel_safe=True, max_parallel=DEFAULT_CONNECTIONS)
+        self._client: Optional[GTTSClient] = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self) -> GTTSClient:
+        with self._client_lock:
+            if self._client is None:
+                self._client = GTTSClient(connections=self.max_parallel)
+            return self._client
+
+    @client.setter
+    def client(self, client: GTTSClient) -> None:
+        with self._client_lock:
+            self._client = client
 
     def check_dependencies(self) -> List[str]:
         missing: List[str] = []
-        try:
-            import gtts  # noqa: F401
-        except Exception:
+        if importlib.util.find_spec("gtts") is None:
             missing.append("gTTS")
         return missing
 
-    def synthesize(self, text: str, output_path: str) -> None:
-        from gtts import gTTS
+    def synthesize(self, text: str, output_path: str, cancel: Optional[CancelToken] = None) -> None:
+        data = self.client.fetch(text, lang=self.voice, cancel=cancel)
+        with open(output_path, "wb") as f:
+            f.write(data)
 
-        tts = gTTS(text=text, lang="en", slow=False)
-        tts.save(output_path)
+    def synthesize_to_buffer(self, text: str, cancel: Optional[CancelToken] = None) -> Optional[bytes]:
+        return self.client.fetch(text, lang=self.voice, cancel=cancel)
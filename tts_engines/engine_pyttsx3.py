@@ -1,41 +1,35 @@
 from __future__ import annotations
 
-import threading
-from typing import List
+import importlib.util
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import List, Optional
 
-from .base import TTSEngine
-
-_pyttsx3_engine = None
-_pyttsx3_lock = threading.Lock()
-
-
-def _get_engine():
-    global _pyttsx3_engine
-    if _pyttsx3_engine is None:
-        import pyttsx3
-
-        _pyttsx3_engine = pyttsx3.init()
-    return _pyttsx3_engine
+from .base import TTSEngine, subprocess_timeout
+from .cancel import CancelToken
+from .pyttsx3_driver import get_driver
 
 
 class Pyttsx3Engine(TTSEngine):
     def __init__(self) -> None:
+        # One driver thread synthesizes every job in turn, so parallel chunks would only queue
         super().__init__(name="pyttsx3", output_ext="wav")
 
     def check_dependencies(self) -> List[str]:
         missing: List[str] = []
-        try:
-            import pyttsx3  # noqa: F401
-        except Exception:
+        if importlib.util.find_spec("pyttsx3") is None:
             missing.append("pyttsx3")
         return missing
 
-    def synthesize(self, text: str, output_path: str) -> None:
-        engine = _get_engine()
-        with _pyttsx3_lock:
-            try:
-                engine.stop()
-            except Exception:
-                pass
-            engine.save_to_file(text, output_path)
-            engine.runAndWait()
+    def synthesize(self, text: str, output_path: str, cancel: Optional[CancelToken] = None) -> None:
+        future = get_driver().submit(text, output_path)
+        # A driver that never reports the utterance finished would otherwise block the read forever
+        timeout = subprocess_timeout(text)
+        try:
+            if cancel is None:
+                future.result(timeout=timeout)
+            else:
+                # A queued job is dropped; one the driver has started runs out, but nobody waits for it
+                cancel.result(future, timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise RuntimeError(f"pyttsx3 did not finish the utterance within {timeout:.0f}s") from None
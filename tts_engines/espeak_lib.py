@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import functools
+import io
+import threading
+import wave
+from typing import List, Optional
+
+from .cancel import CancelToken
+
+# Constants from espeak-ng's speak_lib.h
+_AUDIO_OUTPUT_SYNCHRONOUS = 2
+_POS_CHARACTER = 1
+_CHARS_UTF8 = 1
+_EE_OK = 0
+
+_SYNTH_CALLBACK = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.POINTER(ctypes.c_short), ctypes.c_int, ctypes.c_void_p)
+
+
+class EspeakLibrary:
+    """In-process libespeak-ng, initialized once and reused across requests.
+
+    Voice data is loaded by the first request only; afterwards each call is
+    just the synthesis itself, with no process startup.
+    """
+
+    def __init__(self, voice: str = "en") -> None:
+        self.voice = voice
+        self.sample_rate = 0
+        self._lib = None
+        self._callback = None
+        self._samples: List[bytes] = []
+        self._cancel: Optional[CancelToken] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def find() -> Optional[str]:
+        # find_library runs ldconfig (or a compiler) each time; resolve the path once per process
+        return ctypes.util.find_library("espeak-ng")
+
+    def _load(self) -> None:
+        path = self.find()
+        if path is None:
+            raise RuntimeError("libespeak-ng not found")
+        lib = ctypes.CDLL(path)
+        lib.espeak_Initialize.restype = ctypes.c_int
+        lib.espeak_Initialize.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_char_p, ctypes.c_int]
+        lib.espeak_SetSynthCallback.argtypes = [_SYNTH_CALLBACK]
+        lib.espeak_SetVoiceByName.argtypes = [ctypes.c_char_p]
+        lib.espeak_Synth.restype = ctypes.c_int
+        lib.espeak_Synth.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_size_t,
+            ctypes.c_uint,
+            ctypes.c_int,
+            ctypes.c_uint,
+            ctypes.c_uint,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+        ]
+        rate = lib.espeak_Initialize(_AUDIO_OUTPUT_SYNCHRONOUS, 0, None, 0)
+        if rate <= 0:
+            raise RuntimeError("espeak_Initialize failed")
+
+        def on_samples(wav, count, _events):
+            if count > 0 and wav:
+                self._samples.append(ctypes.string_at(wav, count * 2))
+            # A non-zero return makes espeak_Synth stop and return early
+            return 1 if self._cancel is not None and self._cancel.cancelled else 0
+
+        # Keep a reference so the C callback isn't garbage collected
+        self._callback = _SYNTH_CALLBACK(on_samples)
+        lib.espeak_SetSynthCallback(self._callback)
+        lib.espeak_SetVoiceByName(self.voice.encode("utf-8"))
+        self.sample_rate = rate
+        self._lib = lib
+
+    def synthesize(self, text: str, cancel: Optional[CancelToken] = None) -> bytes:
+        """Return 16-bit mono WAV bytes for text; stops within one buffer of samples once cancel is cancelled."""
+        data = text.encode("utf-8") + b"\0"
+        with self._lock:
+            if cancel is not None:
+                cancel.check()
+            if self._lib is None:
+                self._load()
+            self._samples = []
+            self._cancel = cancel
+            try:
+                result = self._lib.espeak_Synth(data, len(data), 0, _POS_CHARACTER, 0, _CHARS_UTF8, None, None)
+            finally:
+                self._cancel = None
+            if cancel is not None:
+                cancel.check()
+            if result != _EE_OK:
+                raise RuntimeError(f"espeak_Synth failed ({result})")
+            pcm = b"".join(self._samples)
+            self._samples = []
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(self.sample_rate)
+            wf.writeframes(pcm)
+        return buffer.getvalue()
+
+
+_library: Optional[EspeakLibrary] = None
+_library_lock = threading.Lock()
+
+
+def get_library() -> EspeakLibrary:
+    global _library
+    with _library_lock:
+        if _library is None:
+            _library = EspeakLibrary()
+        return _library
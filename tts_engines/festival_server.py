@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import atexit
+import io
+import shutil
+import socket
+import subprocess
+import threading
+import time
+from contextlib import nullcontext
+from typing import List, Optional
+
+from .cancel import CancelToken
+from .pipeline import join_audio
+
+# Terminator the Festival server appends to every waveform / Lisp reply
+_KEY = b"ft_StUfF_key"
+
+
+def _escape(text: str) -> str:
+    # Newlines are flattened too: the reply loop counts one command per line
+    return " ".join(text.replace("\\", "\\\\").replace('"', '\\"').split())
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class _Reader:
+    """Buffered reader for the Festival client protocol."""
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.buffer = b""
+
+    def _fill(self) -> None:
+        data = self.sock.recv(65536)
+        if not data:
+            raise ConnectionError("Festival server closed the connection")
+        self.buffer += data
+
+    def read_exact(self, size: int) -> bytes:
+        while len(self.buffer) < size:
+            self._fill()
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+    def read_until_key(self) -> bytes:
+        """Read a payload up to the terminating key, undoing the key stuffing."""
+        out = b""
+        while True:
+            idx = self.buffer.find(_KEY)
+            if idx < 0 or idx + len(_KEY) >= len(self.buffer):
+                self._fill()
+                continue
+            out += self.buffer[:idx]
+            rest = self.buffer[idx + len(_KEY):]
+            if rest[:1] == b"X":
+                # The key occurred inside the data and was escaped with a trailing X
+                out += _KEY
+                self.buffer = rest[1:]
+                continue
+            self.buffer = rest
+            return out
+
+
+class FestivalServer:
+    """A lazily started ``festival --server`` process, reused across requests."""
+
+    def __init__(self, startup_timeout: float = 10.0) -> None:
+        self.startup_timeout = startup_timeout
+        self.port: Optional[int] = None
+        self.restarts = 0
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def available() -> bool:
+        return shutil.which("festival") is not None
+
+    def _start(self) -> None:
+        self.stop()
+        self.port = _free_port()
+        self._process = subprocess.Popen(
+            [
+                "festival",
+                f"(set! server_port {self.port})",
+                '(set! server_access_list \'("localhost" "localhost.*" "127.0.0.1"))',
+                "--server",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                break
+            try:
+                self._request("(+ 1 2)\n", timeout=2.0)
+                return
+            except OSError:
+                time.sleep(0.05)
+        self.stop()
+        raise RuntimeError("Festival server did not start")
+
+    def _ensure_running(self) -> None:
+        if self._process is None or self._process.poll() is not None:
+            if self._process is not None:
+                self.restarts += 1
+            self._start()
+
+    def _request(self, commands: str, timeout: float = 20.0, cancel: Optional[CancelToken] = None) -> List[bytes]:
+        """Send Scheme commands and return the waveforms the server sends back."""
+        waves: List[bytes] = []
+        with socket.create_connection(("127.0.0.1", self.port), timeout=timeout) as sock:
+            # On cancel, hanging up wakes the blocked read; the server drops the reply
+            hang_up = cancel.on_cancel(lambda: sock.shutdown(socket.SHUT_RDWR)) if cancel is not None else nullcontext()
+            with hang_up:
+                sock.sendall(commands.encode("utf-8"))
+                reader = _Reader(sock)
+                expected_ok = commands.count("\n")
+                while expected_ok:
+                    tag = reader.read_exact(3)
+                    if tag == b"WV\n":
+                        waves.append(reader.read_until_key())
+                    elif tag == b"LP\n":
+                        reader.read_until_key()
+                    elif tag == b"OK\n":
+                        expected_ok -= 1
+                    elif tag == b"ER\n":
+                        raise RuntimeError("Festival server reported an error")
+                    else:
+                        raise ConnectionError(f"Unexpected Festival reply: {tag!r}")
+        return waves
+
+    def ping(self) -> bool:
+        """Health check: evaluate a trivial expression on the server."""
+        try:
+            with self._lock:
+                if self._process is None or self._process.poll() is not None:
+                    return False
+                self._request("(+ 1 2)\n", timeout=2.0)
+            return True
+        except (OSError, RuntimeError):
+            return False
+
+    def synthesize(self, text: str, cancel: Optional[CancelToken] = None) -> bytes:
+        """Return a RIFF WAV for text, (re)starting the server as needed."""
+        commands = (
+            "(tts_return_to_client)\n"
+            "(Parameter.set 'Wavefiletype 'riff)\n"
+            f'(tts_textall "{_escape(text)}" "fundamental")\n'
+        )
+        for attempt in range(2):
+            with self._lock:
+                self._ensure_running()
+                port = self.port
+            if cancel is not None:
+                cancel.check()
+            try:
+                waves = self._request(commands, cancel=cancel)
+            except (OSError, ConnectionError):
+                if cancel is not None:
+                    # Our own hang-up, not a crash: leave the server running
+                    cancel.check()
+                if attempt:
+                    raise
+                # Crashed or hung: restart once and retry
+                with self._lock:
+                    if self.port == port:
+                        self.restarts += 1
+                        self._start()
+                continue
+            if not waves:
+                raise RuntimeError("Festival server returned no audio")
+            return waves[0] if len(waves) == 1 else join_audio([io.BytesIO(w) for w in waves], "wav")
+        raise RuntimeError("Festival server unavailable")
+
+    def stop(self) -> None:
+        process, self._process = self._process, None
+        if process is not None and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+_server: Optional[FestivalServer] = None
+_server_lock = threading.Lock()
+
+
+def get_server() -> FestivalServer:
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = FestivalServer()
+            atexit.register(_server.stop)
+        return _server
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import base64
+import os
+import random
+import re
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Any, List, Optional
+
+from .cancel import CancelToken, SynthesisCancelled
+
+# Overrides the endpoint gTTS posts to, e.g. to point the engine at a local stub server
+ENDPOINT_ENV = "TEXTREADER_GTTS_ENDPOINT"
+DEFAULT_CONNECTIONS = 4
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRY_AFTER = 10.0
+# Seconds to open a connection; reading the answer may take up to the client's timeout
+CONNECT_TIMEOUT = 5.0
+
+_in_flight = threading.local()
+
+
+def read_audio(tts: Any, response: Any) -> bytes:
+    """Extract the MP3 bytes from a speech response, as gTTS.stream() does."""
+    from gtts.tts import gTTSError
+
+    pattern = re.compile(re.escape(tts.GOOGLE_TTS_RPC) + r'","\[\\"(.*)\\"]')
+    parts: List[bytes] = []
+    for line in response.iter_lines(chunk_size=1024):
+        decoded = line.decode("utf-8")
+        if tts.GOOGLE_TTS_RPC in decoded:
+            match = pattern.search(decoded)
+            if match is None:
+                raise gTTSError(tts=tts, response=response)
+            parts.append(base64.b64decode(match.group(1).encode("ascii")))
+    if not parts:
+        raise gTTSError(tts=tts, response=response)
+    return b"".join(parts)
+
+
+class _Request:
+    """The connections one request has used, so a cancel can hang them up."""
+
+    def __init__(self) -> None:
+        self.hung_up = False
+        self.connections: List[Any] = []
+        self._lock = threading.Lock()
+
+    def attach(self, conn: Any) -> None:
+        with self._lock:
+            self.connections.append(conn)
+            conn.hung_up = self.hung_up
+        if conn.hung_up:
+            _hang_up(conn)
+
+    def hang_up(self) -> None:
+        with self._lock:
+            self.hung_up = True
+            connections = list(self.connections)
+        for conn in connections:
+            conn.hung_up = True
+            _hang_up(conn)
+
+
+def _hang_up(conn: Any) -> None:
+    # The raw socket is set from the start of the connect, so this also aborts a slow connect or TLS handshake
+    sock = getattr(conn, "raw_sock", None) or conn.sock
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+def _pool_classes():
+    """urllib3 pools whose connections can be hung up from another thread while they connect."""
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    class Connectable:
+        raw_sock: Optional[socket.socket] = None
+        hung_up = False
+
+        def _new_conn(self) -> socket.socket:
+            # urllib3's create_connection() only hands the socket back once it is connected
+            error: OSError = OSError(f"getaddrinfo returned nothing for {self.host}")
+            for family, kind, proto, _, address in socket.getaddrinfo(
+                self._dns_host.strip("[]"), self.port, 0, socket.SOCK_STREAM
+            ):
+                sock = socket.socket(family, kind, proto)
+                self.raw_sock = sock
+                try:
+                    if self.hung_up:
+                        raise OSError("request cancelled")
+                    for option in self.socket_options or ():
+                        sock.setsockopt(*option)
+                    if isinstance(self.timeout, (int, float)):
+                        sock.settimeout(self.timeout)
+                    if self.source_address:
+                        sock.bind(self.source_address)
+                    sock.connect(address)
+                    return sock
+                except OSError as e:
+                    sock.close()
+                    error = e
+            raise error
+
+    class Connection(Connectable, HTTPConnection):
+        pass
+
+    class SecureConnection(Connectable, HTTPSConnection):
+        pass
+
+    class Tracked:
+        def _get_conn(self, timeout=None):
+            conn = super()._get_conn(timeout)
+            request = getattr(_in_flight, "request", None)
+            if request is not None:
+                request.attach(conn)
+            return conn
+
+    class Pool(Tracked, HTTPConnectionPool):
+        ConnectionCls = Connection
+
+    class SecurePool(Tracked, HTTPSConnectionPool):
+        ConnectionCls = SecureConnection
+
+    return {"http": Pool, "https": SecurePool}
+
+
+def _adapter(connections: int):
+    """A requests adapter keeping up to ``connections`` keep-alive connections per host, blocking beyond that."""
+    from requests.adapters import HTTPAdapter
+
+    pools = _pool_classes()
+
+    class Adapter(HTTPAdapter):
+        def init_poolmanager(self, *args, **kwargs):
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = pools
+
+        def proxy_manager_for(self, *args, **kwargs):
+            manager = super().proxy_manager_for(*args, **kwargs)
+            manager.pool_classes_by_scheme = pools
+            return manager
+
+    # Retries are ours, with backoff, so urllib3 must not retry on its own
+    return Adapter(pool_connections=1, pool_maxsize=connections, pool_block=True, max_retries=0)
+
+
+class GTTSClient:
+    """Sends the requests gTTS prepares over one session of pooled keep-alive connections.
+
+    gTTS cuts the text into the pieces the endpoint accepts and prepares
+    one request for each; they are sent concurrently, at most
+    ``connections`` at a time across all callers, instead of one after
+    another over a new connection each as ``gTTS.save()`` does. Connection
+    errors, 429 and 5xx responses are retried with exponential backoff, and
+    the pieces' MP3 frames are joined in order. Failures raise
+    ``gTTSError``.
+    """
+
+    def __init__(
+        self,
+        endpoint: Optional[str] = None,
+        connections: int = DEFAULT_CONNECTIONS,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 10.0,
+    ) -> None:
+        import requests
+
+        self.endpoint = endpoint or os.environ.get(ENDPOINT_ENV) or None
+        self.connections = max(1, connections)
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.requests = 0
+        self.retried = 0
+        self._sending = 0
+        self._count_lock = threading.Lock()
+        self._session = requests.Session()
+        adapter = _adapter(self.connections)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=self.connections, thread_name_prefix="gtts fetch")
+
+    def prepare(self, text: str, lang: str = "en", slow: bool = False):
+        """The gTTS object for text and the requests it would send, pointed at our endpoint."""
+        from gtts import gTTS
+
+        tts = gTTS(text, lang=lang, slow=slow)
+        prepared = tts._prepare_requests()
+        if self.endpoint is not None:
+            for request in prepared:
+                request.prepare_url(self.endpoint, None)
+        return tts, prepared
+
+    def _post(self, request: Any, cancel: Optional[CancelToken] = None) -> Optional[Any]:
+        """Send one request; None if it never got an answer."""
+        import requests
+
+        in_flight = _Request()
+        _in_flight.request = in_flight
+        with self._count_lock:
+            self.requests += 1
+            self._sending += 1
+        try:
+            # On cancel, hanging up wakes the blocked connect or read at once; the connection is then dropped
+            with cancel.on_cancel(in_flight.hang_up) if cancel is not None else nullcontext():
+                return self._session.send(request, timeout=(CONNECT_TIMEOUT, self.timeout))
+        except Exception as e:
+            # A hang-up surfaces as whatever error the step it interrupted raises
+            if cancel is not None:
+                cancel.check()
+            if not isinstance(e, requests.RequestException):
+                raise
+            return None
+        finally:
+            _in_flight.request = None
+            with self._count_lock:
+                self._sending -= 1
+
+    def _fetch_piece(self, tts: Any, request: Any, cancel: Optional[CancelToken] = None) -> bytes:
+        from gtts.tts import gTTSError
+
+        attempt = 0
+        while True:
+            if cancel is not None:
+                cancel.check()
+            response = self._post(request, cancel)
+            if response is not None and response.status_code == 200:
+                return read_audio(tts, response)
+            if response is not None and response.status_code not in RETRY_STATUSES:
+                raise gTTSError(tts=tts, response=response)
+            if attempt >= self.retries:
+                raise gTTSError(tts=tts, response=response)
+            with self._count_lock:
+                self.retried += 1
+            delay = self.backoff * 2 ** attempt
+            retry_after = response.headers.get("Retry-After") if response is not None else None
+            if retry_after and retry_after.isdigit():
+                delay = min(float(retry_after), MAX_RETRY_AFTER)
+            # Jittered so pieces that failed together don't retry together
+            delay *= 0.5 + random.random()
+            if cancel is not None:
+                if cancel.wait(delay):
+                    raise SynthesisCancelled("Synthesis cancelled")
+            else:
+                time.sleep(delay)
+            attempt += 1
+
+    def fetch(self, text: str, lang: str = "en", slow: bool = False, cancel: Optional[CancelToken] = None) -> bytes:
+        """Return the MP3 for text.
+
+        On cancel, pieces not yet sent are dropped, requests on the wire
+        (still connecting or waiting for the answer) are abandoned by
+        hanging up their connections, and SynthesisCancelled is raised at
+        once.
+        """
+        if not text.strip():
+            raise ValueError("No text to speak")
+        tts, prepared = self.prepare(text, lang, slow)
+        futures = [self._executor.submit(self._fetch_piece, tts, request, cancel) for request in prepared]
+        try:
+            if cancel is None:
+                return b"".join(future.result() for future in futures)
+            return b"".join(cancel.result(future) for future in futures)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    def busy(self) -> int:
+        """Requests in flight."""
+        with self._count_lock:
+            return self._sending
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        self._session.close()
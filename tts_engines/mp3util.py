@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+# Bitrates in kbit/s by (MPEG-1 or not, layer), indexed by the header's bitrate index
+_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Sample rates by version bits: 0 = MPEG-2.5, 2 = MPEG-2, 3 = MPEG-1
+_SAMPLE_RATES = {0: (11025, 12000, 8000), 2: (22050, 24000, 16000), 3: (44100, 48000, 32000)}
+
+
+@dataclass
+class _Frame:
+    mpeg1: bool
+    layer: int
+    bitrate: int  # bit/s
+    sample_rate: int
+    channels: int
+    length: int  # bytes, header included
+    samples: int
+
+
+def _parse_header(data: bytes, pos: int) -> Optional[_Frame]:
+    if pos + 4 > len(data) or data[pos] != 0xFF or data[pos + 1] & 0xE0 != 0xE0:
+        return None
+    b1, b2, b3 = data[pos + 1], data[pos + 2], data[pos + 3]
+    version = (b1 >> 3) & 3
+    layer = 4 - ((b1 >> 1) & 3)
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 3
+    # Reserved version/layer/sample rate, and free-format or invalid bitrates
+    if version == 1 or layer == 4 or rate_index == 3 or bitrate_index in (0, 15):
+        return None
+    mpeg1 = version == 3
+    bitrate = _BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    padding = (b2 >> 1) & 1
+    if layer == 1:
+        length = (12 * bitrate // sample_rate + padding) * 4
+        samples = 384
+    elif layer == 2 or mpeg1:
+        length = 144 * bitrate // sample_rate + padding
+        samples = 1152
+    else:
+        length = 72 * bitrate // sample_rate + padding
+        samples = 576
+    channels = 1 if b3 >> 6 == 3 else 2
+    return _Frame(mpeg1, layer, bitrate, sample_rate, channels, length, samples)
+
+
+def _id3v2_size(data: bytes, pos: int) -> int:
+    """Return the size of an ID3v2 tag at pos (header and footer included), or 0."""
+    if data[pos:pos + 3] != b"ID3" or pos + 10 > len(data):
+        return 0
+    size = 0
+    for b in data[pos + 6:pos + 10]:
+        size = (size << 7) | (b & 0x7F)
+    footer = 10 if data[pos + 5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _info_offset(frame: _Frame) -> int:
+    """Offset of a Xing/Info tag within a Layer III frame (after the side info)."""
+    if frame.mpeg1:
+        return 36 if frame.channels == 2 else 21
+    return 21 if frame.channels == 2 else 13
+
+
+def _is_info_frame(data: bytes, pos: int, frame: _Frame) -> bool:
+    """True for Xing/Info/VBRI frames, which carry metadata and no audio."""
+    if frame.layer != 3:
+        return False
+    tag = data[pos + _info_offset(frame):pos + _info_offset(frame) + 4]
+    return tag in (b"Xing", b"Info") or data[pos + 36:pos + 40] == b"VBRI"
+
+
+def _valid_at(data: bytes, pos: int) -> Optional[_Frame]:
+    """Parse a frame at pos, requiring the next one to line up, to reject false syncs."""
+    frame = _parse_header(data, pos)
+    if frame is None:
+        return None
+    following = pos + frame.length
+    if following + 4 <= len(data) and data[following:following + 3] != b"TAG" and _id3v2_size(data, following) == 0:
+        if _parse_header(data, following) is None:
+            return None
+    return frame
+
+
+@dataclass
+class Mp3Info:
+    duration_us: int
+    sample_rate: int
+    bitrate: int  # average bit/s over the audio frames
+    channels: int
+    frames: int
+    vbr: bool
+
+    @property
+    def duration(self) -> float:
+        return self.duration_us / 1_000_000
+
+
+def _from_header(data: bytes, pos: int, frame: _Frame, audio_end: int) -> Optional[Mp3Info]:
+    """Read the frame count from a Xing or VBRI header if it covers the whole stream.
+
+    Chunks joined by concatenation each keep their own header, so a header
+    whose byte count doesn't match the data is ignored and the frames are
+    walked instead.
+    """
+    if frame.layer != 3:
+        return None
+    offset = pos + _info_offset(frame)
+    frames = stream_bytes = None
+    vbr = True
+    if data[offset:offset + 4] in (b"Xing", b"Info") and offset + 8 <= len(data):
+        vbr = data[offset:offset + 4] == b"Xing"
+        flags = struct.unpack_from(">I", data, offset + 4)[0]
+        cursor = offset + 8
+        if flags & 1 and cursor + 4 <= len(data):
+            frames = struct.unpack_from(">I", data, cursor)[0]
+            cursor += 4
+        if flags & 2 and cursor + 4 <= len(data):
+            stream_bytes = struct.unpack_from(">I", data, cursor)[0]
+    elif data[pos + 36:pos + 40] == b"VBRI" and pos + 54 <= len(data):
+        stream_bytes, frames = struct.unpack_from(">II", data, pos + 46)
+    if not frames or not stream_bytes:
+        return None
+    # Writers disagree on whether the tag frame itself is counted; allow one frame either way
+    if abs((audio_end - pos) - stream_bytes) > frame.length:
+        return None
+    samples = frames * frame.samples
+    duration_us = samples * 1_000_000 // frame.sample_rate
+    bitrate = (audio_end - pos - frame.length) * 8 * frame.sample_rate // samples if samples else 0
+    return Mp3Info(duration_us, frame.sample_rate, bitrate, frame.channels, frames, vbr)
+
+
+def parse_mp3(data: bytes) -> Optional[Mp3Info]:
+    """Return duration, sample rate and bitrate of an in-memory MP3, or None if it isn't one.
+
+    Uses the Xing/Info or VBRI header when it describes the whole stream,
+    otherwise walks every frame header (handles CBR, header-less VBR and
+    concatenated clips with ID3 tags between them).
+    """
+    pos = _id3v2_size(data, 0)
+    audio_end = len(data) - 128 if len(data) >= 128 and data[-128:-125] == b"TAG" else len(data)
+    first = None
+    while pos + 4 <= audio_end:
+        first = _valid_at(data, pos)
+        if first is not None:
+            break
+        pos = data.find(b"\xff", pos + 1)
+        if pos < 0:
+            return None
+    if first is None:
+        return None
+    info = _from_header(data, pos, first, audio_end)
+    if info is not None:
+        return info
+
+    samples_by_rate: Dict[int, int] = {}
+    frames = audio_bytes = 0
+    bitrates = set()
+    synced = True
+    while pos + 4 <= audio_end:
+        frame = _parse_header(data, pos) if synced else _valid_at(data, pos)
+        if frame is None:
+            tag_size = _id3v2_size(data, pos)
+            if tag_size:
+                pos += tag_size
+                continue
+            # Lost sync (junk between clips): scan for the next verified header
+            synced = False
+            pos = data.find(b"\xff", pos + 1)
+            if pos < 0:
+                break
+            continue
+        synced = True
+        if pos + frame.length > audio_end:
+            break  # truncated last frame; decoders drop it
+        if not _is_info_frame(data, pos, frame):
+            samples_by_rate[frame.sample_rate] = samples_by_rate.get(frame.sample_rate, 0) + frame.samples
+            frames += 1
+            audio_bytes += frame.length
+            bitrates.add(frame.bitrate)
+        pos += frame.length
+    if not frames:
+        return None
+    duration_us = sum(samples * 1_000_000 // rate for rate, samples in samples_by_rate.items())
+    bitrate = audio_bytes * 8 * 1_000_000 // duration_us if duration_us else 0
+    return Mp3Info(duration_us, first.sample_rate, bitrate, first.channels, frames, len(bitrates) > 1)
+
+
+def mp3_duration(data: bytes) -> float:
+    """Return the duration of an in-memory MP3 in seconds, or 0 on failure."""
+    try:
+        info = parse_mp3(data)
+    except Exception:
+        return 0.0
+    return info.duration if info else 0.0
@@ -0,0 +1,368 @@
+from __future__ import annotations
+
+import io
+import os
+import re
+import shutil
+import tempfile
+import time
+import wave
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain, islice
+from typing import BinaryIO, Iterator, List, Optional, Union
+
+from .base import TTSEngine
+from .cancel import CancelToken, SynthesisCancelled
+
+# Only the whitespace is matched, so closing quotes and brackets stay with their sentence
+_SENTENCE_RE = re.compile(
+    r"(?:(?<=[.!?])|(?<=[.!?][\"')\]])|(?<=[.!?][\"')\]]{2}))\s+|\n\s*\n+|\n(?=\s*[-*•])"
+)
+_CLAUSE_RE = re.compile(r"(?<=[,;:])\s+")
+
+
+def _split_long(piece: str, max_chars: int) -> List[str]:
+    """Split an over-long sentence at clause boundaries, then at whitespace."""
+    if len(piece) <= max_chars:
+        return [piece]
+    parts: List[str] = []
+    current = ""
+    for clause in _CLAUSE_RE.split(piece):
+        candidate = f"{current} {clause}".strip() if current else clause
+        if len(candidate) <= max_chars:
+            current = candidate
+            continue
+        if current:
+            parts.append(current)
+        while len(clause) > max_chars:
+            cut = clause.rfind(" ", 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            parts.append(clause[:cut].strip())
+            clause = clause[cut:].strip()
+        current = clause
+    if current:
+        parts.append(current)
+    return parts
+
+
+def iter_sentences(text: str) -> Iterator[str]:
+    """Like _SENTENCE_RE.split(text), without building the whole list."""
+    start = 0
+    for match in _SENTENCE_RE.finditer(text):
+        yield text[start:match.start()]
+        start = match.end()
+    yield text[start:]
+
+
+def iter_chunks(text: str, max_chars: int = 300, min_chars: int = 40, first_max_chars: int = 120) -> Iterator[str]:
+    """Yield sentence/clause chunks suitable for incremental synthesis, lazily.
+
+    Short sentences are merged up to ``min_chars`` so engines aren't called for
+    single words, and the first chunk is kept small so playback starts early.
+    """
+    emitted = False
+    current = ""
+    for sentence in iter_sentences(text):
+        sentence = " ".join(sentence.split())
+        if not sentence:
+            continue
+        for piece in _split_long(sentence, max_chars if emitted or current else first_max_chars):
+            limit = max_chars if emitted else first_max_chars
+            if current and len(current) + 1 + len(piece) <= limit and len(current) < min_chars:
+                current = f"{current} {piece}"
+                continue
+            if current:
+                yield current
+                emitted = True
+            current = piece
+    if current:
+        yield current
+
+
+def split_text(text: str, max_chars: int = 300, min_chars: int = 40, first_max_chars: int = 120) -> List[str]:
+    """Split text into sentence/clause chunks (see iter_chunks)."""
+    return list(iter_chunks(text, max_chars, min_chars, first_max_chars))
+
+
+AudioSource = Union[str, BinaryIO]
+
+
+class AudioWriter:
+    """Append chunk files or buffers to one playable WAV/MP3 output as they arrive.
+
+    Only the chunk being appended is held in memory. WAV chunks must share
+    their parameters; MP3 frames are concatenated as-is.
+    """
+
+    def __init__(self, output: Union[str, BinaryIO], ext: str) -> None:
+        self.ext = ext
+        self.chunks = 0
+        self._owns_file = isinstance(output, str)
+        self._file = open(output, "wb") if isinstance(output, str) else output
+        self._wav: Optional[wave.Wave_write] = None
+        self._params = None
+
+    def append(self, source: AudioSource) -> None:
+        if self.ext != "wav":
+            if isinstance(source, str):
+                with open(source, "rb") as f:
+                    shutil.copyfileobj(f, self._file)
+            else:
+                shutil.copyfileobj(source, self._file)
+        else:
+            with wave.open(source, "rb") as wf:
+                params = (wf.getnchannels(), wf.getsampwidth(), wf.getframerate())
+                if self._wav is None:
+                    self._wav = wave.open(self._file, "wb")
+                    self._wav.setnchannels(params[0])
+                    self._wav.setsampwidth(params[1])
+                    self._wav.setframerate(params[2])
+                    self._params = params
+                elif params != self._params:
+                    raise ValueError(f"WAV parameters differ in {source}")
+                self._wav.writeframes(wf.readframes(wf.getnframes()))
+        self.chunks += 1
+
+    def close(self) -> None:
+        # Patches the WAV header sizes; the file object itself stays open unless we opened it
+        if self._wav is not None:
+            self._wav.close()
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self) -> "AudioWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def concat_wav_files(paths: List[AudioSource], output_path: Union[str, BinaryIO]) -> None:
+    """Concatenate WAV files with identical parameters into one WAV file."""
+    with AudioWriter(output_path, "wav") as writer:
+        for path in paths:
+            writer.append(path)
+
+
+def concat_audio_files(paths: List[AudioSource], output_path: str, ext: str) -> None:
+    """Join chunk files into one playable file (MP3 frames are concatenated as-is)."""
+    with AudioWriter(output_path, ext) as writer:
+        for path in paths:
+            writer.append(path)
+
+
+def join_audio(sources: List[AudioSource], ext: str) -> bytes:
+    """Join chunk files or buffers into one encoded clip held in memory."""
+    buffer = io.BytesIO()
+    with AudioWriter(buffer, ext) as writer:
+        for source in sources:
+            writer.append(source)
+    return buffer.getvalue()
+
+
+@dataclass
+class ChunkResult:
+    index: int
+    text: str
+    path: str
+    synth_seconds: float
+    # Encoded audio when the engine handed it over in memory; path is then unused
+    data: Optional[bytes] = None
+
+    def source(self) -> AudioSource:
+        """Return something pygame/wave can load: a fresh buffer or the chunk file."""
+        if self.data is not None:
+            return io.BytesIO(self.data)
+        return self.path
+
+    def spill(self) -> None:
+        """Move in-memory audio to the chunk file, so only the path is kept."""
+        if self.data is not None:
+            with open(self.path, "wb") as f:
+                f.write(self.data)
+            self.data = None
+
+    def discard(self) -> None:
+        """Delete the chunk file once it has been played."""
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+@dataclass
+class PipelineStats:
+    started: float = field(default_factory=time.monotonic)
+    first_chunk_ready: Optional[float] = None
+    first_audio: Optional[float] = None
+    finished: Optional[float] = None
+    chunks: int = 0
+
+    @property
+    def time_to_first_chunk(self) -> Optional[float]:
+        if self.first_chunk_ready is None:
+            return None
+        return self.first_chunk_ready - self.started
+
+    @property
+    def time_to_first_audio(self) -> Optional[float]:
+        if self.first_audio is None:
+            return None
+        return self.first_audio - self.started
+
+    @property
+    def total_synthesis_time(self) -> Optional[float]:
+        if self.finished is None:
+            return None
+        return self.finished - self.started
+
+
+def default_workers(engine: Optional[TTSEngine] = None) -> int:
+    """Chunks to synthesize at once: the engine's max_parallel, else the CPU count."""
+    if engine is not None and engine.max_parallel > 0:
+        return engine.max_parallel
+    return os.cpu_count() or 1
+
+
+def _synthesize_one(
+    engine: TTSEngine, index: int, chunk: str, work_dir: str, cancel: Optional[CancelToken] = None
+) -> ChunkResult:
+    path = os.path.join(work_dir, f"chunk_{index:05d}.{engine.output_ext}")
+    if cancel is not None:
+        cancel.check()
+    start = time.monotonic()
+    data = engine.synthesize_to_buffer(chunk, cancel)
+    if data:
+        return ChunkResult(index, chunk, path, time.monotonic() - start, data)
+    engine.synthesize(chunk, path, cancel)
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        raise RuntimeError(f"{engine.name} produced no audio for chunk {index}")
+    return ChunkResult(index, chunk, path, time.monotonic() - start)
+
+
+def synthesize_chunks(
+    engine: TTSEngine,
+    text: str,
+    work_dir: str,
+    stats: Optional[PipelineStats] = None,
+    cancel: Optional[CancelToken] = None,
+    max_chars: int = 300,
+    workers: Optional[int] = None,
+    spill: bool = False,
+) -> Iterator[ChunkResult]:
+    """Synthesize text chunk by chunk, yielding each chunk file as soon as it exists.
+
+    Works through ``engine.synthesize`` so every engine benefits; callers can
+    start playing chunk N while the generator produces chunk N+1. Engines with
+    ``parallel_safe`` set have up to ``workers`` chunks (default: see default_workers) in
+    flight at once; chunks are still yielded in order. The text is split
+    lazily and nothing is synthesized ahead of the consumer beyond those
+    workers; with ``spill``, chunks are written to ``work_dir`` instead of
+    being yielded in memory. Once ``cancel`` is cancelled, chunks in flight
+    are interrupted by their engine, no further ones are started and the
+    generator simply ends.
+    """
+    if stats is None:
+        stats = PipelineStats()
+    os.makedirs(work_dir, exist_ok=True)
+    chunks = iter_chunks(text, max_chars=max_chars)
+    head = list(islice(chunks, 2))
+    chunks = enumerate(chain(head, chunks))
+    if workers is None:
+        workers = default_workers(engine)
+
+    def finish(result: ChunkResult) -> ChunkResult:
+        if spill:
+            result.spill()
+        stats.chunks += 1
+        if stats.first_chunk_ready is None:
+            stats.first_chunk_ready = time.monotonic()
+        return result
+
+    def cancelled() -> bool:
+        return cancel is not None and cancel.cancelled
+
+    if not engine.parallel_safe or workers <= 1 or len(head) <= 1:
+        for index, chunk in chunks:
+            if cancelled():
+                break
+            try:
+                result = _synthesize_one(engine, index, chunk, work_dir, cancel)
+            except SynthesisCancelled:
+                break
+            yield finish(result)
+        stats.finished = time.monotonic()
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending: "deque[Future[ChunkResult]]" = deque()
+        exhausted = False
+        try:
+            while not exhausted or pending:
+                # Keep the pool busy but bounded so cancellation doesn't leave a long tail
+                while not exhausted and len(pending) < workers:
+                    if cancelled():
+                        break
+                    item = next(chunks, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    pending.append(pool.submit(_synthesize_one, engine, item[0], item[1], work_dir, cancel))
+                if not pending:
+                    break
+                try:
+                    result = pending.popleft().result()
+                except SynthesisCancelled:
+                    break
+                yield finish(result)
+                if cancelled():
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
+    stats.finished = time.monotonic()
+
+
+def synthesize_parallel(
+    engine: TTSEngine,
+    text: str,
+    output_path: str,
+    workers: Optional[int] = None,
+    max_chars: int = 300,
+    cancel: Optional[CancelToken] = None,
+) -> PipelineStats:
+    """Synthesize text into a single file, fanning chunks out over a worker pool.
+
+    Each worker drives its own engine process, so only engines that declare
+    ``parallel_safe`` are run concurrently; the others fall back to one chunk
+    at a time. If ``cancel`` is cancelled, the work in flight is stopped, no
+    partial file is left at output_path and SynthesisCancelled is raised.
+    """
+    stats = PipelineStats()
+    tmp_path = f"{output_path}.part"
+    with tempfile.TemporaryDirectory(prefix="textreader-") as work_dir:
+        # Each chunk is appended as it arrives and its file deleted, so long texts don't pile up
+        try:
+            with AudioWriter(tmp_path, engine.output_ext) as writer:
+                for chunk in synthesize_chunks(
+                    engine, text, work_dir, stats=stats, max_chars=max_chars, workers=workers, cancel=cancel
+                ):
+                    writer.append(chunk.source())
+                    chunk.discard()
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        if cancel is not None and cancel.cancelled:
+            os.remove(tmp_path)
+            raise SynthesisCancelled("Synthesis cancelled")
+        if not writer.chunks:
+            os.remove(tmp_path)
+            raise RuntimeError("No text to synthesize")
+        os.replace(tmp_path, output_path)
+    return stats
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import atexit
+import queue
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+# How often the driver loop is pumped while utterances are in flight
+ITERATE_INTERVAL = 0.01
+
+
+@dataclass
+class _Job:
+    text: str
+    output_path: str
+    future: "Future[str]" = field(default_factory=Future)
+
+
+class Pyttsx3Driver:
+    """One long-lived thread that owns the pyttsx3 engine and its event loop.
+
+    Callers submit jobs and get futures back. The loop is started once and
+    kept running between jobs, so there is no runAndWait() start-up per
+    request, and jobs queued together are handed to the engine back to back.
+    Each job is resolved by the finished-utterance notification carrying its
+    name, once its file has been written.
+    """
+
+    def __init__(self) -> None:
+        self.jobs_done = 0
+        self._jobs: "queue.Queue[Optional[_Job]]" = queue.Queue()
+        self._pending: Dict[str, _Job] = {}
+        self._next_id = 0
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stopped = False
+
+    def submit(self, text: str, output_path: str) -> "Future[str]":
+        """Queue text to be saved to output_path; the future resolves to the path."""
+        job = _Job(text, output_path)
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("pyttsx3 driver stopped")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="pyttsx3 driver", daemon=True)
+                self._thread.start()
+            self._jobs.put(job)
+        return job.future
+
+    def _start_job(self, engine, job: _Job) -> None:
+        if not job.future.set_running_or_notify_cancel():
+            return
+        self._next_id += 1
+        name = f"job{self._next_id}"
+        self._pending[name] = job
+        engine.save_to_file(job.text, job.output_path, name)
+
+    def _finish(self, name: str, error: Optional[Exception] = None) -> None:
+        job = self._pending.pop(name, None)
+        if job is None or job.future.done():
+            return
+        self.jobs_done += 1
+        if error is None:
+            job.future.set_result(job.output_path)
+        else:
+            job.future.set_exception(error)
+
+    def _on_finished(self, name: str, completed: bool) -> None:
+        self._finish(name, None if completed else RuntimeError("pyttsx3 utterance was interrupted"))
+
+    def _fail_all(self, error: Exception) -> None:
+        for name in list(self._pending):
+            self._finish(name, error)
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                return
+            if job is not None and job.future.set_running_or_notify_cancel():
+                job.future.set_exception(error)
+
+    def _run(self) -> None:
+        try:
+            import pyttsx3
+
+            engine = pyttsx3.init()
+            engine.connect("finished-utterance", self._on_finished)
+            engine.startLoop(False)
+        except Exception as e:
+            with self._lock:
+                self._fail_all(e)
+                self._thread = None
+            return
+        stopping = False
+        try:
+            while not stopping:
+                # Idle: block until work arrives; busy: keep pumping the loop and pick up new jobs.
+                # Everything already waiting is taken at once so it is synthesized back to back.
+                batch = []
+                try:
+                    batch.append(self._jobs.get(timeout=ITERATE_INTERVAL if self._pending else None))
+                    while True:
+                        batch.append(self._jobs.get_nowait())
+                except queue.Empty:
+                    pass
+                for job in batch:
+                    if job is None:
+                        stopping = True
+                        break
+                    self._start_job(engine, job)
+                engine.iterate()
+        except Exception as e:
+            with self._lock:
+                self._fail_all(e)
+        finally:
+            try:
+                engine.endLoop()
+            except Exception:
+                pass
+            with self._lock:
+                self._fail_all(RuntimeError("pyttsx3 driver stopped"))
+                self._thread = None
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stopped = True
+            thread = self._thread
+        if thread is not None:
+            self._jobs.put(None)
+            thread.join(timeout=2)
+
+
+_driver: Optional[Pyttsx3Driver] = None
+_driver_lock = threading.Lock()
+
+
+def get_driver() -> Pyttsx3Driver:
+    global _driver
+    with _driver_lock:
+        if _driver is None:
+            _driver = Pyttsx3Driver()
+            atexit.register(_driver.stop)
+        return _driver
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import io
+import wave
+from typing import Tuple
+
+import numpy as np
+
+# WSOLA parameters, in seconds; tuned for speech
+FRAME_SECONDS = 0.030
+TOLERANCE_SECONDS = 0.008
+# Similarity search runs on a decimated signal to keep the per-frame cost low
+SEARCH_DECIMATION = 4
+
+
+def pcm_from_wav(data: bytes) -> Tuple[np.ndarray, int]:
+    """Decode 16-bit PCM WAV bytes into a float32 (frames, channels) array and sample rate."""
+    with wave.open(io.BytesIO(data), "rb") as wf:
+        channels = wf.getnchannels()
+        width = wf.getsampwidth()
+        rate = wf.getframerate()
+        raw = wf.readframes(wf.getnframes())
+    if width == 1:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif width == 2:
+        samples = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+    elif width == 4:
+        samples = np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2147483648.0
+    else:
+        raise ValueError(f"Unsupported sample width: {width}")
+    return samples.reshape(-1, channels), rate
+
+
+def wav_from_pcm(samples: np.ndarray, rate: int) -> bytes:
+    """Encode a float (frames, channels) array as 16-bit PCM WAV bytes."""
+    if samples.ndim == 1:
+        samples = samples[:, None]
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767.0).astype("<i2")
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wf:
+        wf.setnchannels(pcm.shape[1])
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+
+def time_stretch(samples: np.ndarray, rate: int, speed: float) -> np.ndarray:
+    """Change playback speed without changing pitch (WSOLA).
+
+    ``samples`` is a float array shaped (frames,) or (frames, channels); the
+    result has roughly ``frames / speed`` frames and the same layout.
+    """
+    if abs(speed - 1.0) < 1e-3 or len(samples) == 0:
+        return samples
+    mono_input = samples.ndim == 1
+    x = samples[:, None] if mono_input else samples
+    x = x.astype(np.float32, copy=False)
+
+    frame = max(64, int(rate * FRAME_SECONDS) // 2 * 2)
+    hop = frame // 2
+    tolerance = max(1, int(rate * TOLERANCE_SECONDS))
+    window = np.hanning(frame).astype(np.float32)
+
+    n_out = int(len(x) / speed)
+    n_frames = max(1, (n_out - frame) // hop + 2)
+    # Pad so every analysis frame plus search window stays in bounds
+    pad = frame + 2 * tolerance
+    x = np.concatenate([np.zeros((tolerance, x.shape[1]), np.float32), x, np.zeros((pad + hop, x.shape[1]), np.float32)])
+    guide = x.mean(axis=1)[::SEARCH_DECIMATION]
+    d_frame = frame // SEARCH_DECIMATION
+    d_tol = tolerance // SEARCH_DECIMATION
+
+    out = np.zeros((n_frames * hop + frame, x.shape[1]), np.float32)
+    norm = np.zeros(n_frames * hop + frame, np.float32)
+    delta = 0
+    for k in range(n_frames):
+        ideal = int(k * hop * speed) + tolerance
+        pos = ideal + delta
+        if pos + frame > len(x):
+            break
+        out[k * hop:k * hop + frame] += x[pos:pos + frame] * window[:, None]
+        norm[k * hop:k * hop + frame] += window
+        # Pick the next frame start near its ideal position that best continues
+        # the frame just written (its natural continuation starts at pos + hop)
+        next_ideal = int((k + 1) * hop * speed) + tolerance
+        start = next_ideal - tolerance
+        if start < 0 or start + frame + 2 * tolerance > len(x):
+            delta = 0
+            continue
+        d_nat = (pos + hop) // SEARCH_DECIMATION
+        template = guide[d_nat:d_nat + d_frame]
+        d_start = start // SEARCH_DECIMATION
+        region = guide[d_start:d_start + d_frame + 2 * d_tol]
+        if len(template) < d_frame or len(region) < d_frame + 2 * d_tol or d_tol == 0:
+            delta = 0
+            continue
+        scores = np.correlate(region, template, mode="valid")
+        delta = int(np.argmax(scores)) * SEARCH_DECIMATION - tolerance
+
+    out = out[:n_out]
+    norm = norm[:n_out]
+    out /= np.maximum(norm, 1e-3)[:, None]
+    return out[:, 0] if mono_input else out
+
+
+def stretch_wav(data: bytes, speed: float) -> bytes:
+    """Time-stretch in-memory WAV bytes, returning new WAV bytes."""
+    samples, rate = pcm_from_wav(data)
+    return wav_from_pcm(time_stretch(samples, rate, speed), rate)
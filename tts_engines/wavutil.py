@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import io
+import struct
+import wave
+
+
+def fix_wav_header(data: bytes) -> bytes:
+    """Patch RIFF/data chunk sizes of a WAV written to a pipe.
+
+    Streamed WAVs (e.g. ``espeak-ng --stdout``) carry placeholder sizes because
+    the writer can't seek back; decoders then report a bogus duration.
+    """
+    if len(data) < 12 or data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return data
+    out = bytearray(data)
+    struct.pack_into("<I", out, 4, len(out) - 8)
+    pos = 12
+    while pos + 8 <= len(out):
+        chunk_id = bytes(out[pos:pos + 4])
+        size = struct.unpack_from("<I", out, pos + 4)[0]
+        if chunk_id == b"data":
+            struct.pack_into("<I", out, pos + 4, len(out) - pos - 8)
+            break
+        pos += 8 + size + (size & 1)
+    return bytes(out)
+
+
+def wav_duration(data: bytes) -> float:
+    """Return the duration of an in-memory WAV in seconds, or 0 on failure."""
+    try:
+        with wave.open(io.BytesIO(data), "rb") as wf:
+            rate = wf.getframerate()
+            return wf.getnframes() / float(rate) if rate else 0.0
+    except Exception:
+        return 0.0